@@ -26,14 +26,22 @@ echo "==============================="
 # ============================================================================
 YOLO_MODEL="${YOLO_MODEL:-yolo11n}"
 YOLO_IMAGE_SIZE="${YOLO_IMAGE_SIZE:-640}"
+YOLO_PRECISION="${YOLO_PRECISION:-fp32}"
 MODEL_DIR="/app/models"
 MODEL_PT="${MODEL_DIR}/${YOLO_MODEL}.pt"
-MODEL_ONNX="${MODEL_DIR}/${YOLO_MODEL}_${YOLO_IMAGE_SIZE}.onnx"
+# fp32 keeps the historical filename; other precisions get a suffix
+if [ "$YOLO_PRECISION" = "fp32" ]; then
+    MODEL_ONNX_NAME="${YOLO_MODEL}_${YOLO_IMAGE_SIZE}.onnx"
+else
+    MODEL_ONNX_NAME="${YOLO_MODEL}_${YOLO_IMAGE_SIZE}_${YOLO_PRECISION}.onnx"
+fi
+MODEL_ONNX="${MODEL_DIR}/${MODEL_ONNX_NAME}"
 
 echo ""
 echo "🤖 Initializing YOLO Model..."
 echo "   Model: ${YOLO_MODEL}"
 echo "   Image Size: ${YOLO_IMAGE_SIZE}x${YOLO_IMAGE_SIZE}"
+echo "   Precision: ${YOLO_PRECISION}"
 
 # Validate YOLO_MODEL
 VALID_MODELS="yolo11n yolo11s yolo11m yolo11l yolo11x yolov9t yolov9s yolov9m yolov9l yolov8n yolov8s yolov8m yolov8l yolov8x yolov7 yolov7x yolov6n yolov6s yolov6m yolov6l"
@@ -51,6 +59,14 @@ if ! echo "$VALID_SIZES" | grep -qw "$YOLO_IMAGE_SIZE"; then
     exit 1
 fi
 
+# Validate YOLO_PRECISION (INT8 needs calibration data and is not supported)
+VALID_PRECISIONS="fp32 fp16"
+if ! echo "$VALID_PRECISIONS" | grep -qw "$YOLO_PRECISION"; then
+    echo "   ❌ ERROR: Invalid YOLO_PRECISION='${YOLO_PRECISION}'"
+    echo "   Valid options: ${VALID_PRECISIONS}"
+    exit 1
+fi
+
 # Create model and config directories with proper permissions
 mkdir -p "${MODEL_DIR}"
 chown appuser:appuser "${MODEL_DIR}"
@@ -96,7 +112,8 @@ try:
 
     # Export to ONNX
     print('   ⏳ Exporting to ONNX format...')
-    model.export(format='onnx', imgsz=${YOLO_IMAGE_SIZE}, simplify=True, dynamic=False)
+    # half=True needs a CUDA device at export time (Ultralytics falls back to fp32)
+    model.export(format='onnx', imgsz=${YOLO_IMAGE_SIZE}, simplify=True, dynamic=False, half='${YOLO_PRECISION}' == 'fp16')
 
     # Copy ONNX file to model directory (handles cross-device links)
     source_onnx = Path('${YOLO_MODEL}.onnx')
@@ -123,7 +140,7 @@ except Exception as e:
     fi
 fi
 
-echo "   ✅ YOLO model ready: ${YOLO_MODEL}_${YOLO_IMAGE_SIZE}.onnx"
+echo "   ✅ YOLO model ready: ${MODEL_ONNX_NAME}"
 echo ""
 
 # ============================================================================
@@ -12,9 +12,11 @@ Feature: 005-yolo-object-detection
 """
 
 from fastapi import APIRouter, HTTPException, status
-from app.models.detection import YOLOConfig, CachedModel, StreamDetectionConfig
+from app.models.detection import YOLOConfig, CachedModel, StreamDetectionConfig, COCO_CLASSES
+from app.services import container
 from app.services.yolo import list_cached_models, delete_cached_model
-from app.config_io import load_streams, save_streams
+from app.config_io import load_streams, save_streams, config_update_lock
+import asyncio
 import os
 import logging
 from pathlib import Path
@@ -26,6 +28,7 @@ router = APIRouter(prefix="/api", tags=["detection"])
 # Global YOLO config and ONNX session (loaded at startup)
 _yolo_config: YOLOConfig | None = None
 _onnx_session = None
+_inference_binding = None
 
 
 def set_yolo_config(config: YOLOConfig):
@@ -45,6 +48,17 @@ def get_onnx_session():
     return _onnx_session
 
 
+def set_inference_binding(binding):
+    """Set global IOBinding for the ONNX session (called from startup)."""
+    global _inference_binding
+    _inference_binding = binding
+
+
+def get_inference_binding():
+    """Get global IOBinding for the ONNX session (None if unavailable)."""
+    return _inference_binding
+
+
 def get_yolo_config_singleton() -> YOLOConfig | None:
     """Get global YOLO configuration singleton."""
     return _yolo_config
@@ -136,7 +150,7 @@ async def get_stream_detection_config(stream_id: str):
     Returns the current detection settings (enabled, labels, confidence threshold).
     """
     try:
-        config = load_streams()
+        config = await asyncio.to_thread(load_streams)
         streams = config.get("streams", [])
 
         for stream in streams:
@@ -163,8 +177,6 @@ async def update_stream_detection_config(stream_id: str, detection_config: Strea
     Changes apply immediately to live streams without restart.
     Validates enabled_labels against COCO_CLASSES.
     """
-    from app.models.detection import COCO_CLASSES
-    from app.services import container
 
     try:
         # Validate enabled_labels against COCO_CLASSES
@@ -179,25 +191,28 @@ async def update_stream_detection_config(stream_id: str, detection_config: Strea
                 }
             )
 
-        config = load_streams()
-        streams = config.get("streams", [])
-
-        stream_found = False
-        for stream in streams:
-            if stream.get("id") == stream_id:
-                stream["detection"] = detection_config.model_dump()
-                stream_found = True
-                break
-
-        if not stream_found:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Stream not found: {stream_id}"
-            )
-
-        # Save to config.yml
-        config["streams"] = streams
-        save_streams(config)
+        # Config I/O runs in worker threads; hold the shared config lock so
+        # the load-mutate-save can't interleave with stream or zone writes
+        async with config_update_lock:
+            config = await asyncio.to_thread(load_streams)
+            streams = config.get("streams", [])
+
+            stream_found = False
+            for stream in streams:
+                if stream.get("id") == stream_id:
+                    stream["detection"] = detection_config.model_dump()
+                    stream_found = True
+                    break
+
+            if not stream_found:
+                raise HTTPException(
+                    status_code=status.HTTP_404_NOT_FOUND,
+                    detail=f"Stream not found: {stream_id}"
+                )
+
+            # Save to config.yml
+            config["streams"] = streams
+            await asyncio.to_thread(save_streams, config)
 
         # Apply changes immediately to running stream (if active)
         applied_immediately = False
@@ -39,11 +39,13 @@ Usage:
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Optional
+from http import HTTPStatus
+from typing import Any, Final, Optional
+import functools
 import logging
 
 from fastapi import HTTPException, Request, status
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.exceptions import RequestValidationError
 from pydantic import BaseModel, Field
 
@@ -372,6 +374,41 @@ def raise_service_unavailable(
     )
 
 
+# ============================================================================
+# Pre-rendered Error Bodies
+# ============================================================================
+
+# Distinct fixed error messages whose JSON body is kept rendered: the
+# generic 500 and framework default status phrases ("Not Found", "Method
+# Not Allowed") raised on every miss. Request-specific details (stream IDs,
+# exception text) are never cached; they are rendered per response.
+ERROR_BODY_CACHE_SIZE: Final[int] = 64
+
+
+@functools.lru_cache(maxsize=ERROR_BODY_CACHE_SIZE)
+def _render_error_body(code: str, message: str) -> bytes:
+    """Render a fixed error response body once per (code, message)."""
+    error = create_error_response(code=code, message=message)
+    return JSONResponse(content=error.model_dump()).body
+
+
+def _is_default_detail(exc: HTTPException) -> bool:
+    """Whether exc carries Starlette's default detail (its status phrase)."""
+    try:
+        return exc.detail == HTTPStatus(exc.status_code).phrase
+    except ValueError:
+        return False  # Non-standard status code
+
+
+def _error_response(status_code: int, code: str, message: str) -> Response:
+    """Build a JSON error response for a fixed message from its pre-rendered body."""
+    return Response(
+        content=_render_error_body(code, message),
+        status_code=status_code,
+        media_type="application/json"
+    )
+
+
 # ============================================================================
 # Global Exception Handlers
 # ============================================================================
@@ -421,7 +458,7 @@ async def validation_exception_handler(
 async def http_exception_handler(
     request: Request,
     exc: HTTPException
-) -> JSONResponse:
+) -> Response:
     """Handle HTTPException with standardized format.
     
     Catches explicitly raised HTTPException instances and formats them.
@@ -432,7 +469,7 @@ async def http_exception_handler(
         exc: HTTP exception
         
     Returns:
-        JSONResponse with standardized error format
+        JSON response with standardized error format
         
     Logs:
         INFO: Client errors (4xx) - expected behavior
@@ -460,9 +497,17 @@ async def http_exception_handler(
     
     # Otherwise, wrap in standard format
     logger.debug("Wrapping HTTPException in standard format")
+    if not exc.detail or _is_default_detail(exc):
+        # Fixed message: reuse the pre-rendered body
+        return _error_response(
+            exc.status_code,
+            ErrorCode.INTERNAL_ERROR.value,
+            str(exc.detail) if exc.detail else "An error occurred"
+        )
+    
     error = create_error_response(
         code=ErrorCode.INTERNAL_ERROR,
-        message=str(exc.detail) if exc.detail else "An error occurred"
+        message=str(exc.detail)
     )
     
     return JSONResponse(
@@ -474,7 +519,7 @@ async def http_exception_handler(
 async def general_exception_handler(
     request: Request,
     exc: Exception
-) -> JSONResponse:
+) -> Response:
     """Handle unexpected exceptions with standardized format.
     
     Catches all unhandled exceptions and formats them consistently.
@@ -486,7 +531,7 @@ async def general_exception_handler(
         exc: Unhandled exception
         
     Returns:
-        JSONResponse with standardized error format (500 status)
+        JSON response with standardized error format (500 status)
         
     Logs:
         ERROR: Full exception with stack trace
@@ -497,14 +542,10 @@ async def general_exception_handler(
         exc_info=exc
     )
     
-    error = create_error_response(
-        code=ErrorCode.INTERNAL_ERROR,
-        message="An internal server error occurred"
-    )
-    
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=error.model_dump()
+    return _error_response(
+        status.HTTP_500_INTERNAL_SERVER_ERROR,
+        ErrorCode.INTERNAL_ERROR.value,
+        "An internal server error occurred"
     )
 
 
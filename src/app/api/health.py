@@ -46,7 +46,7 @@ HealthStatus = Literal["healthy", "degraded", "unhealthy"]
 ProbeStatus = Literal["alive"]
 
 
-def get_streams_service() -> StreamsService:
+async def get_streams_service() -> StreamsService:
     """Dependency injection for streams service.
     
     Returns singleton StreamsService instance for health checks.
@@ -122,6 +122,13 @@ SNAPSHOT_TIMEOUT: Final[float] = 2.0
 SNAPSHOT_MAX_RETRIES: Final[int] = 3
 """Maximum snapshot retry attempts."""
 
+MJPEG_PART_HEADER: Final[bytes] = (
+    b'--frame\r\n'
+    b'Content-Type: image/jpeg\r\n'
+    b'Content-Length: '
+)
+"""Constant start of each multipart part (boundary + headers up to the length)."""
+
 # Global lock for concurrent stream starts
 _start_lock = asyncio.Lock()
 
@@ -165,10 +172,18 @@ async def validate_stream_config(
 
 
 def mask_stream_response(stream: dict) -> dict:
-    """Mask RTSP credentials in response for security."""
+    """Mask RTSP credentials in response for security.
+    
+    Returns the stream itself when there is nothing to mask, so listing
+    credential-free streams copies nothing.
+    """
+    rtsp_url = stream.get("rtsp_url")
+    masked_url = mask_rtsp_credentials(rtsp_url)
+    if masked_url is rtsp_url:
+        return stream
+    
     masked = stream.copy()
-    if "rtsp_url" in masked:
-        masked["rtsp_url"] = mask_rtsp_credentials(masked["rtsp_url"])
+    masked["rtsp_url"] = masked_url
     return masked
 
 
@@ -554,17 +569,21 @@ async def stream_mjpeg(
         service.register_mjpeg_viewer(stream_id)
 
         try:
+            loop = asyncio.get_running_loop()
             frame_interval = 1.0 / FPS
-            last_time = 0.0
+            next_deadline = loop.time()
 
             while True:
-                current_time = asyncio.get_event_loop().time()
-
-                # Throttle to 5fps
-                if last_time > 0:
-                    elapsed = current_time - last_time
-                    if elapsed < frame_interval:
-                        await asyncio.sleep(frame_interval - elapsed)
+                # Throttle to 5fps on a fixed monotonic schedule: deadlines
+                # advance by exactly one interval, so per-frame overhead
+                # doesn't accumulate into drift
+                delay = next_deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                elif delay < -frame_interval:
+                    # Fell behind (stall/slow client): resync, don't burst
+                    next_deadline = loop.time()
+                next_deadline += frame_interval
 
                 # Get latest processed frame (B7 optimization - JPEG encoding on demand)
                 frame_data = await service.get_frame_for_mjpeg(stream_id)
@@ -577,16 +596,15 @@ async def stream_mjpeg(
                     await asyncio.sleep(0.1)
                     continue
 
-                # Yield MJPEG multipart frame
-                yield (
-                    b'--frame\r\n'
-                    b'Content-Type: image/jpeg\r\n'
-                    b'Content-Length: ' + str(len(jpeg_bytes)).encode() + b'\r\n\r\n' +
-                    jpeg_bytes + b'\r\n'
-                )
+                # Yield MJPEG multipart frame (one allocation of the final size)
+                yield b''.join((
+                    MJPEG_PART_HEADER,
+                    b'%d\r\n\r\n' % len(jpeg_bytes),
+                    jpeg_bytes,
+                    b'\r\n'
+                ))
 
                 frame_count += 1
-                last_time = asyncio.get_event_loop().time()
 
                 # Log every 10 seconds
                 if frame_count % 50 == 0:
@@ -714,7 +732,20 @@ async def stream_scores_sse(
         """Generate SSE events with detection scores (placeholder data)."""
         event_count = 0  # Initialize before try block
         try:
+            # Same fixed monotonic schedule as the MJPEG stream, so the
+            # per-event work doesn't stretch the 5Hz period
+            loop = asyncio.get_running_loop()
+            event_interval = 1.0 / FPS
+            next_deadline = loop.time()
+
             while True:
+                delay = next_deadline - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                elif delay < -event_interval:
+                    next_deadline = loop.time()  # Resync after a stall
+                next_deadline += event_interval
+
                 frame_data = await service.get_frame(stream_id)
                 if frame_data is None:
                     logger.info(f"SSE ended: {stream_id}")
@@ -741,8 +772,6 @@ async def stream_scores_sse(
                 event_count += 1
                 if event_count % 50 == 0:
                     logger.debug(f"SSE {stream_id}: {event_count} events")
-                
-                await asyncio.sleep(1.0 / FPS)
         except asyncio.CancelledError:
             logger.info(f"SSE cancelled: {stream_id} ({event_count} events)")
             raise
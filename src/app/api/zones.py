@@ -17,7 +17,7 @@ Zone Usage:
 """
 from __future__ import annotations
 
-from fastapi import APIRouter, HTTPException, status, Depends
+from fastapi import APIRouter, HTTPException, status, Depends, Response
 import logging
 
 from ..services.zones_service import ZonesService
@@ -28,14 +28,18 @@ logger = logging.getLogger(__name__)
 router = APIRouter(tags=["zones"])
 
 
-def get_zones_service() -> ZonesService:
+# ZonesService is stateless (its config cache and write lock are module
+# state), so one instance serves every request
+_zones_service = ZonesService()
+
+
+async def get_zones_service() -> ZonesService:
     """Dependency injection for zones service.
     
     Returns:
-        ZonesService instance for zone CRUD operations
+        Shared ZonesService instance for zone CRUD operations
     """
-    logger.debug("Injecting ZonesService")
-    return ZonesService()
+    return _zones_service
 
 
 # ============================================================================
@@ -46,9 +50,13 @@ def get_zones_service() -> ZonesService:
 async def list_zones(
     stream_id: str,
     service: ZonesService = Depends(get_zones_service)
-) -> list[dict]:
+) -> Response:
     """List all detection zones for a stream.
     
+    The body is pre-serialized by the service (cached until the config
+    changes), so it bypasses per-request response_model validation;
+    response_model still documents the schema.
+    
     Args:
         stream_id: Stream UUID
         
@@ -60,10 +68,10 @@ async def list_zones(
         ERROR: List failures
     """
     try:
-        logger.debug(f"Listing zones for stream: {stream_id}")
-        zones = await service.list_zones(stream_id)
-        logger.debug(f"Listed {len(zones)} zone(s) for stream {stream_id}")
-        return zones
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Listing zones for stream: {stream_id}")
+        body = await service.list_zones_json(stream_id)
+        return Response(content=body, media_type="application/json")
     except Exception as e:
         logger.error(f"Failed to list zones for {stream_id}: {e}", exc_info=True)
         raise HTTPException(
@@ -101,7 +109,8 @@ async def create_zone(
     """
     try:
         logger.info(f"Creating zone '{new_zone.name}' for stream {stream_id}")
-        logger.debug(f"Zone coordinates: {len(new_zone.coordinates)} vertices")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Zone coordinates: {len(new_zone.coordinates)} vertices")
         
         zone = await service.create_zone(stream_id, new_zone)
         logger.info(f"Zone created: {zone.get('name')} ({zone.get('id')})")
@@ -142,7 +151,8 @@ async def get_zone(
         ERROR: Get failures
     """
     try:
-        logger.debug(f"Getting zone {zone_id} for stream {stream_id}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Getting zone {zone_id} for stream {stream_id}")
         
         zone = await service.get_zone(stream_id, zone_id)
         if not zone:
@@ -152,7 +162,8 @@ async def get_zone(
                 detail=f"Zone {zone_id} not found"
             )
         
-        logger.debug(f"Retrieved zone: {zone.get('name', 'Unknown')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Retrieved zone: {zone.get('name', 'Unknown')}")
         return zone
     except HTTPException:
         raise
@@ -198,7 +209,7 @@ async def update_zone(
     try:
         logger.info(f"Updating zone {zone_id} in stream {stream_id}")
         
-        if edit_zone.coordinates:
+        if edit_zone.coordinates and logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Updating coordinates: {len(edit_zone.coordinates)} vertices")
         
         zone = await service.update_zone(stream_id, zone_id, edit_zone)
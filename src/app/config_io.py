@@ -4,7 +4,7 @@ Persistent storage for ProxiMeter using YAML with corruption protection.
 
 Features:
     - Thread-safe with RLock (prevents race conditions)
-    - Atomic writes (temp file + rename)
+    - Atomic, durable writes (fsync'd temp file + os.replace)
     - Auto-recovery from corruption
     - In-memory mode for CI/testing (CI_DRY_RUN=true)
     - Stream order normalization
@@ -15,10 +15,12 @@ Storage Modes:
 
 Thread Safety:
     RLock prevents concurrent read/write races and partial reads.
+    config_update_lock (asyncio) must be held across every async
+    load-mutate-save cycle, whichever service performs it.
 
 Atomic Writes:
-    1. Write to temp file
-    2. Atomic rename (POSIX) or best-effort (Windows)
+    1. Write to temp file and fsync it
+    2. Atomic os.replace (then fsync the directory on POSIX)
     3. Never corrupts config even if process crashes
 
 Logging Strategy:
@@ -29,7 +31,7 @@ Logging Strategy:
 """
 from __future__ import annotations
 
-import io
+import asyncio
 import logging
 import os
 import tempfile
@@ -49,6 +51,11 @@ CONFIG_DIR: Final[Path] = Path(os.getenv("CONFIG_DIR", "/app/config"))
 CONFIG_PATH: Final[Path] = CONFIG_DIR / "config.yml"
 STREAMS_KEY: Final[str] = "streams"
 
+# libyaml-backed C loader/dumper (bundled with PyYAML wheels); pure-Python
+# fallback keeps behavior identical where libyaml is unavailable
+_YAML_LOADER: Final = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_YAML_DUMPER: Final = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 # CI/Testing: in-memory storage
 _DRY_RUN_MODE: Final[bool] = os.getenv("CI_DRY_RUN", "").lower() in ("true", "1", "yes")
 
@@ -56,6 +63,12 @@ _DRY_RUN_MODE: Final[bool] = os.getenv("CI_DRY_RUN", "").lower() in ("true", "1"
 _in_memory_config: dict[str, Any] = {STREAMS_KEY: []}
 _config_lock = threading.RLock()
 
+# Serializes load-mutate-save cycles across every writer (streams, zones,
+# detection settings). All of them rewrite the same file, so each one must
+# hold this lock from load_streams() until its save_streams() returns, or
+# concurrent edits overwrite each other (lost updates).
+config_update_lock = asyncio.Lock()
+
 # ============================================================================
 # Initialization
 # ============================================================================
@@ -94,16 +107,14 @@ def load_streams() -> dict[str, Any]:
     
     _ensure_config_dir()
     
-    # Initialize if missing
-    if not CONFIG_PATH.exists():
-        _initialize_config_file()
-        return {STREAMS_KEY: []}
-    
     # Load with recovery
     with _config_lock:
         try:
-            with io.open(CONFIG_PATH, "r", encoding="utf-8") as f:
-                data = yaml.safe_load(f) or {}
+            # One read into bytes: libyaml parses the buffer directly (and
+            # detects the encoding) instead of pulling chunks through a
+            # Python text wrapper
+            raw = CONFIG_PATH.read_bytes()
+            data = yaml.load(raw, Loader=_YAML_LOADER) or {}
             
             # Validate structure
             if not isinstance(data, dict):
@@ -121,6 +132,11 @@ def load_streams() -> dict[str, Any]:
             logger.debug(f"Loaded {len(data[STREAMS_KEY])} stream(s)")
             return data
             
+        except FileNotFoundError:
+            # Initialize if missing
+            _initialize_config_file()
+            return {STREAMS_KEY: []}
+            
         except yaml.YAMLError as e:
             logger.error(f"YAML parsing error: {e}", exc_info=True)
             logger.warning("Reinitializing corrupted config")
@@ -133,16 +149,38 @@ def load_streams() -> dict[str, Any]:
             return {STREAMS_KEY: []}
 
 
+def get_config_stamp() -> tuple[int, int] | None:
+    """Get config file identity for cache invalidation.
+    
+    Size is included because mtime granularity can hide a same-tick
+    rewrite; a changed size still invalidates.
+    
+    Returns:
+        (st_mtime_ns, st_size) of the config file, or None in dry-run mode
+        or if the file doesn't exist (callers must not cache in that case)
+    """
+    if _DRY_RUN_MODE:
+        return None
+    try:
+        st = os.stat(CONFIG_PATH)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 # ============================================================================
 # Configuration Saving
 # ============================================================================
 
-def save_streams(config: dict[str, Any]) -> None:
+def save_streams(config: dict[str, Any]) -> dict[str, Any]:
     """Save config with atomic write.
     
     Args:
         config: Config dict with 'streams' key
         
+    Returns:
+        The config as written (order fields normalized; shallow copy)
+        
     Raises:
         ValueError: Invalid structure
         IOError: Write failure
@@ -167,7 +205,7 @@ def save_streams(config: dict[str, Any]) -> None:
             global _in_memory_config
             _in_memory_config = normalized.copy()
             logger.debug(f"Saved {len(normalized[STREAMS_KEY])} stream(s) to memory")
-        return
+        return normalized
     
     _ensure_config_dir()
     
@@ -182,20 +220,29 @@ def save_streams(config: dict[str, Any]) -> None:
                 suffix=".yml.tmp"
             )
             
-            # Write to temp
-            with os.fdopen(fd, "w", encoding="utf-8") as f:
-                yaml.safe_dump(
-                    normalized,
-                    f,
-                    default_flow_style=False,
-                    sort_keys=True,
-                    allow_unicode=True
-                )
+            # Serialize to UTF-8 bytes in one C-dumper pass, then write once
+            # (no text wrapper encoding and flushing chunk by chunk)
+            data = yaml.dump(
+                normalized,
+                Dumper=_YAML_DUMPER,
+                default_flow_style=False,
+                sort_keys=True,
+                allow_unicode=True,
+                encoding="utf-8"
+            )
+            
+            # Write to temp and flush it to disk before it can replace the
+            # old config, so a crash never leaves a renamed-but-empty file
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
             
             # Atomic rename
             _atomic_rename(temp_path, CONFIG_PATH)
             
             logger.debug(f"Saved {len(normalized[STREAMS_KEY])} stream(s)")
+            return normalized
             
         except Exception as e:
             logger.error(f"Config save failed: {e}", exc_info=True)
@@ -221,16 +268,23 @@ def _normalize_stream_order(streams: list[dict[str, Any]]) -> list[dict[str, Any
 
 
 def _atomic_rename(src: str | Path, dst: str | Path) -> None:
-    """Atomic rename (POSIX) or best-effort (Windows)."""
-    src_path = Path(src)
-    dst_path = Path(dst)
+    """Atomically replace dst with src, then persist the directory entry.
     
-    if os.name == "nt":
-        # Windows: remove target first (not atomic)
-        if dst_path.exists():
-            dst_path.unlink()
+    os.replace is atomic on POSIX and overwrites in place on Windows. The
+    directory fsync (POSIX only) makes the rename itself survive a crash.
+    """
+    os.replace(src, dst)
     
-    src_path.rename(dst_path)
+    if os.name != "nt":
+        # Best-effort: the new config is already in place at this point
+        try:
+            dir_fd = os.open(os.path.dirname(os.fspath(dst)) or ".", os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError as e:
+            logger.debug(f"Config dir fsync skipped: {e}")
 
 
 # ============================================================================
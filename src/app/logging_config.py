@@ -9,9 +9,12 @@ Security:
 """
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
 import re
 import sys
 from datetime import datetime, timezone
@@ -148,6 +151,38 @@ class JSONFormatter(logging.Formatter):
         return json.dumps(log_data, ensure_ascii=False, default=str)
 
 
+# ============================================================================
+# Queue Handling
+# ============================================================================
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that defers all formatting to the listener thread.
+    
+    The stock prepare() formats the record (timestamp, exception text) on
+    the calling thread. Here only the message is merged with its args, so
+    mutable args are captured at log time and everything else (including
+    exc_info for the JSON "exception" field) is left to the formatter.
+    """
+    
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message args in place; keep exc_info for the formatter."""
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_queue_listener: logging.handlers.QueueListener | None = None
+"""Background listener that writes queued records to the console."""
+
+
+def stop_logging() -> None:
+    """Flush queued log records and stop the listener thread."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
 # ============================================================================
 # Configuration
 # ============================================================================
@@ -188,7 +223,8 @@ def configure_logging() -> None:
     
     Sets up:
     - Root logger with text or JSON formatting
-    - Console (stdout) handler
+    - Console (stdout) handler, fed through a queue so callers never block
+      on stdout writes (a listener thread drains it)
     - Credential redaction for security
     - Uvicorn logger integration
     
@@ -196,9 +232,13 @@ def configure_logging() -> None:
         LOG_LEVEL: DEBUG, INFO, WARNING, ERROR, CRITICAL (default: INFO)
         LOG_FORMAT: text, json (default: text)
     """
+    global _queue_listener
     log_level = get_log_level()
     log_format = get_log_format()
     
+    # Restart the listener if logging is reconfigured
+    stop_logging()
+    
     # Configure root logger
     root = logging.getLogger()
     root.setLevel(log_level)
@@ -217,7 +257,14 @@ def configure_logging() -> None:
     else:
         console.setFormatter(TextFormatter())
     
-    root.addHandler(console)
+    # Callers only enqueue; formatting, redaction and writes happen on
+    # the listener thread
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    root.addHandler(DeferredQueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, console, respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Fix Uvicorn loggers to use our formatter
     for logger_name in ["uvicorn", "uvicorn.error", "uvicorn.access"]:
@@ -238,3 +285,7 @@ def configure_logging() -> None:
 def setup_logging() -> None:
     """Setup logging (alias for backward compatibility)."""
     configure_logging()
+
+
+# Drain pending records on interpreter exit
+atexit.register(stop_logging)
@@ -48,7 +48,6 @@ import logging
 import os
 
 from fastapi import FastAPI
-from fastapi.staticfiles import StaticFiles
 from fastapi.exceptions import RequestValidationError
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
@@ -61,6 +60,7 @@ from .api.errors import (
 from .logging_config import setup_logging
 from .middleware.rate_limit import RateLimitMiddleware
 from .middleware.request_id import RequestIDMiddleware
+from .static_files import FrontendStaticFiles
 from .services.streams_service import StreamsService
 from .services import container
 
@@ -120,8 +120,18 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
 
         yolo_model = os.getenv("YOLO_MODEL", "yolo11n")
         yolo_size = int(os.getenv("YOLO_IMAGE_SIZE", "640"))
+        yolo_precision = os.getenv("YOLO_PRECISION", "fp32")
+        yolo_cuda_graph = os.getenv("YOLO_CUDA_GRAPH", "false").lower() in ("1", "true")
         gpu_backend_env = os.getenv("GPU_BACKEND_DETECTED", "none")
-        model_path = f"/app/models/{yolo_model}_{yolo_size}.onnx"
+        from .services.yolo import onnx_model_filename
+        try:
+            model_filename = onnx_model_filename(yolo_model, yolo_size, yolo_precision)
+        except ValueError as e:
+            # A bad detection setting must not take stream support down
+            logger.warning(f"Invalid YOLO_PRECISION '{yolo_precision}': {e}; using fp32")
+            yolo_precision = "fp32"
+            model_filename = onnx_model_filename(yolo_model, yolo_size, yolo_precision)
+        model_path = f"/app/models/{model_filename}"
 
         yolo_config = YOLOConfig(
             model_name=yolo_model,
@@ -130,14 +140,20 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             model_path=model_path
         )
         detection.set_yolo_config(yolo_config)
-        logger.info(f"YOLO config: {yolo_model} ({yolo_size}x{yolo_size}), backend={gpu_backend_env}")
+        logger.info(f"YOLO config: {yolo_model} ({yolo_size}x{yolo_size}, {yolo_precision}), backend={gpu_backend_env}")
 
         # Initialize ONNX Runtime session if model exists
         if Path(model_path).exists():
-            from .services.yolo import create_onnx_session
+            from .services.yolo import create_session_with_binding
             try:
-                onnx_session = create_onnx_session(model_path, gpu_backend_env, fail_fast=False)
+                onnx_session, inference_binding = create_session_with_binding(
+                    model_path,
+                    gpu_backend_env,
+                    fail_fast=False,
+                    enable_cuda_graph=yolo_cuda_graph
+                )
                 detection.set_onnx_session(onnx_session)
+                detection.set_inference_binding(inference_binding)
                 logger.info(f"ONNX Runtime session initialized: {model_path}")
             except Exception as e:
                 logger.warning(f"Failed to initialize ONNX session: {e}")
@@ -275,7 +291,7 @@ app.include_router(detection.router, tags=["detection"])
 STATIC_DIR = os.getenv("STATIC_ROOT", "/app/src/app/static/frontend")
 
 if os.path.exists(STATIC_DIR):
-    app.mount("/", StaticFiles(directory=STATIC_DIR, html=True), name="frontend")
+    app.mount("/", FrontendStaticFiles(directory=STATIC_DIR, html=True), name="frontend")
     logger.info(f"Frontend: {STATIC_DIR}")
 else:
     logger.warning(f"Frontend not found: {STATIC_DIR}")
@@ -44,11 +44,13 @@ streams_service: StreamsService | None = None
 # Dependency Injection
 # ============================================================================
 
-def get_streams_service() -> StreamsService:
+async def get_streams_service() -> StreamsService:
     """Get the global StreamsService singleton for dependency injection.
     
     Used by FastAPI's Depends() in all API route handlers to ensure
-    all requests use the same service instance.
+    all requests use the same service instance. Dependencies like this
+    one are async so FastAPI resolves them on the event loop rather than
+    via a threadpool hop per request.
     
     Returns:
         Global StreamsService instance
@@ -70,7 +72,6 @@ def get_streams_service() -> StreamsService:
             "Application startup may have failed."
         )
     
-    logger.debug("Injecting StreamsService singleton")
     return streams_service
 
 
@@ -15,11 +15,28 @@ import cv2
 from typing import List, Tuple
 import onnxruntime as ort
 import logging
+import time
 from app.models.detection import Detection, COCO_CLASSES
 
 logger = logging.getLogger(__name__)
 
 
+# Inference runs between GPU memory arena shrinkage requests. ORT's device
+# arena never returns memory to the driver on its own, so VRAM would only
+# ever grow in this long-running process.
+ARENA_SHRINK_INTERVAL = 300
+
+# Providers whose device arena is addressed as "gpu:0" by the shrinkage option
+_GPU_ARENA_PROVIDERS = frozenset({
+    "TensorrtExecutionProvider",  # CUDA EP (and its arena) runs the fallback ops
+    "CUDAExecutionProvider",
+    "ROCmExecutionProvider",
+})
+
+_inference_run_count = 0
+_arena_shrinkage_run_options: ort.RunOptions | None = None
+
+
 # Pre-generated class colors (80 COCO classes, fixed seed for consistency)
 np.random.seed(42)
 CLASS_COLORS = np.random.randint(0, 255, size=(80, 3), dtype=np.uint8)
@@ -217,30 +234,74 @@ def map_detections_to_frame(
     return mapped_detections
 
 
+def _get_arena_shrinkage_run_options(session: ort.InferenceSession) -> ort.RunOptions | None:
+    """
+    Return RunOptions that shrink the GPU memory arena after the run.
+
+    Shrinkage is a per-run option (not a session option) and returns
+    unused arena chunks to the device allocator once the run completes.
+
+    Args:
+        session: ONNX Runtime inference session
+
+    Returns:
+        Shared RunOptions, or None if the session has no GPU arena
+    """
+    global _arena_shrinkage_run_options
+    if session.get_providers()[0] not in _GPU_ARENA_PROVIDERS:
+        return None
+    if _arena_shrinkage_run_options is None:
+        run_options = ort.RunOptions()
+        run_options.add_run_config_entry("memory.enable_memory_arena_shrinkage", "gpu:0")
+        _arena_shrinkage_run_options = run_options
+    return _arena_shrinkage_run_options
+
+
 def run_inference(
     session: ort.InferenceSession,
-    preprocessed_frame: np.ndarray
+    preprocessed_frame: np.ndarray,
+    run_options: ort.RunOptions | None = None,
+    binding=None
 ) -> np.ndarray:
     """
     Run YOLO inference via ONNX Runtime.
 
+    Every ARENA_SHRINK_INTERVAL runs (across all streams sharing the
+    session) the GPU memory arena is shrunk back to its live set.
+
     Args:
         session: ONNX Runtime inference session
         preprocessed_frame: Preprocessed frame from preprocess_frame()
+        run_options: Explicit RunOptions (disables periodic shrinkage)
+        binding: Optional InferenceBinding (services.yolo) for the session;
+            reuses pre-allocated buffers instead of session.run
 
     Returns:
-        Raw YOLO output array (detections before NMS)
+        Raw YOLO output array (detections before NMS). With a binding this
+        is a reused buffer, valid until the next inference.
     """
-    import time
-    input_name = session.get_inputs()[0].name
-    logger.debug(f"Running YOLO inference: input_name={input_name}, input_shape={preprocessed_frame.shape}")
+    global _inference_run_count
+    logger.debug(f"Running YOLO inference: input_shape={preprocessed_frame.shape}, binding={binding is not None}")
+
+    _inference_run_count += 1
+    # A captured CUDA graph replays fixed arena addresses, so never shrink it
+    cuda_graph = binding is not None and binding.uses_cuda_graph
+    if run_options is None and not cuda_graph and _inference_run_count % ARENA_SHRINK_INTERVAL == 0:
+        run_options = _get_arena_shrinkage_run_options(session)
+        logger.debug("Requesting GPU memory arena shrinkage after this run")
 
     start_time = time.perf_counter()
-    outputs = session.run(None, {input_name: preprocessed_frame})
+    if binding is not None:
+        output = binding.run(preprocessed_frame, run_options)
+    else:
+        model_input = session.get_inputs()[0]
+        if model_input.type == "tensor(float16)":
+            preprocessed_frame = preprocessed_frame.astype(np.float16)  # FP16 export
+        output = session.run(None, {model_input.name: preprocessed_frame}, run_options)[0]
     inference_time_ms = (time.perf_counter() - start_time) * 1000
 
-    logger.info(f"YOLO inference complete: time={inference_time_ms:.1f}ms, output_shape={outputs[0].shape}")
-    return outputs[0]
+    logger.info(f"YOLO inference complete: time={inference_time_ms:.1f}ms, output_shape={output.shape}")
+    return output
 
 
 def parse_detections(
@@ -15,7 +15,10 @@ import numpy as np
 from typing import List, Tuple, Optional
 import logging
 from app.models.motion import MotionRegion, TrackedObject, ObjectState
-from app.utils.tracking import KalmanTracker, compute_iou_matrix, hungarian_matching
+from app.utils.tracking import (
+    KalmanTracker, compute_iou_matrix, hungarian_matching,
+    predict_trackers, update_trackers
+)
 
 logger = logging.getLogger(__name__)
 
@@ -269,7 +272,11 @@ class MotionDetector:
         boxes = np.array([
             [x, y, x + w, y + h, area, merged_count]
             for (x, y, w, h, area, merged_count) in bboxes
-        ])
+        ], dtype=np.float32)
+
+        # Box areas don't change between NMS rounds; compute them once
+        # (column 4 is the contour area, not the box area)
+        box_areas = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
 
         # Sort by area (larger boxes first)
         indices = np.argsort(boxes[:, 4])[::-1]
@@ -283,10 +290,11 @@ class MotionDetector:
                 break
 
             # Compute IoU with remaining boxes
-            ious = self._compute_iou(boxes[i], boxes[indices[1:]])
+            rest = indices[1:]
+            ious = self._compute_iou(boxes[i], boxes[rest], box_areas[i], box_areas[rest])
 
             # Keep only boxes with IoU below threshold
-            indices = indices[1:][ious < self.nms_iou_threshold]
+            indices = rest[ious < self.nms_iou_threshold]
 
         # Convert back to (x, y, w, h, area, merged_count) format
         result = []
@@ -299,7 +307,9 @@ class MotionDetector:
     def _compute_iou(
         self,
         box: np.ndarray,
-        boxes: np.ndarray
+        boxes: np.ndarray,
+        box_area: float,
+        boxes_area: np.ndarray
     ) -> np.ndarray:
         """
         Compute IoU between one box and multiple boxes.
@@ -307,6 +317,8 @@ class MotionDetector:
         Args:
             box: Single box [x1, y1, x2, y2, area, merged_count]
             boxes: Multiple boxes (N, 6) array
+            box_area: Bounding-box area of box
+            boxes_area: Bounding-box areas of boxes (N,)
 
         Returns:
             IoU scores array (N,)
@@ -321,8 +333,6 @@ class MotionDetector:
         intersection = np.maximum(0, x2 - x1) * np.maximum(0, y2 - y1)
 
         # Union area
-        box_area = (box[2] - box[0]) * (box[3] - box[1])
-        boxes_area = (boxes[:, 2] - boxes[:, 0]) * (boxes[:, 3] - boxes[:, 1])
         union = box_area + boxes_area - intersection
 
         # IoU
@@ -409,12 +419,13 @@ class ObjectTracker:
         self.frame_count = frame_count
         logger.debug(f"ObjectTracker update: frame={frame_count}, detections={len(detections)}")
 
-        # Step 1: Predict all existing tracks using Kalman filter
+        # Step 1: Predict all existing tracks using Kalman filter (one batch)
+        kalmans = [self._kalman_trackers.get(str(track.id)) for track in self.tracks]
+        predict_trackers([kalman for kalman in kalmans if kalman])
+
         predicted_bboxes = []
-        for track in self.tracks:
-            kalman = self._kalman_trackers.get(str(track.id))
+        for track, kalman in zip(self.tracks, kalmans):
             if kalman:
-                kalman.predict()
                 predicted_bbox = kalman.get_bbox()
                 predicted_bboxes.append(predicted_bbox)
                 # Update track bounding box with prediction
@@ -437,7 +448,11 @@ class ObjectTracker:
         matched_det_indices = []
         matched_track_indices = []
         if cost_matrix.size > 0:
-            det_indices, track_indices = hungarian_matching(cost_matrix)
+            # Gate in the solver too, so a below-threshold pair can't take a
+            # track or detection that has a valid match elsewhere
+            det_indices, track_indices = hungarian_matching(
+                cost_matrix, cost_limit=1.0 - self.iou_threshold
+            )
 
             # Filter matches by IoU threshold
             for det_idx, track_idx in zip(det_indices, track_indices):
@@ -448,14 +463,19 @@ class ObjectTracker:
         logger.debug(f"Matching: {len(matched_det_indices)} matches, {len(detections)} detections, {len(self.tracks)} tracks")
 
         # Step 4: Update matched tracks with detections
-        for det_idx, track_idx in zip(matched_det_indices, matched_track_indices):
+        # Correct all matched Kalman filters with their measurements (one batch)
+        matched_kalmans = [kalmans[track_idx] for track_idx in matched_track_indices]
+        update_trackers(
+            [kalman for kalman in matched_kalmans if kalman],
+            [detections[det_idx][0]
+             for det_idx, kalman in zip(matched_det_indices, matched_kalmans) if kalman]
+        )
+
+        for det_idx, track_idx, kalman in zip(matched_det_indices, matched_track_indices, matched_kalmans):
             det_bbox, det_class, det_conf = detections[det_idx]
             track = self.tracks[track_idx]
 
-            # Update Kalman filter with measurement
-            kalman = self._kalman_trackers.get(str(track.id))
             if kalman:
-                kalman.update(det_bbox)
                 updated_bbox = kalman.get_bbox()
                 updated_velocity = kalman.get_velocity()
             else:
@@ -26,15 +26,27 @@ Logging Strategy:
 from __future__ import annotations
 
 import asyncio
+import atexit
+import json
 import logging
+import os
+import re
+import signal
 import subprocess
+import sys
 import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Any, Final
 
+import cv2
+import numpy as np
+
 from ..config.ffmpeg_defaults import get_default_ffmpeg_params
-from ..config_io import load_streams, save_streams, get_gpu_backend
+from ..config_io import load_streams, save_streams, get_gpu_backend, config_update_lock
+from ..models.motion import ObjectState
 from ..models.stream import Stream
 from ..utils.validation import validate_rtsp_url as validate_rtsp_url_format
 from ..utils.strings import normalize_stream_name, mask_rtsp_credentials
@@ -51,17 +63,142 @@ logger = logging.getLogger(__name__)
 DEFAULT_PROBE_TIMEOUT: Final[float] = 5.0
 """Timeout for RTSP stream connectivity probe."""
 
-STREAM_STOP_TIMEOUT: Final[float] = 5.0
-"""Graceful shutdown timeout before SIGKILL."""
+STREAM_STOP_TIMEOUT: Final[float] = 0.5
+"""Grace period after SIGINT before SIGKILL (FFmpeg exits fast on SIGINT)."""
 
 FRAME_READ_TIMEOUT: Final[float] = 2.0
 """Timeout for reading single frame from FFmpeg stdout."""
 
-JPEG_START_MARKER: Final[bytes] = b'\xff\xd8'
-"""JPEG SOI (Start of Image) marker."""
+STDERR_FLUSH_INTERVAL: Final[float] = 0.25
+"""Max seconds buffered FFmpeg stderr lines wait before being logged."""
+
+STDERR_BATCH_LINES: Final[int] = 32
+"""Buffered FFmpeg stderr lines that force an immediate flush."""
+
+_FFMPEG_ERROR_PATTERN: Final[re.Pattern[str]] = re.compile(r"error|fatal", re.IGNORECASE)
+_FFMPEG_WARNING_PATTERN: Final[re.Pattern[str]] = re.compile(r"warning", re.IGNORECASE)
+
+MAX_STREAM_NAME_LENGTH: Final[int] = 50
+"""Maximum stream display name length (after stripping whitespace)."""
+
+FRAME_PIPE_SIZE: Final[int] = 1 << 20
+"""Requested kernel buffer for the FFmpeg stdout pipe (Linux default is 64KB)."""
+
+FRAME_PIPE_FALLBACK_SIZE: Final[int] = 256 * 1024
+"""Pipe buffer to retry with when FRAME_PIPE_SIZE exceeds pipe-max-size."""
+
+_F_SETPIPE_SZ: Final[int] = 1031
+"""fcntl command to resize a pipe (Linux; not exposed by fcntl before 3.10)."""
+
+STATUS_WRITE_DELAY: Final[float] = 0.05
+"""Window in which stream status changes are batched into one config save."""
+
+JPEG_ENCODE_WORKERS: Final[int] = min(4, os.cpu_count() or 1)
+"""Threads in the MJPEG encode pool (cv2 releases the GIL while encoding)."""
+
+# Long-lived pool for MJPEG encodes. Kept apart from the default executor
+# so viewer load can't starve config I/O (asyncio.to_thread) and vice versa.
+_jpeg_encode_executor = ThreadPoolExecutor(
+    max_workers=JPEG_ENCODE_WORKERS,
+    thread_name_prefix="mjpeg-encode"
+)
+atexit.register(_jpeg_encode_executor.shutdown, wait=False)
+
+# ============================================================================
+# Timestamp Helpers
+# ============================================================================
+
+_timestamp_prefix_cache: tuple[int, str] = (-1, "")
+"""(epoch second, formatted 'YYYY-MM-DDTHH:MM:SS' prefix) of the last call."""
+
+
+def _utc_timestamp() -> str:
+    """Return current UTC time as ISO 8601 with millisecond precision.
+
+    The seconds prefix is formatted once per wall-clock second and reused,
+    so bursts of stream creation only format the millisecond suffix.
+    """
+    global _timestamp_prefix_cache
+    now_ns = time.time_ns()
+    sec, rem_ns = divmod(now_ns, 1_000_000_000)
+    cached_sec, prefix = _timestamp_prefix_cache
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _timestamp_prefix_cache = (sec, prefix)
+    return f"{prefix}.{rem_ns // 1_000_000:03d}+00:00"
+
+
+# ============================================================================
+# Pipe Helpers
+# ============================================================================
+
+def _create_frame_pipe() -> tuple[int, int]:
+    """Create the pipe FFmpeg writes raw frames into.
+
+    A single 1080p BGR24 frame is ~6MB, so the default 64KB pipe forces
+    FFmpeg to block many times per frame. On Linux the buffer is grown to
+    FRAME_PIPE_SIZE (or FRAME_PIPE_FALLBACK_SIZE when unprivileged and the
+    request exceeds /proc/sys/fs/pipe-max-size). Python creates both ends
+    with O_CLOEXEC, so no other child process inherits them.
+
+    Returns:
+        (read_fd, write_fd)
+    """
+    read_fd, write_fd = os.pipe()
+    if sys.platform.startswith("linux"):
+        import fcntl
+
+        set_pipe_size = getattr(fcntl, "F_SETPIPE_SZ", _F_SETPIPE_SZ)
+        for size in (FRAME_PIPE_SIZE, FRAME_PIPE_FALLBACK_SIZE):
+            try:
+                fcntl.fcntl(write_fd, set_pipe_size, size)
+                logger.debug(f"Frame pipe buffer set to {size} bytes")
+                break
+            except PermissionError:
+                continue
+            except OSError as e:
+                logger.debug(f"Could not resize frame pipe: {e}")
+                break
+    return read_fd, write_fd
+
+
+async def _open_pipe_reader(read_fd: int) -> tuple[asyncio.StreamReader, asyncio.BaseTransport]:
+    """Wrap the read end of a pipe in an asyncio StreamReader."""
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader(limit=FRAME_PIPE_SIZE, loop=loop)
+    transport, _ = await loop.connect_read_pipe(
+        lambda: asyncio.StreamReaderProtocol(reader, loop=loop),
+        os.fdopen(read_fd, "rb", buffering=0)
+    )
+    return reader, transport
+
+
+# ============================================================================
+# Validation Helpers
+# ============================================================================
+
+def _validate_name(name: str) -> str:
+    """Strip and validate a stream display name.
+
+    Raises:
+        ValueError: Name empty or longer than MAX_STREAM_NAME_LENGTH
+    """
+    name = name.strip()
+    if not 0 < len(name) <= MAX_STREAM_NAME_LENGTH:
+        raise ValueError(f"Name must be 1-{MAX_STREAM_NAME_LENGTH} characters")
+    return name
+
 
-JPEG_END_MARKER: Final[bytes] = b'\xff\xd9'
-"""JPEG EOI (End of Image) marker."""
+def _encode_jpeg(frame: np.ndarray) -> bytes:
+    """Encode a BGR frame as MJPEG-quality JPEG bytes (runs on the encode pool).
+
+    Raises:
+        ValueError: Encoder rejected the frame
+    """
+    ok, jpeg = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+    if not ok:
+        raise ValueError("cv2.imencode failed")
+    return jpeg.tobytes()
 
 # ============================================================================
 # Streams Service
@@ -90,8 +227,15 @@ class StreamsService:
         """
         self.active_processes: dict[str, dict[str, Any]] = {}
         self.active_processes_lock = asyncio.Lock()
+        # Status changes awaiting the next batched write, and the task doing it
+        self._pending_statuses: dict[str, str] = {}
+        self._status_flush: asyncio.Task | None = None
         self.active_mjpeg_viewers: dict[str, int] = {}  # {stream_id: viewer_count}
         self.gpu_backend = get_gpu_backend()
+        # Backend never changes at runtime, so defaults are built once
+        self._default_ffmpeg_params: tuple[str, ...] = tuple(
+            get_default_ffmpeg_params(self.gpu_backend)
+        )
 
         if self.gpu_backend == "none":
             logger.warning("No GPU detected - stream starts will fail")
@@ -128,7 +272,7 @@ class StreamsService:
     async def list_streams(self) -> list[dict]:
         """List all configured streams sorted by display order."""
         try:
-            config = load_streams()
+            config = await asyncio.to_thread(load_streams)
             streams = config.get("streams", [])
             streams.sort(key=lambda s: s.get("order", 0))
             logger.debug(f"Listed {len(streams)} stream(s)")
@@ -140,7 +284,7 @@ class StreamsService:
     async def get_stream(self, stream_id: str) -> dict | None:
         """Get stream by ID."""
         try:
-            config = load_streams()
+            config = await asyncio.to_thread(load_streams)
             for stream in config.get("streams", []):
                 if stream.get("id") == stream_id:
                     return stream
@@ -179,7 +323,6 @@ class StreamsService:
             RuntimeError: GPU required but unavailable
         """
         # Normalize
-        name = name.strip()
         rtsp_url = rtsp_url.strip()
         
         # Validate GPU
@@ -187,8 +330,7 @@ class StreamsService:
             raise RuntimeError("GPU acceleration unavailable")
         
         # Validate name
-        if not name or len(name) > 50:
-            raise ValueError("Name must be 1-50 characters")
+        name = _validate_name(name)
         
         # Validate URL format
         is_valid, error_msg = validate_rtsp_url_format(rtsp_url)
@@ -202,35 +344,42 @@ class StreamsService:
         else:
             logger.debug(f"Using {len(ffmpeg_params)} custom FFmpeg params")
         
-        # Load config
-        config = load_streams()
-        streams = config.get("streams", [])
-        
-        # Check duplicate name
-        self._validate_unique_stream_name(streams, name)
+        async with config_update_lock:
+            # Load config off the event loop
+            config = await asyncio.to_thread(load_streams)
+            streams = config.get("streams", [])
         
-        # Probe connectivity
-        logger.debug(f"Probing RTSP: {mask_rtsp_credentials(rtsp_url)}")
-        is_reachable = await probe_rtsp_stream(rtsp_url, DEFAULT_PROBE_TIMEOUT)
-        if not is_reachable:
-            logger.warning(f"RTSP unreachable: {mask_rtsp_credentials(rtsp_url)}")
+            # Check duplicate name (fail fast, before any network I/O)
+            self._validate_unique_stream_name(streams, name)
         
-        # Create stream
-        stream = Stream(
-            id=str(uuid.uuid4()),
-            name=name,
-            rtsp_url=rtsp_url,
-            ffmpeg_params=ffmpeg_params,
-            created_at=datetime.now(timezone.utc).isoformat(),
-            order=len(streams),
-            status="stopped"
-        )
+            # Probe connectivity in the background while the stream is built
+            logger.debug(f"Probing RTSP: {mask_rtsp_credentials(rtsp_url)}")
+            probe_task = asyncio.create_task(probe_rtsp_stream(rtsp_url, DEFAULT_PROBE_TIMEOUT))
         
-        # Persist
-        stream_dict = stream.model_dump()
-        streams.append(stream_dict)
-        config["streams"] = streams
-        save_streams(config)
+            # Create and persist stream; don't leave the probe running if
+            # either step fails
+            try:
+                stream = Stream(
+                    id=str(uuid.uuid4()),
+                    name=name,
+                    rtsp_url=rtsp_url,
+                    ffmpeg_params=ffmpeg_params,
+                    created_at=_utc_timestamp(),
+                    order=len(streams),
+                    status="stopped"
+                )
+                stream_dict = stream.model_dump()
+            
+                streams.append(stream_dict)
+                config["streams"] = streams
+                await asyncio.to_thread(save_streams, config)
+            except BaseException:
+                probe_task.cancel()
+                raise
+
+        # Probe result is informational only; don't hold the lock for it
+        if not await probe_task:
+            logger.warning(f"RTSP unreachable: {mask_rtsp_credentials(rtsp_url)}")
         
         logger.info(f"Created stream: {name} ({stream.id})")
 
@@ -255,60 +404,59 @@ class StreamsService:
         auto_start: bool | None = None
     ) -> dict | None:
         """Update stream (partial update)."""
-        config = load_streams()
-        streams = config.get("streams", [])
+        async with config_update_lock:
+            config = await asyncio.to_thread(load_streams)
+            streams = config.get("streams", [])
         
-        # Find stream
-        stream_index = self._find_stream_index(streams, stream_id)
-        if stream_index is None:
-            logger.debug(f"Update failed - not found: {stream_id}")
-            return None
+            # Find stream
+            stream_index = self._find_stream_index(streams, stream_id)
+            if stream_index is None:
+                logger.debug(f"Update failed - not found: {stream_id}")
+                return None
         
-        stream = streams[stream_index]
-        url_changed = False
+            stream = streams[stream_index]
+            url_changed = False
         
-        # Update name
-        if name is not None:
-            name = name.strip()
-            if not name or len(name) > 50:
-                raise ValueError("Name must be 1-50 characters")
-            self._validate_unique_stream_name(streams, name, exclude_index=stream_index)
-            stream["name"] = name
+            # Update name
+            if name is not None:
+                name = _validate_name(name)
+                self._validate_unique_stream_name(streams, name, exclude_index=stream_index)
+                stream["name"] = name
         
-        # Update URL
-        if rtsp_url is not None:
-            rtsp_url = rtsp_url.strip()
-            is_valid, error_msg = validate_rtsp_url_format(rtsp_url)
-            if not is_valid:
-                raise ValueError(error_msg or "Invalid RTSP URL")
-            stream["rtsp_url"] = rtsp_url
-            url_changed = True
+            # Update URL
+            if rtsp_url is not None:
+                rtsp_url = rtsp_url.strip()
+                is_valid, error_msg = validate_rtsp_url_format(rtsp_url)
+                if not is_valid:
+                    raise ValueError(error_msg or "Invalid RTSP URL")
+                stream["rtsp_url"] = rtsp_url
+                url_changed = True
         
-        # Update FFmpeg params (apply defaults if cleared)
-        if ffmpeg_params is not None:
-            if not ffmpeg_params:
-                hw_accel = stream.get("hw_accel_enabled", True)
-                stream["ffmpeg_params"] = self._get_default_ffmpeg_params(hw_accel)
-                logger.debug(f"Applied default params: {stream_id}")
-            else:
-                stream["ffmpeg_params"] = ffmpeg_params
-                logger.debug(f"Applied custom params: {stream_id}")
+            # Update FFmpeg params (apply defaults if cleared)
+            if ffmpeg_params is not None:
+                if not ffmpeg_params:
+                    hw_accel = stream.get("hw_accel_enabled", True)
+                    stream["ffmpeg_params"] = self._get_default_ffmpeg_params(hw_accel)
+                    logger.debug(f"Applied default params: {stream_id}")
+                else:
+                    stream["ffmpeg_params"] = ffmpeg_params
+                    logger.debug(f"Applied custom params: {stream_id}")
 
-        # Re-probe if URL changed
+            # Update status
+            if status is not None:
+                stream["status"] = status
+        
+            # Persist
+            config["streams"] = streams
+            await asyncio.to_thread(save_streams, config)
+
+        # Re-probe if URL changed (outside the lock; result is informational)
         if url_changed:
             logger.debug(f"Re-probing: {stream_id}")
             is_reachable = await probe_rtsp_stream(stream["rtsp_url"], DEFAULT_PROBE_TIMEOUT)
             if not is_reachable:
                 logger.warning(f"Updated URL unreachable: {stream_id}")
         
-        # Update status
-        if status is not None:
-            stream["status"] = status
-        
-        # Persist
-        config["streams"] = streams
-        save_streams(config)
-        
         logger.info(f"Updated stream: {stream_id}")
         return stream
     
@@ -322,23 +470,24 @@ class StreamsService:
         if stream_id in self.active_processes:
             await self.stop_stream(stream_id)
         
-        config = load_streams()
-        streams = config.get("streams", [])
+        async with config_update_lock:
+            config = await asyncio.to_thread(load_streams)
+            streams = config.get("streams", [])
         
-        # Remove
-        initial_count = len(streams)
-        streams = [s for s in streams if s.get("id") != stream_id]
+            # Remove
+            initial_count = len(streams)
+            streams = [s for s in streams if s.get("id") != stream_id]
         
-        if len(streams) == initial_count:
-            logger.debug(f"Delete failed - not found: {stream_id}")
-            return False
+            if len(streams) == initial_count:
+                logger.debug(f"Delete failed - not found: {stream_id}")
+                return False
         
-        # Renumber orders
-        for i, stream in enumerate(streams):
-            stream["order"] = i
+            # Renumber orders
+            for i, stream in enumerate(streams):
+                stream["order"] = i
         
-        config["streams"] = streams
-        save_streams(config)
+            config["streams"] = streams
+            await asyncio.to_thread(save_streams, config)
         
         logger.info(f"Deleted stream: {stream_id}")
         return True
@@ -349,44 +498,45 @@ class StreamsService:
     
     async def reorder_streams(self, order: list[str]) -> bool:
         """Reorder streams by ID list."""
-        config = load_streams()
-        streams = config.get("streams", [])
+        async with config_update_lock:
+            config = await asyncio.to_thread(load_streams)
+            streams = config.get("streams", [])
         
-        # No-op for 0-1 streams
-        if len(streams) <= 1:
-            logger.debug("Reorder skipped: ≤1 streams")
-            return True
+            # No-op for 0-1 streams
+            if len(streams) <= 1:
+                logger.debug("Reorder skipped: ≤1 streams")
+                return True
         
-        # Validate
-        if len(order) != len(streams):
-            raise ValueError(f"Order must contain {len(streams)} IDs")
+            # Validate
+            if len(order) != len(streams):
+                raise ValueError(f"Order must contain {len(streams)} IDs")
         
-        if len(set(order)) != len(order):
-            raise ValueError("Duplicate IDs in order")
+            if len(set(order)) != len(order):
+                raise ValueError("Duplicate IDs in order")
         
-        # Build map
-        stream_map = {s.get("id"): s for s in streams}
+            # Build map
+            stream_map = {s.get("id"): s for s in streams}
         
-        # Validate IDs exist
-        for stream_id in order:
-            if stream_id not in stream_map:
-                raise ValueError(f"Unknown stream ID: {stream_id}")
+            # Validate IDs exist
+            for stream_id in order:
+                if stream_id not in stream_map:
+                    raise ValueError(f"Unknown stream ID: {stream_id}")
         
-        # Check if already correct (idempotent)
-        current_order = [s.get("id") for s in streams]
-        if current_order == order:
-            logger.debug("Reorder skipped: already correct")
-            return True
+            # Check if already correct (idempotent)
+            current_order = [s.get("id") for s in streams]
+            if current_order == order:
+                logger.debug("Reorder skipped: already correct")
+                return True
         
-        # Reorder
-        reordered = []
-        for i, stream_id in enumerate(order):
-            stream = stream_map[stream_id].copy()
-            stream["order"] = i
-            reordered.append(stream)
+            # Reorder
+            reordered = []
+            for i, stream_id in enumerate(order):
+                stream = stream_map[stream_id].copy()
+                stream["order"] = i
+                reordered.append(stream)
         
-        config["streams"] = reordered
-        save_streams(config)
+            config["streams"] = reordered
+            await asyncio.to_thread(save_streams, config)
         
         logger.info(f"Reordered {len(reordered)} stream(s)")
         return True
@@ -438,18 +588,15 @@ class StreamsService:
         5. Report detections (logs/metrics) (T017)
         6. IF viewers connected: render bounding boxes, store annotated frame
         7. ELSE: discard frame (no rendering/storage needed)
-        8. Sleep to maintain 5 FPS
+
+        Pacing comes from FFmpeg's 5fps output; the loop just reads frames.
         """
-        import numpy as np
-        import cv2
-        import time
-        from ..api.detection import get_onnx_session, get_yolo_config_singleton
+        from ..api.detection import get_onnx_session, get_inference_binding, get_yolo_config_singleton
         from ..services.detection import (
             preprocess_frame, preprocess_region, run_inference, parse_detections,
             filter_detections, render_bounding_boxes, map_detections_to_frame,
             render_motion_boxes, render_tracking_boxes
         )
-        from ..models.motion import ObjectState
 
         logger.info(f"[{stream_id}] Starting continuous frame processor")
 
@@ -457,6 +604,7 @@ class StreamsService:
             try:
                 proc_data = self.active_processes[stream_id]
                 process = proc_data["process"]
+                stdout = proc_data["stdout"]
                 buffer = proc_data["buffer"]
                 dimensions = proc_data.get("stream_dimensions")
 
@@ -478,7 +626,7 @@ class StreamsService:
                 while len(buffer) < frame_size:
                     try:
                         chunk = await asyncio.wait_for(
-                            process.stdout.read(frame_size - len(buffer)),
+                            stdout.read(frame_size - len(buffer)),
                             timeout=FRAME_READ_TIMEOUT
                         )
                     except asyncio.TimeoutError:
@@ -512,6 +660,7 @@ class StreamsService:
                         logger.warning(f"[{stream_id}] ONNX session not available")
                         await asyncio.sleep(0.2)
                         continue
+                    inference_binding = get_inference_binding()
 
                     detection_config = proc_data.get("detection_config", {})
                     enabled_labels = detection_config.get("enabled_labels", ["person"])
@@ -577,7 +726,7 @@ class StreamsService:
                             )
 
                             # Inference on region
-                            outputs = run_inference(onnx_session, preprocessed)
+                            outputs = run_inference(onnx_session, preprocessed, binding=inference_binding)
 
                             # Parse detections in region space
                             region_detections = parse_detections(
@@ -613,7 +762,7 @@ class StreamsService:
                         if should_run_fallback:
                             # Run full-frame YOLO inference
                             preprocessed, scale, padding = preprocess_frame(frame_bgr, target_size=target_size)
-                            outputs = run_inference(onnx_session, preprocessed)
+                            outputs = run_inference(onnx_session, preprocessed, binding=inference_binding)
                             all_detections = parse_detections(outputs, scale, padding, (height, width))
                         else:
                             logger.debug(f"[{stream_id}] No motion detected, no fallback needed yet")
@@ -680,6 +829,7 @@ class StreamsService:
                     else:
                         # No viewers - skip rendering to save CPU/GPU
                         proc_data["latest_frame"] = None
+                        proc_data.pop("latest_jpeg", None)
                         logger.debug(f"[{stream_id}] Skipping rendering - no viewers")
 
                     total_time_ms = (time.perf_counter() - pipeline_start) * 1000
@@ -697,7 +847,6 @@ class StreamsService:
 
                     # Record tracked objects by state
                     if tracked_objects:
-                        from ..models.motion import ObjectState
                         state_counts = {state.value: 0 for state in ObjectState}
                         for obj in tracked_objects:
                             state_counts[obj.state.value] += 1
@@ -705,17 +854,15 @@ class StreamsService:
                             metrics.tracked_objects_total.labels(stream_id=stream_id, state=state).set(count)
                     else:
                         # Reset all state counts to 0
-                        from ..models.motion import ObjectState
                         for state in ObjectState:
                             metrics.tracked_objects_total.labels(stream_id=stream_id, state=state.value).set(0)
 
                 except Exception as e:
                     logger.error(f"[{stream_id}] Detection pipeline error: {e}", exc_info=True)
 
-                # Maintain 5 FPS (200ms per frame)
-                elapsed = time.perf_counter() - pipeline_start
-                if elapsed < 0.2:
-                    await asyncio.sleep(0.2 - elapsed)
+                # No Python-side throttle: FFmpeg emits at 5fps (-r 5), so the
+                # blocking stdout read paces the loop. Sleeping here would only
+                # let a backlog build up in the pipe after a slow frame.
 
             except asyncio.CancelledError:
                 logger.info(f"[{stream_id}] Frame processor cancelled")
@@ -803,6 +950,8 @@ class StreamsService:
             # Pre-register (prevents race condition in get_frame)
             self.active_processes[stream_id] = {
                 "process": None,
+                "stdout": None,  # Frame pipe reader, set once FFmpeg spawns
+                "stdout_transport": None,
                 "buffer": bytearray(),
                 "detection_config": stream.get("detection", {}),
                 "stream_dimensions": None,  # Will be populated from FFprobe
@@ -813,15 +962,25 @@ class StreamsService:
                 "frame_count": 0,  # T039: Frame counter for tracking
             }
 
-            # Start subprocess
-            process = await asyncio.create_subprocess_exec(
-                *cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
+            # Start subprocess writing frames into an enlarged pipe
+            read_fd, write_fd = _create_frame_pipe()
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *cmd,
+                    stdout=write_fd,
+                    stderr=subprocess.PIPE
+                )
+            except Exception:
+                os.close(read_fd)
+                raise
+            finally:
+                os.close(write_fd)  # Child holds its own copy
+            stdout, stdout_transport = await _open_pipe_reader(read_fd)
 
             # Update with process
             self.active_processes[stream_id]["process"] = process
+            self.active_processes[stream_id]["stdout"] = stdout
+            self.active_processes[stream_id]["stdout_transport"] = stdout_transport
             logger.debug(f"FFmpeg started: PID={process.pid}")
 
             # Get stream dimensions (ALWAYS needed for detection)
@@ -842,14 +1001,7 @@ class StreamsService:
             logger.info(f"[{stream_id}] Started continuous frame processor background task")
 
             # Update config status
-            config = load_streams()
-            streams = config.get("streams", [])
-            for s in streams:
-                if s.get("id") == stream_id:
-                    s["status"] = "running"
-                    break
-            config["streams"] = streams
-            save_streams(config)
+            await self._set_stream_status(stream_id, "running")
             
             # Wait for initialization
             await asyncio.sleep(0.5)
@@ -864,17 +1016,10 @@ class StreamsService:
                 logger.error(f"FFmpeg stderr:\n{error_msg}")
                 
                 # Cleanup
-                self.active_processes.pop(stream_id, None)
+                self._close_stdout(self.active_processes.pop(stream_id, None))
                 
                 # Update status
-                config = load_streams()
-                streams = config.get("streams", [])
-                for s in streams:
-                    if s.get("id") == stream_id:
-                        s["status"] = "stopped"
-                        break
-                config["streams"] = streams
-                save_streams(config)
+                await self._set_stream_status(stream_id, "stopped")
                 
                 raise RuntimeError(f"FFmpeg failed (code {process.returncode})")
             
@@ -885,23 +1030,55 @@ class StreamsService:
             logger.error(f"Failed to start {stream_id}: {e}", exc_info=True)
             
             # Cleanup
-            self.active_processes.pop(stream_id, None)
+            self._close_stdout(self.active_processes.pop(stream_id, None))
             
             # Update status
             try:
-                config = load_streams()
-                streams = config.get("streams", [])
-                for s in streams:
-                    if s.get("id") == stream_id:
-                        s["status"] = "stopped"
-                        break
-                config["streams"] = streams
-                save_streams(config)
+                await self._set_stream_status(stream_id, "stopped")
             except Exception as config_err:
                 logger.error(f"Failed to update status: {config_err}")
             
             return False
     
+    async def _set_stream_status(self, stream_id: str, status: str) -> None:
+        """Persist a stream's status, batched with other status changes.
+        
+        Changes made within STATUS_WRITE_DELAY (e.g. several streams failing
+        on the same network drop) share one load/save; for a stream changed
+        twice, the latest status wins. Returns once the batch is written.
+        """
+        self._pending_statuses[stream_id] = status
+        if self._status_flush is None:
+            self._status_flush = asyncio.create_task(self._flush_stream_statuses())
+        # Shielded: a cancelled caller must not abort the shared write
+        await asyncio.shield(self._status_flush)
+    
+    async def _flush_stream_statuses(self) -> None:
+        """Write all pending status changes in one load-mutate-save cycle."""
+        await asyncio.sleep(STATUS_WRITE_DELAY)
+        
+        # Take the batch; changes queued from here on start the next one
+        pending, self._pending_statuses = self._pending_statuses, {}
+        self._status_flush = None
+        
+        async with config_update_lock:
+            config = await asyncio.to_thread(load_streams)
+            streams = config.get("streams", [])
+            for stream in streams:
+                status = pending.get(stream.get("id"))
+                if status is not None:
+                    stream["status"] = status
+            config["streams"] = streams
+            await asyncio.to_thread(save_streams, config)
+        
+        logger.debug(f"Persisted {len(pending)} stream status change(s)")
+
+    @staticmethod
+    def _close_stdout(proc_data: dict | None) -> None:
+        """Close the frame pipe transport of a (removed) process entry."""
+        if proc_data and proc_data.get("stdout_transport") is not None:
+            proc_data["stdout_transport"].close()
+
     async def stop_stream(self, stream_id: str) -> bool:
         """Stop FFmpeg processing gracefully."""
         if stream_id not in self.active_processes:
@@ -923,25 +1100,23 @@ class StreamsService:
                 object_tracker.reset()
                 logger.debug(f"[{stream_id}] ObjectTracker reset and cleaned up")
 
-            # Terminate FFmpeg process
-            process.terminate()
+            # Stop FFmpeg: SIGINT triggers its fast-exit path, unlike SIGTERM
+            # which can sit out a stalled RTSP read
             try:
+                process.send_signal(signal.SIGINT)
                 await asyncio.wait_for(process.wait(), timeout=STREAM_STOP_TIMEOUT)
-                logger.debug(f"FFmpeg terminated gracefully: {stream_id}")
+                logger.debug(f"FFmpeg exited gracefully: {stream_id}")
+            except ProcessLookupError:
+                logger.debug(f"FFmpeg already exited: {stream_id}")
             except asyncio.TimeoutError:
                 logger.warning(f"Timeout, killing: {stream_id}")
                 process.kill()
                 await process.wait()
             
+            self._close_stdout(proc_data)
+
             # Update status
-            config = load_streams()
-            streams = config.get("streams", [])
-            for s in streams:
-                if s.get("id") == stream_id:
-                    s["status"] = "stopped"
-                    break
-            config["streams"] = streams
-            save_streams(config)
+            await self._set_stream_status(stream_id, "stopped")
             
             logger.info(f"Stream stopped: {stream_id}")
             return True
@@ -978,11 +1153,21 @@ class StreamsService:
             # No frame available yet (or no viewers so no rendering)
             return (False, b'')
 
-        # JPEG encode only when viewer requests it (B7 optimization)
-        import cv2
+        # JPEG encode only when viewer requests it (B7 optimization), on the
+        # encode pool: cv2 releases the GIL while encoding, so the event
+        # loop keeps serving other streams and requests meanwhile. Each
+        # frame is encoded once; other viewers (and repeat polls before the
+        # next frame) share the same pending or finished result.
+        encoded = proc_data.get("latest_jpeg")
+        if encoded is None or encoded[0] is not latest_frame:
+            future = asyncio.get_running_loop().run_in_executor(
+                _jpeg_encode_executor, _encode_jpeg, latest_frame
+            )
+            encoded = (latest_frame, future)
+            proc_data["latest_jpeg"] = encoded
+
         try:
-            _, jpeg_bytes = cv2.imencode('.jpg', latest_frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-            return (True, jpeg_bytes.tobytes())
+            return (True, await asyncio.shield(encoded[1]))
         except Exception as e:
             logger.error(f"[{stream_id}] JPEG encoding error: {e}", exc_info=True)
             return (False, b'')
@@ -1023,57 +1208,9 @@ class StreamsService:
             logger.error(f"Frame read error for {stream_id}: {e}", exc_info=True)
             return None
 
-    async def _get_mjpeg_frame(self, stream_id: str, proc_data: dict) -> tuple[bool, bytes] | None:
-        """Extract MJPEG frame from buffer (original logic)."""
-        process = proc_data["process"]
-        buffer = proc_data["buffer"]
-
-        max_attempts = 50
-
-        for attempt in range(max_attempts):
-            # Check buffer for complete frame
-            start_idx = buffer.find(JPEG_START_MARKER)
-            if start_idx != -1:
-                end_idx = buffer.find(JPEG_END_MARKER, start_idx + 2)
-                if end_idx != -1:
-                    # Extract frame
-                    jpeg_data = bytes(buffer[start_idx:end_idx + 2])
-                    del buffer[:end_idx + 2]
-
-                    logger.debug(f"Frame extracted: {len(jpeg_data)} bytes")
-                    return (True, jpeg_data)
-
-            # Need more data
-            try:
-                chunk = await asyncio.wait_for(
-                    process.stdout.read(8192),
-                    timeout=FRAME_READ_TIMEOUT
-                )
-            except asyncio.TimeoutError:
-                logger.debug(f"Read timeout (attempt {attempt + 1}/{max_attempts})")
-                continue
-
-            if not chunk:
-                logger.error(f"FFmpeg stdout closed: {stream_id}")
-                return None
-
-            buffer.extend(chunk)
-
-            # Prevent unbounded growth (10MB limit)
-            if len(buffer) > 10 * 1024 * 1024:
-                logger.warning(f"Buffer overflow, resetting: {stream_id}")
-                buffer[:] = buffer[-1024*1024:]
-
-        # Max attempts reached
-        logger.error(f"Failed to extract frame after {max_attempts} attempts: {stream_id}")
-        return (False, b'')
-
     async def _get_frame_with_detection(self, stream_id: str, proc_data: dict) -> tuple[bool, bytes] | None:
         """Extract raw BGR24 frame, run detection, render, encode to JPEG."""
-        import numpy as np
-        import cv2
-        import time
-        from ..api.detection import get_onnx_session, get_yolo_config_singleton
+        from ..api.detection import get_onnx_session, get_inference_binding, get_yolo_config_singleton
         from ..services.detection import (
             preprocess_frame, run_inference, parse_detections,
             filter_detections, render_bounding_boxes
@@ -1083,6 +1220,7 @@ class StreamsService:
         pipeline_start = time.perf_counter()
 
         process = proc_data["process"]
+        stdout = proc_data["stdout"]
         buffer = proc_data["buffer"]
         dimensions = proc_data.get("stream_dimensions")
 
@@ -1099,7 +1237,7 @@ class StreamsService:
         while len(buffer) < frame_size:
             try:
                 chunk = await asyncio.wait_for(
-                    process.stdout.read(frame_size - len(buffer)),
+                    stdout.read(frame_size - len(buffer)),
                     timeout=FRAME_READ_TIMEOUT
                 )
             except asyncio.TimeoutError:
@@ -1159,7 +1297,7 @@ class StreamsService:
 
             # Inference
             inference_start = time.perf_counter()
-            outputs = run_inference(onnx_session, preprocessed)
+            outputs = run_inference(onnx_session, preprocessed, binding=get_inference_binding())
             inference_time_ms = (time.perf_counter() - inference_start) * 1000
             logger.debug(f"[{stream_id}] Inference: {inference_time_ms:.1f}ms")
 
@@ -1211,8 +1349,6 @@ class StreamsService:
         Returns:
             Tuple of (width, height)
         """
-        import json
-
         cmd = [
             "ffprobe",
             "-v", "quiet",
@@ -1257,14 +1393,13 @@ class StreamsService:
         exclude_index: int | None = None
     ) -> None:
         """Validate stream name is unique (case-insensitive)."""
-        normalized_name = normalize_stream_name(name)
-        
-        for i, stream in enumerate(streams):
-            if exclude_index is not None and i == exclude_index:
-                continue
-            
-            if normalize_stream_name(stream.get("name", "")) == normalized_name:
-                raise ValueError(f"Stream name '{name}' already exists")
+        existing_names = {
+            normalize_stream_name(stream.get("name", ""))
+            for i, stream in enumerate(streams)
+            if i != exclude_index
+        }
+        if normalize_stream_name(name) in existing_names:
+            raise ValueError(f"Stream name '{name}' already exists")
     
     def _get_default_ffmpeg_params(self, hw_accel_enabled: bool = True) -> list[str]:
         """Get default FFmpeg parameters for GPU backend.
@@ -1275,8 +1410,8 @@ class StreamsService:
         Returns:
             List of FFmpeg parameter strings with GPU acceleration
         """
-        # Use centralized config module
-        return get_default_ffmpeg_params(self.gpu_backend)
+        # Precomputed in __init__; copy since callers store it on the stream
+        return list(self._default_ffmpeg_params)
 
     def get_motion_metrics(self, stream_id: str):
         """Get current motion detection metrics for stream.
@@ -1309,8 +1444,6 @@ class StreamsService:
         Raises:
             ValueError: Invalid state filter
         """
-        from app.models.motion import ObjectState
-
         if stream_id not in self.active_processes:
             logger.warning(f"Tracked objects request for inactive stream: {stream_id}")
             return None
@@ -1350,39 +1483,67 @@ class StreamsService:
             logger.warning(f"FFmpeg stderr unavailable: {stream_id}")
             return
         
+        # Lines are buffered in arrival order and flushed STDERR_FLUSH_INTERVAL
+        # seconds after the first buffered line, at STDERR_BATCH_LINES lines,
+        # or right away on an error line. Consecutive lines of one severity
+        # share a log record, so chatty FFmpeg output costs one record per
+        # flush instead of one per line.
+        loop = asyncio.get_running_loop()
+        pending: list[tuple[int, str]] = []
+        flush_deadline = 0.0
+
+        def flush() -> None:
+            start = 0
+            for i in range(1, len(pending) + 1):
+                if i == len(pending) or pending[i][0] != pending[start][0]:
+                    messages = "\n".join(message for _, message in pending[start:i])
+                    logger.log(pending[start][0], f"FFmpeg [{stream_id}]: {messages}")
+                    start = i
+            pending.clear()
+
         try:
             while process.returncode is None:
+                # Nothing buffered: wait for output indefinitely
+                timeout = flush_deadline - loop.time() if pending else None
                 try:
-                    line = await asyncio.wait_for(
-                        process.stderr.readline(),
-                        timeout=1.0
-                    )
-                    
-                    if not line:
-                        break
-                    
-                    message = line.decode().strip()
-                    if not message:
-                        continue
-                    
-                    # Log by severity
-                    msg_lower = message.lower()
-                    if 'error' in msg_lower or 'fatal' in msg_lower:
-                        logger.error(f"FFmpeg [{stream_id}]: {message}")
-                    elif 'warning' in msg_lower:
-                        logger.warning(f"FFmpeg [{stream_id}]: {message}")
-                    elif 'deprecated' in msg_lower:
-                        logger.debug(f"FFmpeg [{stream_id}]: {message}")
-                    else:
-                        logger.debug(f"FFmpeg [{stream_id}]: {message}")
-                        
+                    line = await asyncio.wait_for(process.stderr.readline(), timeout=timeout)
                 except asyncio.TimeoutError:
+                    flush()
                     continue
-                
+
+                if not line:
+                    break
+
+                message = line.decode(errors="replace").strip()
+                if not message:
+                    continue
+
+                # Classify by severity; skip lines the logger would drop anyway
+                if _FFMPEG_ERROR_PATTERN.search(message):
+                    level = logging.ERROR
+                elif _FFMPEG_WARNING_PATTERN.search(message):
+                    level = logging.WARNING
+                else:
+                    level = logging.DEBUG
+                if not logger.isEnabledFor(level):
+                    continue
+
+                if not pending:
+                    flush_deadline = loop.time() + STDERR_FLUSH_INTERVAL
+                pending.append((level, message))
+                if (
+                    level >= logging.ERROR
+                    or len(pending) >= STDERR_BATCH_LINES
+                    or loop.time() >= flush_deadline
+                ):
+                    flush()
+
         except asyncio.CancelledError:
             logger.debug(f"FFmpeg stderr monitor cancelled: {stream_id}")
         except Exception as e:
             logger.error(f"Stderr monitor error for {stream_id}: {e}")
+        finally:
+            flush()
 
 
 logger.debug("StreamsService module loaded")
\ No newline at end of file
@@ -10,22 +10,80 @@ This module handles:
 Feature: 005-yolo-object-detection
 """
 
+import errno
 import os
+import shutil
+import sys
+import urllib.request
 import warnings
 from pathlib import Path
 from typing import Optional
+import numpy as np
 import onnxruntime as ort
 import logging
 
-# Suppress Ultralytics and PyTorch warnings
+# Suppress Ultralytics and PyTorch warnings. Ultralytics itself is imported
+# lazily where a .pt model is actually needed: it pulls in PyTorch, which
+# costs seconds and hundreds of MB for an inference-only process.
 os.environ['YOLO_VERBOSE'] = 'False'
 warnings.filterwarnings('ignore', category=UserWarning, module='ultralytics')
 warnings.filterwarnings('ignore', category=FutureWarning, module='torch')
 
-from ultralytics import YOLO
-
 logger = logging.getLogger(__name__)
 
+MODEL_DOWNLOAD_URL = "https://github.com/ultralytics/assets/releases/download/v8.3.0/{model_name}.pt"
+"""Ultralytics release asset URL for pretrained .pt weights."""
+
+MODEL_DOWNLOAD_TIMEOUT = 30.0
+"""Socket timeout (seconds) for the direct weights download; a stalled
+connection fails over to Ultralytics instead of hanging startup."""
+
+_FICLONE = 0x40049409
+"""Linux ioctl to clone a file's extents (reflink) on CoW filesystems."""
+
+OPTIMIZED_MODEL_SUFFIX = ".opt.onnx"
+"""Suffix of ORT-optimized graphs serialized next to exported models."""
+
+CUDA_GRAPH_CAPTURE_RUNS = 3
+"""Warmup runs through the binding; covers ORT's pre-capture runs plus the capture."""
+
+TENSORRT_PROVIDER = "TensorrtExecutionProvider"
+TRT_CACHE_DIRNAME = "trt_cache"
+"""TensorRT engine cache directory, created next to the model."""
+
+SUPPORTED_PRECISIONS = ("fp32", "fp16")
+"""ONNX export precisions (fp16 halves weight/activation memory traffic on GPU)."""
+
+
+def onnx_model_filename(model_name: str, image_size: int, precision: str = "fp32") -> str:
+    """
+    Build the cached ONNX filename for a model variant.
+
+    fp32 keeps the historical ``{model}_{size}.onnx`` name so existing
+    caches stay valid; other precisions append ``_{precision}``.
+
+    Args:
+        model_name: YOLO model variant (e.g., "yolo11n")
+        image_size: Square input size
+        precision: Export precision (see SUPPORTED_PRECISIONS)
+
+    Returns:
+        ONNX filename (no directory)
+
+    Raises:
+        ValueError: If precision is not supported
+    """
+    if precision not in SUPPORTED_PRECISIONS:
+        if precision == "int8":
+            # Static INT8 needs a calibration set of representative frames,
+            # which this app does not have; dynamic quantization emits
+            # ConvInteger, which GPU EPs do not run.
+            raise ValueError("INT8 export is not supported (requires calibration data)")
+        raise ValueError(f"Unsupported precision '{precision}' (expected one of {SUPPORTED_PRECISIONS})")
+    if precision == "fp32":
+        return f"{model_name}_{image_size}.onnx"
+    return f"{model_name}_{image_size}_{precision}.onnx"
+
 
 def load_yolo_model(model_name: str, model_dir: str = "/app/models") -> Path:
     """
@@ -46,37 +104,52 @@ def load_yolo_model(model_name: str, model_dir: str = "/app/models") -> Path:
 
     model_pt = model_dir_path / f"{model_name}.pt"
 
-    if model_pt.exists():
+    # EAFP throughout: one stat()/rename per path instead of exists() + use
+    try:
+        model_pt.stat()
         logger.info(f"Model already cached: {model_pt}")
-        print(f"✅ Model already cached: {model_pt}")
         return model_pt
+    except FileNotFoundError:
+        pass
+
+    # Fetch the weights directly; only fall back to Ultralytics' own
+    # downloader (and its PyTorch import) for names not in the release
+    url = MODEL_DOWNLOAD_URL.format(model_name=model_name)
+    partial_pt = model_pt.with_name(f"{model_pt.name}.part")
+    try:
+        logger.info(f"Downloading {url}...")
+        with urllib.request.urlopen(url, timeout=MODEL_DOWNLOAD_TIMEOUT) as response, \
+                open(partial_pt, "wb") as f:
+            shutil.copyfileobj(response, f)
+        os.replace(partial_pt, model_pt)
+        logger.info(f"Model downloaded and cached: {model_pt}")
+        return model_pt
+    except Exception as e:
+        partial_pt.unlink(missing_ok=True)
+        logger.warning(f"Direct download of {model_name}.pt failed ({e}), falling back to Ultralytics")
 
     try:
-        logger.info(f"Downloading {model_name}.pt...")
-        print(f"📥 Downloading {model_name}.pt...")
+        from ultralytics import YOLO
         # YOLO() auto-downloads model to ~/.ultralytics/models
         # We pass the target path to export later, but the .pt file stays in default location
         model = YOLO(f"{model_name}.pt")
 
-        # Check if model was downloaded to default location
+        # Link or copy from the default location into our cache directory
         default_model = Path.home() / ".ultralytics" / "models" / f"{model_name}.pt"
-        if default_model.exists():
-            # Create symlink or copy to our cache directory for consistency
-            import shutil
-            if not model_pt.exists():
-                logger.debug(f"Copying model from {default_model} to {model_pt}")
-                shutil.copy2(str(default_model), str(model_pt))
+        try:
+            _link_or_copy(default_model, model_pt)
             logger.info(f"Model downloaded and cached: {model_pt}")
-            print(f"✅ Model downloaded and cached: {model_pt}")
             return model_pt
+        except FileNotFoundError:
+            pass
 
         # If not in default location, model might already be at target
-        if model_pt.exists():
-            logger.info(f"Model found at: {model_pt}")
-            print(f"✅ Model found at: {model_pt}")
-            return model_pt
-
-        raise FileNotFoundError(f"Model download succeeded but file not found at expected locations")
+        try:
+            model_pt.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Model download succeeded but file not found at expected locations")
+        logger.info(f"Model found at: {model_pt}")
+        return model_pt
     except Exception as e:
         logger.error(f"Failed to download YOLO model {model_name}: {e}", exc_info=True)
         raise RuntimeError(f"Failed to download YOLO model {model_name}: {e}")
@@ -87,7 +160,8 @@ def export_to_onnx(
     image_size: int,
     model_dir: str = "/app/models",
     simplify: bool = True,
-    dynamic: bool = False
+    dynamic: bool = False,
+    precision: str = "fp32"
 ) -> Path:
     """
     Export YOLO model to ONNX format.
@@ -98,68 +172,66 @@ def export_to_onnx(
         model_dir: Directory containing .pt model
         simplify: Enable ONNX simplification (recommended)
         dynamic: Enable dynamic input shapes (not recommended for production)
+        precision: "fp32" or "fp16" (fp16 export needs a CUDA device;
+            Ultralytics falls back to fp32 otherwise)
 
     Returns:
         Path to exported .onnx model file
 
     Raises:
+        ValueError: If precision is not supported
         RuntimeError: If ONNX export fails
     """
     model_dir_path = Path(model_dir)
     model_pt = model_dir_path / f"{model_name}.pt"
-    model_onnx = model_dir_path / f"{model_name}_{image_size}.onnx"
+    model_onnx = model_dir_path / onnx_model_filename(model_name, image_size, precision)
 
-    if model_onnx.exists():
+    try:
+        model_onnx.stat()
         logger.info(f"ONNX model already exists: {model_onnx}")
-        print(f"✅ ONNX model already exists: {model_onnx}")
         return model_onnx
+    except FileNotFoundError:
+        pass
 
-    if not model_pt.exists():
+    try:
+        model_pt.stat()
+    except FileNotFoundError:
         logger.error(f"PyTorch model not found: {model_pt}")
         raise RuntimeError(f"PyTorch model not found: {model_pt}")
 
     try:
-        logger.info(f"Exporting {model_name}.pt to ONNX format (size={image_size})...")
-        print(f"⏳ Exporting {model_name}.pt to ONNX format (size={image_size})...")
+        logger.info(f"Exporting {model_name}.pt to ONNX format (size={image_size}, precision={precision})...")
+        from ultralytics import YOLO
         model = YOLO(str(model_pt))
         model.export(
             format="onnx",
             imgsz=image_size,
             simplify=simplify,
-            dynamic=dynamic
+            dynamic=dynamic,
+            half=precision == "fp16"
         )
 
         # Ultralytics exports to current working directory with name model_name.onnx
-        # We need to copy to model_dir with image size in name
-        import shutil
-        import os
-
-        # Check current directory first (where export happens)
+        # (or next to the .pt); move it to model_dir with image size in name.
+        # Candidates are tried in priority order, current directory first.
         cwd_onnx = Path.cwd() / f"{model_name}.onnx"
         exported_onnx = model_dir_path / f"{model_name}.onnx"
 
-        source_file = None
-        if cwd_onnx.exists() and cwd_onnx != model_onnx:
-            source_file = cwd_onnx
-        elif exported_onnx.exists() and exported_onnx != model_onnx:
-            source_file = exported_onnx
-        elif model_onnx.exists():
-            # Already at target location
-            print(f"✅ ONNX export complete: {model_onnx}")
-            print(f"📦 Model size: {model_onnx.stat().st_size / (1024*1024):.1f} MB")
-            return model_onnx
-
-        if source_file:
-            # Use copy + remove instead of move to handle cross-device links
-            logger.debug(f"Copying ONNX from {source_file} to {model_onnx}")
-            shutil.copy2(str(source_file), str(model_onnx))
-            source_file.unlink()  # Remove source after successful copy
-            logger.info(f"ONNX export complete: {model_onnx} ({model_onnx.stat().st_size / (1024*1024):.1f} MB)")
-            print(f"✅ ONNX export complete: {model_onnx}")
-            print(f"📦 Model size: {model_onnx.stat().st_size / (1024*1024):.1f} MB")
-        else:
+        for source_file in (cwd_onnx, exported_onnx):
+            try:
+                _move_model_file(source_file, model_onnx)
+                logger.debug(f"Moved ONNX from {source_file} to {model_onnx}")
+                break
+            except FileNotFoundError:
+                continue
+
+        # Also covers an export written straight to the target location
+        try:
+            onnx_size = model_onnx.stat().st_size
+        except FileNotFoundError:
             logger.error(f"ONNX export succeeded but file not found at {cwd_onnx} or {exported_onnx}")
             raise RuntimeError(f"ONNX export succeeded but file not found at {cwd_onnx} or {exported_onnx}")
+        logger.info(f"ONNX export complete: {model_onnx} ({onnx_size / (1024*1024):.1f} MB)")
 
         return model_onnx
     except Exception as e:
@@ -167,18 +239,76 @@ def export_to_onnx(
         raise RuntimeError(f"Failed to export YOLO model to ONNX: {e}")
 
 
+def _copy_model_file(src: Path, dst: Path) -> None:
+    """
+    Copy a model file, cloning extents where the filesystem allows.
+
+    Tries a FICLONE reflink (btrfs, XFS with reflink=1: no data copied),
+    then shutil.copyfile, which uses in-kernel sendfile/copy_file_range
+    on Linux. Metadata is not copied (copy2's extra syscalls buy nothing
+    for cache files).
+    """
+    if sys.platform == "linux":
+        try:
+            import fcntl
+            with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+                fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+            return
+        except OSError:
+            pass  # No reflink support (or cross-device) - plain copy below
+    shutil.copyfile(src, dst)
+
+
+def _link_or_copy(src: Path, dst: Path) -> None:
+    """Hard-link src to dst when both share a filesystem, else copy it."""
+    try:
+        os.link(src, dst)
+    except OSError:
+        _copy_model_file(src, dst)
+
+
+def _move_model_file(src: Path, dst: Path) -> None:
+    """Rename src to dst, falling back to copy + remove across devices."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _copy_model_file(src, dst)
+        src.unlink()
+
+
 def create_onnx_session(
     model_path: str,
     gpu_backend: str,
-    fail_fast: bool = True
+    fail_fast: bool = True,
+    cudnn_algo_search: str = "HEURISTIC",
+    enable_cuda_graph: bool = False
 ) -> ort.InferenceSession:
     """
     Create ONNX Runtime inference session with GPU backend selection.
 
+    The session is warmed up with one zero-filled inference before it is
+    returned, so first-frame latency is paid at startup instead of on the
+    first detection.
+
+    With enable_cuda_graph (nvidia only) the CUDA EP records the kernel
+    sequence once and replays it per frame. Such sessions can only run
+    through IOBinding with device buffers, so warmup (and capture) is left
+    to create_inference_binding(); create such sessions through
+    create_session_with_binding(), which drops the graph if capture fails.
+    If session construction itself fails (nodes outside the CUDA EP) the
+    session is recreated without it here.
+
     Args:
         model_path: Path to ONNX model file
         gpu_backend: GPU backend ("nvidia", "amd", "intel", "none")
         fail_fast: Raise error if GPU backend unavailable (default: True)
+        cudnn_algo_search: cuDNN conv algorithm search for CUDA
+            ("HEURISTIC", "EXHAUSTIVE" or "DEFAULT"). EXHAUSTIVE benchmarks
+            every conv per input shape and can stall startup for seconds.
+        enable_cuda_graph: Capture the model as a CUDA graph (disables
+            TensorRT, which manages its own execution)
 
     Returns:
         ONNX Runtime InferenceSession
@@ -193,16 +323,123 @@ def create_onnx_session(
         logger.error(f"ONNX model not found: {model_path}")
         raise FileNotFoundError(f"ONNX model not found: {model_path}")
 
+    enable_cuda_graph = enable_cuda_graph and gpu_backend == "nvidia"
+    providers = _build_providers(
+        gpu_backend,
+        cudnn_algo_search,
+        model_dir=None if enable_cuda_graph else model_path_obj.parent,
+        enable_cuda_graph=enable_cuda_graph
+    )
+    provider_names = [p if isinstance(p, str) else p[0] for p in providers]
+    logger.debug(f"Execution providers configured: {provider_names}")
+
+    # Create session with optimizations. ORT_ENABLE_ALL adds layout
+    # transforms that can insert Memcpy nodes and split the graph on GPU
+    # providers; the Ultralytics export is already simplified, so the
+    # extended tier is the sweet spot. The optimized graph is serialized
+    # once per backend and loaded directly on later starts. TensorRT fuses
+    # the graph itself and caches its engines, and ORT cannot serialize a
+    # graph containing TensorRT-compiled nodes, so it skips the sidecar.
+    session_options = ort.SessionOptions()
+    optimized_path = _optimized_model_path(model_path_obj, gpu_backend)
+    if TENSORRT_PROVIDER in provider_names:
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+    elif _is_fresh_optimized_model(optimized_path, model_path_obj):
+        logger.info(f"Loading pre-optimized ONNX graph: {optimized_path}")
+        model_path = str(optimized_path)
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_DISABLE_ALL
+    else:
+        session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_EXTENDED
+        if os.access(str(model_path_obj.parent), os.W_OK):
+            session_options.optimized_model_filepath = str(optimized_path)
+    # Single fixed-shape input: memory pattern planning and the CPU arena
+    # add resident memory without improving throughput
+    session_options.enable_mem_pattern = False
+    session_options.enable_cpu_mem_arena = False
+
+    try:
+        logger.debug("Creating ONNX Runtime inference session...")
+        session = ort.InferenceSession(
+            str(model_path),
+            sess_options=session_options,
+            providers=providers
+        )
+        logger.debug(f"Session created successfully")
+    except Exception as e:
+        if enable_cuda_graph:
+            logger.warning(f"CUDA graph capture unavailable for this model, retrying without it: {e}")
+            return create_onnx_session(str(model_path_obj), gpu_backend, fail_fast, cudnn_algo_search)
+        logger.error(f"Failed to create ONNX Runtime session: {e}", exc_info=True)
+        raise RuntimeError(f"Failed to create ONNX Runtime session: {e}")
+
+    # Fail-fast GPU backend validation
+    active_provider = session.get_providers()[0]
+    logger.info(f"Active execution provider: {active_provider}")
+
+    if fail_fast and gpu_backend != "none" and active_provider == "CPUExecutionProvider":
+        logger.error(f"GPU backend '{gpu_backend}' unavailable - fell back to CPU")
+        logger.error(f"Available providers: {ort.get_available_providers()}")
+        raise RuntimeError(
+            f"GPU backend '{gpu_backend}' unavailable. "
+            f"ONNX Runtime fell back to CPU. "
+            f"Available providers: {ort.get_available_providers()}"
+        )
+
+    if not enable_cuda_graph:
+        _warmup_session(session)
+
+    logger.info(f"ONNX Runtime session created: provider={active_provider}, model={model_path}")
+
+    return session
+
+
+def _build_providers(
+    gpu_backend: str,
+    cudnn_algo_search: str = "HEURISTIC",
+    model_dir: Optional[Path] = None,
+    enable_cuda_graph: bool = False
+) -> list:
+    """
+    Build the ONNX Runtime execution provider list for a GPU backend.
+
+    On NVIDIA, TensorRT is placed ahead of CUDA when the installed ONNX
+    Runtime build ships it; CUDA then runs any ops TensorRT rejects.
+
+    Args:
+        gpu_backend: GPU backend ("nvidia", "amd", "intel", "none")
+        cudnn_algo_search: cuDNN conv algorithm search for CUDA
+        model_dir: Directory for the TensorRT engine cache (TensorRT is
+            skipped without one, since uncached engine builds take 30+ s)
+        enable_cuda_graph: Enable CUDA graph capture in the CUDA EP
+
+    Returns:
+        Provider list (GPU provider first, CPU fallback last)
+    """
     providers = []
 
     # Configure GPU execution provider based on backend
     if gpu_backend == "nvidia":
+        if model_dir is not None and TENSORRT_PROVIDER in ort.get_available_providers():
+            logger.debug("Configuring TensorRT execution provider")
+            providers.append((TENSORRT_PROVIDER, {
+                'device_id': 0,
+                # Built engines are serialized here and reloaded in <1 s
+                'trt_engine_cache_enable': True,
+                'trt_engine_cache_path': str(model_dir / TRT_CACHE_DIRNAME),
+                'trt_fp16_enable': True,
+                'trt_max_workspace_size': 2 << 30,
+            }))
         logger.debug("Configuring CUDA execution provider")
         providers.append(('CUDAExecutionProvider', {
             'device_id': 0,
-            'arena_extend_strategy': 'kNextPowerOfTwo',
-            'gpu_mem_limit': 2 * 1024 * 1024 * 1024,  # 2 GB
-            'cudnn_conv_algo_search': 'EXHAUSTIVE',
+            # Grow the arena by exactly what is requested; kNextPowerOfTwo
+            # over-allocates VRAM that FFmpeg's decoder could use instead.
+            # No gpu_mem_limit: it only caps the arena, not cuDNN/cuBLAS
+            # workspaces, so it causes OOMs without bounding real usage.
+            'arena_extend_strategy': 'kSameAsRequested',
+            'cudnn_conv_algo_search': cudnn_algo_search,
+            'cudnn_conv_use_max_workspace': '0',
+            'enable_cuda_graph': '1' if enable_cuda_graph else '0',
         }))
     elif gpu_backend == "amd":
         logger.debug("Configuring ROCm execution provider")
@@ -217,43 +454,194 @@ def create_onnx_session(
 
     # Always add CPU as fallback (unless fail_fast prevents it)
     providers.append('CPUExecutionProvider')
-    logger.debug(f"Execution providers configured: {[p if isinstance(p, str) else p[0] for p in providers]}")
 
-    # Create session with optimizations
-    session_options = ort.SessionOptions()
-    session_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return providers
+
+
+def _optimized_model_path(model_path: Path, gpu_backend: str) -> Path:
+    """
+    Path of the serialized optimized graph for a model and GPU backend.
+
+    Optimized graphs contain provider-specific fused nodes, so each
+    backend gets its own file (e.g. yolo11n_640.nvidia.opt.onnx).
+    """
+    return model_path.with_name(f"{model_path.stem}.{gpu_backend}{OPTIMIZED_MODEL_SUFFIX}")
+
 
+def _is_fresh_optimized_model(optimized_path: Path, model_path: Path) -> bool:
+    """Check the optimized graph exists and is not older than its source model."""
     try:
-        logger.debug("Creating ONNX Runtime inference session...")
-        session = ort.InferenceSession(
-            str(model_path),
-            sess_options=session_options,
-            providers=providers
-        )
-        logger.debug(f"Session created successfully")
+        return os.stat(str(optimized_path)).st_mtime >= os.stat(str(model_path)).st_mtime
+    except OSError:
+        return False
+
+
+def _warmup_session(session: ort.InferenceSession) -> None:
+    """
+    Run one zero-filled inference to initialize kernels and allocations.
+
+    Dynamic dimensions are filled with 1. Failures are logged and ignored
+    since warmup is only an optimization.
+
+    Args:
+        session: ONNX Runtime session to warm up
+    """
+    try:
+        model_input = session.get_inputs()[0]
+        shape = [dim if isinstance(dim, int) and dim > 0 else 1 for dim in model_input.shape]
+        dtype = np.float16 if model_input.type == "tensor(float16)" else np.float32
+        session.run(None, {model_input.name: np.zeros(shape, dtype=dtype)})
+        logger.debug(f"Session warmup complete: input={model_input.name} shape={shape}")
     except Exception as e:
-        logger.error(f"Failed to create ONNX Runtime session: {e}", exc_info=True)
-        raise RuntimeError(f"Failed to create ONNX Runtime session: {e}")
+        logger.warning(f"Session warmup failed (first inference may be slow): {e}")
 
-    # Fail-fast GPU backend validation
-    active_provider = session.get_providers()[0]
-    logger.info(f"Active execution provider: {active_provider}")
 
-    if fail_fast and gpu_backend != "none" and active_provider == "CPUExecutionProvider":
-        logger.error(f"GPU backend '{gpu_backend}' unavailable - fell back to CPU")
-        logger.error(f"Available providers: {ort.get_available_providers()}")
-        raise RuntimeError(
-            f"GPU backend '{gpu_backend}' unavailable. "
-            f"ONNX Runtime fell back to CPU. "
-            f"Available providers: {ort.get_available_providers()}"
+class InferenceBinding:
+    """
+    Pre-allocated inference buffers bound to a session via IOBinding.
+
+    The input lives on the session's device and is refreshed in place each
+    run, and the output is written straight into a reused host array, so
+    no per-frame input/output tensors are allocated. Requires a model with
+    static input/output shapes (the default export).
+
+    For CUDA graph sessions both buffers must stay at fixed device
+    addresses, so the output is bound on the GPU as well and copied to the
+    host after each replay. The graph is captured at construction.
+
+    Note:
+        The array returned by run() is overwritten by the next run; copy
+        it if it must outlive the current frame.
+    """
+
+    def __init__(self, session: ort.InferenceSession, device: str = "cpu") -> None:
+        model_input = session.get_inputs()[0]
+        model_output = session.get_outputs()[0]
+        input_dtype = np.float16 if model_input.type == "tensor(float16)" else np.float32
+        output_dtype = np.float16 if model_output.type == "tensor(float16)" else np.float32
+        self.session = session
+        self.device = device
+        self.uses_cuda_graph = _uses_cuda_graph(session)
+        self._input_dtype = input_dtype
+        self._input = ort.OrtValue.ortvalue_from_shape_and_type(
+            model_input.shape, input_dtype, device, 0
         )
+        self._binding = session.io_binding()
+        self._binding.bind_ortvalue_input(model_input.name, self._input)
+        if self.uses_cuda_graph:
+            self._output = ort.OrtValue.ortvalue_from_shape_and_type(
+                model_output.shape, output_dtype, device, 0
+            )
+            self._output_array = None
+        else:
+            self._output_array = np.empty(model_output.shape, dtype=output_dtype)
+            self._output = ort.OrtValue.ortvalue_from_numpy(self._output_array)
+        self._binding.bind_ortvalue_output(model_output.name, self._output)
+
+        if self.uses_cuda_graph:
+            # ORT runs a few regular passes before it captures the graph
+            zeros = np.zeros(model_input.shape, dtype=input_dtype)
+            for _ in range(CUDA_GRAPH_CAPTURE_RUNS):
+                self.run(zeros)
+            logger.info("CUDA graph captured for YOLO inference")
+
+    def run(
+        self,
+        input_array: np.ndarray,
+        run_options: Optional[ort.RunOptions] = None
+    ) -> np.ndarray:
+        """
+        Copy input into the bound buffer and run inference.
+
+        Args:
+            input_array: Preprocessed input matching the model input shape
+            run_options: Optional per-run options
+
+        Returns:
+            Model output (reused buffer, see class note)
+        """
+        if input_array.dtype != self._input_dtype:
+            input_array = input_array.astype(self._input_dtype)
+        self._input.update_inplace(input_array)
+        self.session.run_with_iobinding(self._binding, run_options)
+        if self._output_array is None:
+            return self._output.numpy()  # Device output (CUDA graph)
+        return self._output_array
+
+
+def _uses_cuda_graph(session: ort.InferenceSession) -> bool:
+    """Whether a session was created with CUDA graph capture enabled."""
+    cuda_options = session.get_provider_options().get("CUDAExecutionProvider", {})
+    return cuda_options.get("enable_cuda_graph") == "1"
+
+
+def create_inference_binding(session: ort.InferenceSession) -> Optional[InferenceBinding]:
+    """
+    Create an InferenceBinding for a session if its shapes allow it.
 
-    logger.info(f"ONNX Runtime session created successfully")
-    print(f"✅ ONNX Runtime session created")
-    print(f"   Active provider: {active_provider}")
-    print(f"   Model: {model_path}")
+    The input buffer is placed on the GPU for CUDA sessions (host→device
+    copy straight into a fixed allocation) and in host memory otherwise.
 
-    return session
+    Args:
+        session: ONNX Runtime inference session
+
+    Returns:
+        InferenceBinding, or None if the model has dynamic shapes or
+        binding fails (callers fall back to session.run)
+    """
+    try:
+        shapes = [session.get_inputs()[0].shape, session.get_outputs()[0].shape]
+        if not all(isinstance(dim, int) for shape in shapes for dim in shape):
+            logger.info("Model has dynamic shapes - IOBinding disabled")
+            return None
+        active_provider = session.get_providers()[0]
+        device = "cuda" if active_provider in (TENSORRT_PROVIDER, "CUDAExecutionProvider") else "cpu"
+        binding = InferenceBinding(session, device=device)
+        logger.info(f"IOBinding enabled: device={device}, input={shapes[0]}, output={shapes[1]}")
+        return binding
+    except Exception as e:
+        logger.warning(f"IOBinding unavailable, using session.run: {e}")
+        return None
+
+
+def create_session_with_binding(
+    model_path: str,
+    gpu_backend: str,
+    fail_fast: bool = True,
+    cudnn_algo_search: str = "HEURISTIC",
+    enable_cuda_graph: bool = False
+) -> tuple[ort.InferenceSession, Optional[InferenceBinding]]:
+    """
+    Create an ONNX Runtime session and its InferenceBinding.
+
+    A CUDA graph session can only run through IOBinding, and the graph is
+    captured when the binding is built. If that fails (capture error or
+    dynamic shapes), the session is recreated without the graph (and
+    warmed up) so inference can still fall back to session.run().
+
+    Args:
+        model_path: Path to ONNX model file
+        gpu_backend: GPU backend ("nvidia", "amd", "intel", "none")
+        fail_fast: Raise error if GPU backend unavailable (default: True)
+        cudnn_algo_search: cuDNN conv algorithm search for CUDA
+        enable_cuda_graph: Capture the model as a CUDA graph
+
+    Returns:
+        (session, binding); binding is None if IOBinding is unavailable
+
+    Raises:
+        RuntimeError: If GPU backend requested but unavailable (when fail_fast=True)
+        FileNotFoundError: If model file doesn't exist
+    """
+    session = create_onnx_session(
+        model_path, gpu_backend, fail_fast, cudnn_algo_search, enable_cuda_graph
+    )
+    binding = create_inference_binding(session)
+    if binding is None and _uses_cuda_graph(session):
+        logger.warning("CUDA graph could not be captured, recreating session without it")
+        session = create_onnx_session(model_path, gpu_backend, fail_fast, cudnn_algo_search)
+        binding = create_inference_binding(session)
+    return session, binding
 
 
 def list_cached_models(model_dir: str = "/app/models") -> list[dict]:
@@ -266,19 +654,25 @@ def list_cached_models(model_dir: str = "/app/models") -> list[dict]:
     Returns:
         List of model metadata dictionaries
     """
-    model_dir_path = Path(model_dir)
-    if not model_dir_path.exists():
-        return []
-
     models = []
-    for onnx_file in model_dir_path.glob("*.onnx"):
-        stat = onnx_file.stat()
-        models.append({
-            "model_name": onnx_file.stem,
-            "file_path": str(onnx_file),
-            "file_size_bytes": stat.st_size,
-            "download_date": stat.st_ctime,
-        })
+    try:
+        # scandir's DirEntry carries the file type from readdir and caches
+        # stat(), so each model costs one syscall and no Path allocation
+        with os.scandir(model_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".onnx") or entry.name.endswith(OPTIMIZED_MODEL_SUFFIX):
+                    continue  # Non-models and derived optimized graphs
+                if not entry.is_file():
+                    continue
+                stat = entry.stat()
+                models.append({
+                    "model_name": entry.name[:-len(".onnx")],
+                    "file_path": entry.path,
+                    "file_size_bytes": stat.st_size,
+                    "download_date": stat.st_ctime,
+                })
+    except FileNotFoundError:
+        return []
 
     return models
 
@@ -303,6 +697,10 @@ def delete_cached_model(model_name: str, model_dir: str = "/app/models") -> int:
 
     file_size = model_path.stat().st_size
     model_path.unlink()
-    print(f"🗑️ Deleted model: {model_path} ({file_size / (1024*1024):.1f} MB)")
+
+    # Optimized graphs derived from this model are now stale
+    for optimized_path in model_path.parent.glob(f"{model_name}.*{OPTIMIZED_MODEL_SUFFIX}"):
+        optimized_path.unlink(missing_ok=True)
+    logger.info(f"Deleted model: {model_path} ({file_size / (1024*1024):.1f} MB)")
 
     return file_size
@@ -22,11 +22,16 @@ Logging Strategy:
 """
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import copy
 import logging
 import uuid
-from typing import Final
+from typing import Any, Final
 
-from ..config_io import load_streams, save_streams
+from pydantic import TypeAdapter
+
+from ..config_io import load_streams, save_streams, get_config_stamp, config_update_lock
 from ..models.zone import Zone, NewZone, EditZone
 from ..utils.strings import normalize_stream_name
 
@@ -35,6 +40,220 @@ logger = logging.getLogger(__name__)
 ZONES_KEY: Final[str] = "zones"
 """Key for zones array within stream config."""
 
+_ZONE_LIST_ADAPTER: Final[TypeAdapter[list[Zone]]] = TypeAdapter(list[Zone])
+"""Validates and serializes a stream's zones for the list endpoint."""
+
+
+
+class _ConfigSnapshot:
+    """Parsed config plus lookup indexes derived from it.
+    
+    Indexes hold list positions and IDs rather than dict references, so
+    they stay valid for deep copies of the config.
+    
+    Attributes:
+        stamp: Config file (mtime_ns, size) this snapshot was parsed at
+        config: Pristine parsed config (never handed out directly)
+        stream_index: {stream_id: position in config["streams"]}
+        zone_index: {(stream_id, zone_id): position in that stream's zones}
+    """
+    
+    __slots__ = (
+        "stamp", "config", "stream_index", "zone_index",
+        "_zone_names", "_zones_json"
+    )
+    
+    def __init__(self, stamp: tuple[int, int] | None, config: dict[str, Any]) -> None:
+        self.stamp = stamp
+        self.config = config
+        streams = config.get("streams", [])
+        self.stream_index: dict[str, int] = {
+            stream.get("id"): i for i, stream in enumerate(streams)
+        }
+        self.zone_index: dict[tuple[str, str], int] = {
+            (stream.get("id"), zone.get("id")): j
+            for stream in streams
+            for j, zone in enumerate(stream.get(ZONES_KEY, []))
+        }
+        self._zone_names: dict[str, dict[str, str]] = {}
+        self._zones_json: dict[str, bytes] = {}
+    
+    def stream_zones(self, stream_id: str) -> list[dict]:
+        """Get the pristine zone list of a stream (empty if not found)."""
+        i = self.stream_index.get(stream_id)
+        return self.config["streams"][i].get(ZONES_KEY, []) if i is not None else []
+    
+    def zone(self, stream_id: str, zone_id: str) -> dict | None:
+        """Get the pristine zone dict by ID (O(1); do not mutate)."""
+        j = self.zone_index.get((stream_id, zone_id))
+        return self.stream_zones(stream_id)[j] if j is not None else None
+    
+    def zone_names(self, stream_id: str) -> dict[str, str]:
+        """Get {normalized zone name: zone_id} for a stream (built lazily).
+        
+        Names are normalized once per config change instead of on every
+        uniqueness check.
+        """
+        names = self._zone_names.get(stream_id)
+        if names is None:
+            names = {
+                normalize_stream_name(zone.get("name", "")): zone.get("id")
+                for zone in self.stream_zones(stream_id)
+            }
+            self._zone_names[stream_id] = names
+        return names
+    
+    def zones_json(self, stream_id: str) -> bytes:
+        """Get a stream's zones validated and serialized as JSON (built lazily).
+        
+        Validation and serialization run once per config change instead of
+        on every list request.
+        """
+        body = self._zones_json.get(stream_id)
+        if body is None:
+            zones = _ZONE_LIST_ADAPTER.validate_python(self.stream_zones(stream_id))
+            body = _ZONE_LIST_ADAPTER.dump_json(zones)
+            self._zones_json[stream_id] = body
+        return body
+    
+    def seed_zone_names(self, zone_names: dict[str, dict[str, str]]) -> None:
+        """Install name maps maintained incrementally by a mutation."""
+        self._zone_names.update(zone_names)
+    
+    def inherit(self, previous: _ConfigSnapshot, changed: set[str]) -> None:
+        """Reuse previous's derived per-stream data for unchanged streams.
+        
+        A mutation edits one stream's zone list in place, so the names and
+        JSON already built for every other stream still hold.
+        
+        Args:
+            previous: Snapshot the mutated config was copied from
+            changed: IDs of streams whose zones were modified
+        """
+        for derived, inherited in (
+            (self._zone_names, previous._zone_names),
+            (self._zones_json, previous._zones_json),
+        ):
+            for stream_id, value in inherited.items():
+                if stream_id not in changed:
+                    derived.setdefault(stream_id, value)
+
+
+# Last snapshot, keyed by file (mtime, size). Module-level so every
+# ZonesService shares it and the YAML is parsed (and indexed) once per
+# change.
+_config_cache: _ConfigSnapshot | None = None
+
+# Delay before flushing staged writes, letting a burst of zone edits
+# (e.g. dragging polygon vertices) share one save_streams call.
+WRITE_COALESCE_DELAY: Final[float] = 0.01
+
+# Stamp of a snapshot staged in memory but not yet flushed to disk. Such a
+# snapshot is newer than the file and is served as-is until the flush; the
+# batch holds config_update_lock meanwhile, so no other writer can change
+# the file underneath it.
+_PENDING_STAMP: Final[tuple[int, int]] = (-1, -1)
+
+
+class _WriteCoalescer:
+    """Batches staged config writes into a single save_streams call.
+    
+    Mutations run inside staging() and stage their config there, then
+    await the returned future; the first one schedules a flush that waits
+    WRITE_COALESCE_DELAY, writes only the latest staged config, and
+    resolves every waiter in the batch.
+    
+    The shared config_update_lock is taken by the first mutation of a batch
+    and released by the flush once the batch is on disk, so stream and
+    detection writers can't load or save the file while staged zone
+    changes are pending.
+    """
+    
+    def __init__(self) -> None:
+        self._config: dict[str, Any] | None = None
+        self._waiters: list[asyncio.Future] = []
+        self._task: asyncio.Task | None = None
+        self._stage_lock = asyncio.Lock()  # Serializes zone read-modify-stage cycles
+        self._holds_config_lock = False  # True while a batch is open
+    
+    @contextlib.asynccontextmanager
+    async def staging(self):
+        """Run a zone load-mutate-stage cycle under the shared config lock.
+        
+        Joins the open batch if there is one; otherwise takes
+        config_update_lock for a new batch. The lock is released right away
+        if the cycle staged nothing (e.g. validation failed).
+        """
+        async with self._stage_lock:
+            if not self._holds_config_lock:
+                await config_update_lock.acquire()
+                self._holds_config_lock = True
+            try:
+                yield
+            finally:
+                if self._task is None:
+                    self._holds_config_lock = False
+                    config_update_lock.release()
+    
+    def submit(self, config: dict[str, Any]) -> asyncio.Future:
+        """Queue config as the latest state to persist.
+        
+        Must be called inside staging().
+        
+        Returns:
+            Future resolved once a flush including this config completes
+            (or failed with the save error)
+        """
+        waiter = asyncio.get_running_loop().create_future()
+        self._config = config
+        self._waiters.append(waiter)
+        if self._task is None:
+            self._task = asyncio.create_task(self._flush())
+        return waiter
+    
+    async def _flush(self) -> None:
+        global _config_cache
+        await asyncio.sleep(WRITE_COALESCE_DELAY)
+        
+        # Take the batch (and with it the config lock) once no cycle is
+        # mid-staging; mutations from here on wait for the lock and start
+        # the next batch
+        async with self._stage_lock:
+            config, waiters = self._config, self._waiters
+            self._config, self._waiters, self._task = None, [], None
+            self._holds_config_lock = False
+        snapshot = _config_cache
+        
+        try:
+            await asyncio.to_thread(save_streams, config)
+            # Still holding the lock, so the file is exactly this write and
+            # the snapshot is still the one staged for it: stamp it so reads
+            # revalidate against disk from now on
+            stamp = get_config_stamp()
+            if stamp is None:
+                _config_cache = None
+            elif snapshot is not None:
+                snapshot.stamp = stamp
+        except Exception as e:
+            # Staged state never reached disk; re-read it on next access
+            _config_cache = None
+            for waiter in waiters:
+                if not waiter.done():
+                    waiter.set_exception(e)
+            return
+        finally:
+            config_update_lock.release()
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Flushed {len(waiters)} zone write(s) in one save")
+        
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+
+_write_coalescer = _WriteCoalescer()
+
 
 class ZonesService:
     """Service for managing detection zones within RTSP streams.
@@ -48,30 +267,20 @@ class ZonesService:
                 coordinates: [[0.1, 0.1], [0.9, 0.1], ...]
     """
     
-    async def list_zones(self, stream_id: str) -> list[dict]:
-        """List all detection zones for a stream.
+    async def list_zones_json(self, stream_id: str) -> bytes:
+        """List a stream's zones as a serialized JSON array.
         
         Args:
             stream_id: Parent stream UUID
             
         Returns:
-            List of zone dicts (empty if stream not found)
-        """
-        try:
-            config = load_streams()
-            
-            for stream in config.get("streams", []):
-                if stream.get("id") == stream_id:
-                    zones = stream.get(ZONES_KEY, [])
-                    logger.debug(f"Listed {len(zones)} zone(s) for stream {stream_id}")
-                    return zones
-            
-            logger.debug(f"Stream not found: {stream_id}")
-            return []
+            JSON array of zones (``[]`` if stream not found)
             
-        except Exception as e:
-            logger.error(f"Failed to list zones for {stream_id}: {e}", exc_info=True)
-            return []
+        Raises:
+            pydantic.ValidationError: A stored zone is malformed (not
+                masked as an empty list; the API reports it as a 500)
+        """
+        return (await self._load_snapshot()).zones_json(stream_id)
     
     async def get_zone(self, stream_id: str, zone_id: str) -> dict | None:
         """Get specific zone by ID.
@@ -84,13 +293,12 @@ class ZonesService:
             Zone dict or None if not found
         """
         try:
-            zones = await self.list_zones(stream_id)
+            zone = (await self._load_snapshot()).zone(stream_id, zone_id)
+            if zone is not None:
+                return copy.deepcopy(zone)
             
-            for zone in zones:
-                if zone.get("id") == zone_id:
-                    return zone
-            
-            logger.debug(f"Zone not found: {zone_id} in stream {stream_id}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Zone not found: {zone_id} in stream {stream_id}")
             return None
             
         except Exception as e:
@@ -110,44 +318,54 @@ class ZonesService:
         Raises:
             ValueError: Stream not found or duplicate name
         """
+        async with _write_coalescer.staging():
+            try:
+                config, snapshot = await self._load_config()
+                streams = config.get("streams", [])
+                
+                # Find stream
+                stream = self._find_stream(streams, snapshot, stream_id)
+                if not stream:
+                    logger.warning(f"Cannot create zone - stream not found: {stream_id}")
+                    raise ValueError(f"Stream {stream_id} not found")
+                
+                # Initialize zones if needed
+                if ZONES_KEY not in stream:
+                    stream[ZONES_KEY] = []
+                
+                # Validate unique name
+                self._validate_unique_zone_name(snapshot, stream_id, new_zone.name)
+                
+                # Create zone
+                zone = Zone(
+                    id=str(uuid.uuid4()),
+                    stream_id=stream_id,
+                    **new_zone.model_dump()
+                )
+                
+                # Add and persist
+                zone_dict = zone.model_dump()
+                stream[ZONES_KEY].append(zone_dict)
+                config["streams"] = streams
+                names = dict(snapshot.zone_names(stream_id))
+                names[normalize_stream_name(zone.name)] = zone.id
+                flushed = self._stage_config(config, zone_names={stream_id: names})
+                
+            except ValueError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to create zone in {stream_id}: {e}", exc_info=True)
+                raise ValueError(f"Failed to create zone: {str(e)}")
+        
+        # Wait for the write outside the lock so concurrent edits join the batch
         try:
-            config = load_streams()
-            streams = config.get("streams", [])
-            
-            # Find stream
-            stream = self._find_stream(streams, stream_id)
-            if not stream:
-                logger.warning(f"Cannot create zone - stream not found: {stream_id}")
-                raise ValueError(f"Stream {stream_id} not found")
-            
-            # Initialize zones if needed
-            if ZONES_KEY not in stream:
-                stream[ZONES_KEY] = []
-            
-            # Validate unique name
-            self._validate_unique_zone_name(stream, new_zone.name)
-            
-            # Create zone
-            zone = Zone(
-                id=str(uuid.uuid4()),
-                stream_id=stream_id,
-                **new_zone.model_dump()
-            )
-            
-            # Add and persist
-            zone_dict = zone.model_dump()
-            stream[ZONES_KEY].append(zone_dict)
-            config["streams"] = streams
-            save_streams(config)
-            
-            logger.info(f"Created zone: {new_zone.name} ({zone.id}) in stream {stream_id}")
-            return zone_dict
-            
-        except ValueError:
-            raise
+            await flushed
         except Exception as e:
             logger.error(f"Failed to create zone in {stream_id}: {e}", exc_info=True)
             raise ValueError(f"Failed to create zone: {str(e)}")
+        
+        logger.info(f"Created zone: {new_zone.name} ({zone.id}) in stream {stream_id}")
+        return copy.deepcopy(zone_dict)
     
     async def update_zone(
         self,
@@ -168,51 +386,73 @@ class ZonesService:
         Raises:
             ValueError: Validation failure (duplicate name)
         """
+        async with _write_coalescer.staging():
+            try:
+                config, snapshot = await self._load_config()
+                streams = config.get("streams", [])
+                
+                # Find stream
+                stream = self._find_stream(streams, snapshot, stream_id)
+                if not stream:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Update failed - stream not found: {stream_id}")
+                    return None
+                
+                zones = stream.get(ZONES_KEY, [])
+                
+                # Find zone
+                i = snapshot.zone_index.get((stream_id, zone_id))
+                if i is None:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Update failed - zone not found: {zone_id} in {stream_id}")
+                    return None
+                
+                # Validate unique name if changing
+                update_data = edit_zone.model_dump(exclude_unset=True)
+                if "name" in update_data:
+                    self._validate_unique_zone_name(
+                        snapshot,
+                        stream_id,
+                        update_data["name"],
+                        exclude_zone_id=zone_id
+                    )
+                
+                # EditZone already validated each provided field with the
+                # same constraints as Zone, and the stored zone was valid, so
+                # skip a full re-validation (an O(V) polygon walk on every
+                # rename). Only explicit nulls are left to reject.
+                null_fields = [key for key, value in update_data.items() if value is None]
+                if null_fields:
+                    raise ValueError(f"Fields cannot be null: {', '.join(null_fields)}")
+                
+                # Apply updates
+                old_name = zones[i].get("name", "")
+                zones[i].update(update_data)
+                
+                # Persist
+                config["streams"] = streams
+                names = dict(snapshot.zone_names(stream_id))
+                if "name" in update_data:
+                    names.pop(normalize_stream_name(old_name), None)
+                    names[normalize_stream_name(update_data["name"])] = zone_id
+                # The staged dict becomes the shared snapshot; hand out a copy
+                result = copy.deepcopy(zones[i])
+                flushed = self._stage_config(config, zone_names={stream_id: names})
+                
+            except ValueError:
+                raise
+            except Exception as e:
+                logger.error(f"Failed to update zone {zone_id} in {stream_id}: {e}", exc_info=True)
+                raise ValueError(f"Failed to update zone: {str(e)}")
+        
         try:
-            config = load_streams()
-            streams = config.get("streams", [])
-            
-            # Find stream
-            stream = self._find_stream(streams, stream_id)
-            if not stream:
-                logger.debug(f"Update failed - stream not found: {stream_id}")
-                return None
-            
-            zones = stream.get(ZONES_KEY, [])
-            
-            # Find and update zone
-            for i, zone in enumerate(zones):
-                if zone.get("id") == zone_id:
-                    # Validate unique name if changing
-                    update_data = edit_zone.model_dump(exclude_unset=True)
-                    if "name" in update_data:
-                        self._validate_unique_zone_name(
-                            stream,
-                            update_data["name"],
-                            exclude_zone_id=zone_id
-                        )
-                    
-                    # Apply updates
-                    zones[i].update(update_data)
-                    
-                    # Re-validate with Pydantic
-                    updated_zone = Zone(**zones[i])
-                    
-                    # Persist
-                    config["streams"] = streams
-                    save_streams(config)
-                    
-                    logger.info(f"Updated zone: {zone_id} in stream {stream_id}")
-                    return updated_zone.model_dump()
-            
-            logger.debug(f"Update failed - zone not found: {zone_id} in {stream_id}")
-            return None
-            
-        except ValueError:
-            raise
+            await flushed
         except Exception as e:
             logger.error(f"Failed to update zone {zone_id} in {stream_id}: {e}", exc_info=True)
             raise ValueError(f"Failed to update zone: {str(e)}")
+        
+        logger.info(f"Updated zone: {zone_id} in stream {stream_id}")
+        return result
     
     async def delete_zone(self, stream_id: str, zone_id: str) -> bool:
         """Delete detection zone.
@@ -224,74 +464,147 @@ class ZonesService:
         Returns:
             True if deleted, False if not found
         """
-        try:
-            config = load_streams()
-            streams = config.get("streams", [])
-            
-            # Find stream
-            stream = self._find_stream(streams, stream_id)
-            if not stream:
-                logger.debug(f"Delete failed - stream not found: {stream_id}")
-                return False
-            
-            zones = stream.get(ZONES_KEY, [])
-            original_count = len(zones)
-            
-            # Remove zone
-            stream[ZONES_KEY] = [z for z in zones if z.get("id") != zone_id]
-            
-            # Check if deleted
-            if len(stream[ZONES_KEY]) < original_count:
+        async with _write_coalescer.staging():
+            try:
+                config, snapshot = await self._load_config()
+                streams = config.get("streams", [])
+                
+                # Find stream
+                stream = self._find_stream(streams, snapshot, stream_id)
+                if not stream:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Delete failed - stream not found: {stream_id}")
+                    return False
+                
+                zones = stream.get(ZONES_KEY, [])
+                
+                # Remove zone in place
+                i = snapshot.zone_index.get((stream_id, zone_id))
+                if i is None:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Delete failed - zone not found: {zone_id} in {stream_id}")
+                    return False
+                names = dict(snapshot.zone_names(stream_id))
+                names.pop(normalize_stream_name(zones[i].get("name", "")), None)
+                del zones[i]
+                
                 config["streams"] = streams
-                save_streams(config)
-                logger.info(f"Deleted zone: {zone_id} from stream {stream_id}")
-                return True
-            
-            logger.debug(f"Delete failed - zone not found: {zone_id} in {stream_id}")
-            return False
-            
+                flushed = self._stage_config(config, zone_names={stream_id: names})
+                
+            except Exception as e:
+                logger.error(f"Failed to delete zone {zone_id} from {stream_id}: {e}", exc_info=True)
+                return False
+        
+        try:
+            await flushed
         except Exception as e:
             logger.error(f"Failed to delete zone {zone_id} from {stream_id}: {e}", exc_info=True)
             return False
+        
+        logger.info(f"Deleted zone: {zone_id} from stream {stream_id}")
+        return True
     
     # ========================================================================
     # Helper Methods
     # ========================================================================
     
-    def _find_stream(self, streams: list[dict], stream_id: str) -> dict | None:
-        """Find stream by ID in streams list."""
-        for stream in streams:
-            if stream.get("id") == stream_id:
-                return stream
-        return None
+    async def _load_snapshot(self) -> _ConfigSnapshot:
+        """Load the config snapshot, reusing the last parse while the file is unchanged.
+        
+        The snapshot's config is shared and must not be mutated. A staged
+        snapshot awaiting flush is returned without checking the file.
+        """
+        global _config_cache
+        if _config_cache is not None and _config_cache.stamp is _PENDING_STAMP:
+            return _config_cache
+        
+        stamp = get_config_stamp()
+        if stamp is None:
+            return _ConfigSnapshot(None, await asyncio.to_thread(load_streams))
+        
+        if _config_cache is not None and _config_cache.stamp == stamp:
+            logger.debug("Config cache hit")
+            return _config_cache
+        
+        config = await asyncio.to_thread(load_streams)
+        _config_cache = _ConfigSnapshot(stamp, config)
+        return _config_cache
+    
+    async def _load_config(self) -> tuple[dict[str, Any], _ConfigSnapshot]:
+        """Load config for mutation.
+        
+        Returns a deep copy so callers may mutate it freely, plus the
+        snapshot whose indexes describe it.
+        
+        Returns:
+            (config, snapshot)
+        """
+        snapshot = await self._load_snapshot()
+        if snapshot.stamp is None:
+            return snapshot.config, snapshot  # Uncached, nothing to protect
+        return copy.deepcopy(snapshot.config), snapshot
+    
+    def _stage_config(
+        self,
+        config: dict[str, Any],
+        zone_names: dict[str, dict[str, str]] | None = None
+    ) -> asyncio.Future:
+        """Install config as the pending snapshot and queue it for writing.
+        
+        Must be called inside _write_coalescer.staging(). Later mutations
+        and reads see the staged config immediately; the disk write is
+        coalesced with any others staged within WRITE_COALESCE_DELAY.
+        
+        Args:
+            config: Config to persist (owned by the snapshot from now on)
+            zone_names: Incrementally updated {stream_id: {normalized name:
+                zone_id}} for the mutated stream, carried into the new
+                snapshot instead of re-normalizing every zone name
+                
+        Returns:
+            Future resolved once the config is on disk
+        """
+        global _config_cache
+        previous = _config_cache
+        _config_cache = _ConfigSnapshot(_PENDING_STAMP, config)
+        if zone_names:
+            _config_cache.seed_zone_names(zone_names)
+            if previous is not None:
+                _config_cache.inherit(previous, changed=set(zone_names))
+        return _write_coalescer.submit(config)
+    
+    def _find_stream(
+        self,
+        streams: list[dict],
+        snapshot: _ConfigSnapshot,
+        stream_id: str
+    ) -> dict | None:
+        """Find stream by ID via the snapshot's position index."""
+        i = snapshot.stream_index.get(stream_id)
+        return streams[i] if i is not None else None
     
     def _validate_unique_zone_name(
         self,
-        stream: dict,
+        snapshot: _ConfigSnapshot,
+        stream_id: str,
         name: str,
         exclude_zone_id: str | None = None
     ) -> None:
         """Validate zone name is unique within stream (case-insensitive).
         
         Args:
-            stream: Parent stream dict
+            snapshot: Config snapshot holding pre-normalized zone names
+            stream_id: Parent stream UUID
             name: Zone name to validate
             exclude_zone_id: Zone ID to exclude (for updates)
             
         Raises:
             ValueError: If name already exists
         """
-        normalized_name = normalize_stream_name(name)
-        zones = stream.get(ZONES_KEY, [])
-        
-        for zone in zones:
-            # Skip zone being updated
-            if exclude_zone_id and zone.get("id") == exclude_zone_id:
-                continue
-            
-            if normalize_stream_name(zone.get("name", "")) == normalized_name:
-                logger.warning(f"Duplicate zone name: '{name}' in stream {stream.get('id')}")
-                raise ValueError(f"Zone name '{name}' already exists in this stream")
+        owner_id = snapshot.zone_names(stream_id).get(normalize_stream_name(name))
+        if owner_id is not None and owner_id != exclude_zone_id:
+            logger.warning(f"Duplicate zone name: '{name}' in stream {stream_id}")
+            raise ValueError(f"Zone name '{name}' already exists in this stream")
 
 
 logger.debug("ZonesService module loaded")
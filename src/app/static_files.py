@@ -0,0 +1,161 @@
+"""Static file serving for the bundled React frontend.
+
+StaticFiles re-resolves its root directory with os.path.realpath on every
+request before the containment check, then stats the asset. The frontend
+build is fixed for the life of the process, so FrontendStaticFiles resolves
+the root once at startup, memoizes lookups for a few seconds and serves
+index.html from memory.
+
+Unmatched /api/* paths are rejected with a 404 up front instead of being
+looked up on disk.
+
+Security:
+    Requested paths are still resolved per request and must stay within
+    the (pre-resolved) root; traversal attempts fall through to 404.
+
+Logging Strategy:
+    DEBUG - Mount configuration
+"""
+from __future__ import annotations
+
+import logging
+import os
+import time
+from typing import Any, Final
+
+from starlette.datastructures import Headers
+from starlette.exceptions import HTTPException
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse, StaticFiles
+from starlette.types import Scope
+
+logger = logging.getLogger(__name__)
+
+# ============================================================================
+# Constants
+# ============================================================================
+
+# How long a path lookup (resolve + stat) is reused before re-checking disk
+LOOKUP_CACHE_TTL: Final[float] = 5.0
+
+# Bound on memoized lookups; the cache is simply cleared when full so
+# requests for random paths can't grow it without limit
+LOOKUP_CACHE_MAX_ENTRIES: Final[int] = 512
+
+# API routes are registered before the frontend mount; anything under this
+# prefix that reaches the mount is an unknown endpoint, never an asset
+API_PATH_PREFIX: Final[str] = "api/"
+
+
+class FrontendStaticFiles(StaticFiles):
+    """StaticFiles with the served directories resolved once at mount time."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._resolved_directories: tuple[str, ...] = tuple(
+            os.path.realpath(directory) for directory in self.all_directories
+        )
+        # {path: (expires_at, full_path, stat_result)}
+        self._lookup_cache: dict[str, tuple[float, str, os.stat_result | None]] = {}
+        
+        # index.html is small and served for every app entry; keep its bytes
+        # and response headers (ETag, Last-Modified, ...) in memory
+        self._index_path: str | None = None
+        self._index_stamp: tuple[int, int] | None = None
+        self._index_body = b""
+        self._index_headers = Headers()
+        if self._resolved_directories:
+            self._load_index(os.path.join(self._resolved_directories[0], "index.html"))
+        
+        logger.debug(f"Frontend directories: {self._resolved_directories}")
+    
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        """Serve path, short-circuiting unknown API routes to 404."""
+        if path.startswith(API_PATH_PREFIX) or path == API_PATH_PREFIX.rstrip("/"):
+            raise HTTPException(status_code=404)
+        return await super().get_response(path, scope)
+    
+    def _load_index(self, index_path: str) -> None:
+        """Read index.html and precompute its response headers."""
+        try:
+            with open(index_path, "rb") as f:
+                stat_result = os.fstat(f.fileno())
+                body = f.read()
+        except OSError:
+            return  # No index; StaticFiles handles the 404s
+        
+        headers = dict(FileResponse(index_path, stat_result=stat_result).headers)
+        headers["cache-control"] = "no-cache"  # Always revalidate (ETag)
+        self._index_path = index_path
+        self._index_stamp = (stat_result.st_mtime_ns, stat_result.st_size)
+        self._index_body = body
+        self._index_headers = Headers(headers)
+    
+    def file_response(
+        self,
+        full_path: str | os.PathLike[str],
+        stat_result: os.stat_result,
+        scope: Scope,
+        status_code: int = 200,
+    ) -> Response:
+        """Build the file response, serving index.html from memory.
+        
+        The in-memory copy is used only while the file on disk still has
+        the same mtime and size; otherwise it is reloaded first.
+        """
+        if self._index_path is None or full_path != self._index_path:
+            return super().file_response(full_path, stat_result, scope, status_code)
+        
+        if self._index_stamp != (stat_result.st_mtime_ns, stat_result.st_size):
+            self._load_index(self._index_path)
+        
+        if self.is_not_modified(self._index_headers, Headers(scope=scope)):
+            return NotModifiedResponse(self._index_headers)
+        return Response(
+            content=self._index_body,
+            status_code=status_code,
+            headers=self._index_headers
+        )
+
+    def lookup_path(self, path: str) -> tuple[str, os.stat_result | None]:
+        """Resolve path under the served directories and stat it (memoized).
+
+        Same semantics as StaticFiles.lookup_path, minus the per-request
+        realpath of each root. Results, including misses, are reused for
+        LOOKUP_CACHE_TTL seconds; the stat result also carries the
+        mtime/size used for ETag and Last-Modified.
+
+        Returns:
+            (full_path, stat_result), or ("", None) if not found or outside
+            the served directories
+        """
+        now = time.monotonic()
+        cached = self._lookup_cache.get(path)
+        if cached is not None and cached[0] > now:
+            return cached[1], cached[2]
+
+        full_path, stat_result = self._lookup_uncached(path)
+        if len(self._lookup_cache) >= LOOKUP_CACHE_MAX_ENTRIES:
+            self._lookup_cache.clear()
+        self._lookup_cache[path] = (now + LOOKUP_CACHE_TTL, full_path, stat_result)
+        return full_path, stat_result
+
+    def _lookup_uncached(self, path: str) -> tuple[str, os.stat_result | None]:
+        """Resolve and stat path against the pre-resolved directories."""
+        for directory in self._resolved_directories:
+            joined_path = os.path.join(directory, path)
+            if self.follow_symlink:
+                full_path = os.path.abspath(joined_path)
+            else:
+                full_path = os.path.realpath(joined_path)
+            if os.path.commonpath([full_path, directory]) != directory:
+                # Don't let clients break out of the static directory
+                continue
+            try:
+                return full_path, os.stat(full_path)
+            except (FileNotFoundError, NotADirectoryError):
+                continue
+        return "", None
+
+
+logger.debug("Static files module loaded")
@@ -20,9 +20,14 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
+import re
+import signal
 import subprocess
+import time
 from typing import Final
-from urllib.parse import urlparse
+
+from .strings import parse_url
 
 logger = logging.getLogger(__name__)
 
@@ -33,9 +38,68 @@ logger = logging.getLogger(__name__)
 DEFAULT_PROBE_TIMEOUT: Final[float] = 5.0
 """Default RTSP probe timeout in seconds."""
 
+PROBE_CACHE_TTL: Final[float] = 1.0
+"""Seconds a probe result is reused for the same URL."""
+
+PROBE_CACHE_MAX_ENTRIES: Final[int] = 256
+"""Bound on cached probe results; the cache is cleared when full."""
+
 FORBIDDEN_SHELL_CHARS: Final[set[str]] = {";", "&", "|", ">", "<", "`", "$", "\n", "\r"}
 """Shell metacharacters forbidden for security."""
 
+LOW_LATENCY_INPUT_FLAGS: Final[tuple[str, ...]] = (
+    "-fflags", "nobuffer",
+    "-flags", "low_delay",
+)
+"""Input flags that stop FFmpeg buffering RTSP packets ahead of decode.
+
+Placed before user params, so a stream's own -fflags/-flags still win.
+Probe size/duration are left to the (user-editable) defaults: the frame
+pipeline needs correct stream info more than a faster first frame.
+"""
+
+_FORBIDDEN_SHELL_CHARS_PATTERN: Final[re.Pattern[str]] = re.compile(
+    "[" + re.escape("".join(sorted(FORBIDDEN_SHELL_CHARS))) + "]"
+)
+"""Character class of FORBIDDEN_SHELL_CHARS: one C-level pass per param."""
+
+GPU_FFMPEG_FLAGS: Final[tuple[str, ...]] = ("-hwaccel", "-hwaccel_output_format", "-c:v")
+"""Param substrings that require a GPU backend (rejected when none is detected)."""
+
+_GPU_FFMPEG_FLAGS_PATTERN: Final[re.Pattern[str]] = re.compile(
+    "|".join(re.escape(flag) for flag in GPU_FFMPEG_FLAGS)
+)
+"""Alternation of GPU_FFMPEG_FLAGS: one search per param instead of one per flag."""
+
+# FFmpeg command fragments, preassembled (see build_ffmpeg_command)
+_OUTPUT_RATE_ARGS: Final[tuple[str, ...]] = ("-r", "5")
+"""Force 5fps output (constitution requirement)."""
+
+_CPU_FILTER_ARGS: Final[tuple[str, ...]] = ("-vf", "fps=5")
+"""Decimate to 5fps before any pixel format conversion."""
+
+_GPU_FILTER_ARGS: Final[tuple[str, ...]] = ("-vf", "fps=5,hwdownload,format=nv12")
+"""Decimate on the GPU, then download only the frames that are emitted.
+
+Only valid for hardware frames, i.e. when -hwaccel_output_format keeps
+decoded surfaces in GPU memory; otherwise they're already in system RAM.
+"""
+
+_RAW_BGR24_OUTPUT_ARGS: Final[tuple[str, ...]] = (
+    "-pix_fmt", "bgr24",
+    "-f", "rawvideo",
+    "-",  # stdout
+)
+"""Raw BGR24 frames for YOLO inference."""
+
+_MJPEG_OUTPUT_ARGS: Final[tuple[str, ...]] = (
+    "-c:v", "mjpeg",
+    "-q:v", "3",  # Quality 3 (high quality, 1-31 scale)
+    "-f", "mjpeg",
+    "-",  # stdout
+)
+"""MJPEG output to stdout (default)."""
+
 # ============================================================================
 # FFmpeg Command Building
 # ============================================================================
@@ -49,11 +113,13 @@ def build_ffmpeg_command(
     """Build FFmpeg command for RTSP processing with GPU acceleration.
 
     Command structure:
-    1. User params (can override defaults)
-    2. Input (-i rtsp://...)
-    3. FPS limiter (-r 5)
-    4. GPU download filter (if using GPU)
-    5. Output format:
+    1. Low-latency input flags (-fflags nobuffer -flags low_delay)
+    2. User params (can override defaults)
+    3. Input (-i rtsp://...)
+    4. FPS limiter (-r 5, plus an fps=5 filter ahead of any conversion)
+    5. GPU download filter (if decoded frames stay on the GPU, i.e. the
+       params set -hwaccel_output_format)
+    6. Output format:
        - Raw BGR24 if detection_enabled=True (for YOLO inference)
        - MJPEG if detection_enabled=False (for direct streaming)
 
@@ -74,44 +140,40 @@ def build_ffmpeg_command(
         ...     detection_enabled=True
         ... )
     """
-    cmd = ["ffmpeg"]
+    # Frames stay in GPU memory until the single download right before
+    # output only when -hwaccel_output_format is set (NVIDIA defaults); plain
+    # -hwaccel (AMD/Intel defaults) already hands back system-memory frames,
+    # which hwdownload would reject
+    use_gpu = (
+        bool(gpu_backend)
+        and gpu_backend != "none"
+        and "-hwaccel_output_format" in ffmpeg_params
+    )
 
     logger.debug(f"Building FFmpeg command: GPU={gpu_backend}, detection={detection_enabled}, input_params={len(ffmpeg_params)}")
 
-    # User params first (allows override)
-    cmd.extend(ffmpeg_params)
-
-    # Input
-    cmd.extend(["-i", rtsp_url])
-
-    # Force 5fps output (constitution requirement)
-    cmd.extend(["-r", "5"])
-
-    # GPU download filter if using hardware acceleration
-    if gpu_backend and gpu_backend != "none":
-        cmd.extend(["-vf", "hwdownload,format=nv12"])
-        logger.debug(f"Added GPU download filter for {gpu_backend}")
-
-    # Output format depends on detection mode
-    if detection_enabled:
-        # Raw BGR24 frames for YOLO inference
-        cmd.extend([
-            "-pix_fmt", "bgr24",
-            "-f", "rawvideo",
-            "-"  # stdout
-        ])
-        logger.debug("Output: raw BGR24 frames for detection pipeline")
-    else:
-        # MJPEG output to stdout (default)
-        cmd.extend([
-            "-c:v", "mjpeg",
-            "-q:v", "3",  # Quality 3 (high quality, 1-31 scale)
-            "-f", "mjpeg",
-            "-"  # stdout
-        ])
-        logger.debug("Output: MJPEG stream")
-
-    logger.debug(f"FFmpeg command ({len(cmd)} total params): {' '.join(cmd)}")
+    # One concatenation of preassembled fragments. User params come first
+    # (allows override); frames are dropped at the head of the filter chain,
+    # since -r alone only decimates after GPU download and pixel format
+    # conversion have run on every decoded frame.
+    cmd = [
+        "ffmpeg",
+        *LOW_LATENCY_INPUT_FLAGS,
+        *ffmpeg_params,
+        "-i", rtsp_url,
+        *_OUTPUT_RATE_ARGS,
+        *(_GPU_FILTER_ARGS if use_gpu else _CPU_FILTER_ARGS),
+        *(_RAW_BGR24_OUTPUT_ARGS if detection_enabled else _MJPEG_OUTPUT_ARGS),
+    ]
+
+    if logger.isEnabledFor(logging.DEBUG):
+        if use_gpu:
+            logger.debug(f"Added GPU download filter for {gpu_backend}")
+        if detection_enabled:
+            logger.debug("Output: raw BGR24 frames for detection pipeline")
+        else:
+            logger.debug("Output: MJPEG stream")
+        logger.debug(f"FFmpeg command ({len(cmd)} total params): {' '.join(cmd)}")
     return cmd
 
 
@@ -119,6 +181,11 @@ def build_ffmpeg_command(
 # RTSP Stream Probing
 # ============================================================================
 
+# {rtsp_url: (expires_at, reachable)} and {rtsp_url: running probe task}
+_probe_cache: dict[str, tuple[float, bool]] = {}
+_probe_inflight: dict[str, asyncio.Task[bool]] = {}
+
+
 async def probe_rtsp_stream(
     rtsp_url: str,
     timeout_seconds: float = DEFAULT_PROBE_TIMEOUT
@@ -126,6 +193,8 @@ async def probe_rtsp_stream(
     """Probe RTSP stream connectivity using ffprobe.
     
     Verifies stream is accessible and decodable without processing frames.
+    Concurrent probes of the same URL share one ffprobe run, and its
+    result is reused for PROBE_CACHE_TTL seconds.
     
     Args:
         rtsp_url: RTSP URL to probe
@@ -134,12 +203,43 @@ async def probe_rtsp_stream(
     Returns:
         True if accessible, False otherwise
     """
+    cached = _probe_cache.get(rtsp_url)
+    if cached is not None and cached[0] > time.monotonic():
+        logger.debug(f"Probe result cached: {rtsp_url}")
+        return cached[1]
+    
+    task = _probe_inflight.get(rtsp_url)
+    if task is None:
+        task = asyncio.create_task(_run_probe(rtsp_url, timeout_seconds))
+        _probe_inflight[rtsp_url] = task
+        task.add_done_callback(lambda _: _probe_inflight.pop(rtsp_url, None))
+    
+    # Shielded: one caller giving up must not kill the shared probe
+    return await asyncio.shield(task)
+
+
+async def _run_probe(rtsp_url: str, timeout_seconds: float) -> bool:
+    """Run one probe and cache its result."""
+    reachable = await _probe_uncached(rtsp_url, timeout_seconds)
+    if len(_probe_cache) >= PROBE_CACHE_MAX_ENTRIES:
+        _probe_cache.clear()
+    _probe_cache[rtsp_url] = (time.monotonic() + PROBE_CACHE_TTL, reachable)
+    return reachable
+
+
+async def _probe_uncached(rtsp_url: str, timeout_seconds: float) -> bool:
+    """Run ffprobe against rtsp_url (see probe_rtsp_stream)."""
     try:
+        # stderr is only worth capturing when there's a debug log to put it
+        # in; otherwise ffprobe stays quiet and it goes to /dev/null
+        capture_errors = logger.isEnabledFor(logging.DEBUG)
+        
+        # One line per stream; the first line is enough to answer
         cmd = [
             "ffprobe",
-            "-v", "quiet",
-            "-print_format", "json",
-            "-show_streams",
+            "-v", "error" if capture_errors else "quiet",
+            "-show_entries", "stream=codec_type",
+            "-of", "default=nw=1",
             "-rtsp_transport", "tcp",
             "-timeout", str(int(timeout_seconds * 1000000)),  # microseconds
             rtsp_url
@@ -150,30 +250,40 @@ async def probe_rtsp_stream(
         process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+            stderr=subprocess.PIPE if capture_errors else subprocess.DEVNULL
         )
         
         try:
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(),
+            # Return on the first stream entry instead of waiting for
+            # ffprobe to finish and tear down the RTSP session
+            line = await asyncio.wait_for(
+                process.stdout.readline(),
                 timeout=timeout_seconds
             )
-            
-            if process.returncode == 0 and stdout:
-                logger.debug(f"Probe successful: {rtsp_url}")
-                return True
-            
-            if stderr:
-                error_msg = stderr.decode().strip()
-                logger.debug(f"Probe failed: {error_msg}")
-            
-            return False
-            
         except asyncio.TimeoutError:
             logger.debug(f"Probe timeout after {timeout_seconds}s")
-            process.kill()
-            await process.wait()
             return False
+        finally:
+            # os.kill rather than process.kill(): Popen polls before
+            # signalling, which can reap an exiting ffprobe behind asyncio's
+            # child watcher. An unreaped pid can't be reused, so this is safe.
+            if process.returncode is None:
+                try:
+                    os.kill(process.pid, signal.SIGKILL)
+                except ProcessLookupError:
+                    pass
+            await process.wait()
+        
+        if line.strip():
+            logger.debug(f"Probe successful: {rtsp_url}")
+            return True
+        
+        if capture_errors:
+            stderr = await process.stderr.read()
+            error_msg = stderr.decode(errors="replace").strip()
+            logger.debug(f"Probe failed: {error_msg or 'no stream entries'}")
+        
+        return False
             
     except Exception as e:
         logger.debug(f"Probe error: {e}")
@@ -205,14 +315,14 @@ def validate_rtsp_url(url: str, params: list[str], gpu_backend: str) -> bool:
         logger.warning("Invalid URL: empty or wrong type")
         return False
     
-    url_lower = url.lower()
-    if not url_lower.startswith(("rtsp://", "rtsps://")):
+    # Lowercase just the scheme-sized head, not the whole URL
+    if not url[:8].lower().startswith(("rtsp://", "rtsps://")):
         logger.warning(f"Invalid scheme: {url[:20]}")
         return False
     
     # Parse URL structure
     try:
-        parsed = urlparse(url)
+        parsed = parse_url(url)
         if not parsed.netloc:
             logger.warning("URL missing host")
             return False
@@ -220,21 +330,20 @@ def validate_rtsp_url(url: str, params: list[str], gpu_backend: str) -> bool:
         logger.warning(f"URL parse failed: {e}")
         return False
     
-    # Validate params
+    # Validate params in a single pass, stopping at the first failure
+    no_gpu = gpu_backend == "none"
     for param in params:
         if not isinstance(param, str):
             logger.warning(f"Invalid param type: {type(param)}")
             return False
         
         # Check shell injection risks
-        if any(char in param for char in FORBIDDEN_SHELL_CHARS):
+        if _FORBIDDEN_SHELL_CHARS_PATTERN.search(param):
             logger.warning(f"Forbidden char in param: {param}")
             return False
-    
-    # Warn if GPU params but no GPU
-    if gpu_backend == "none":
-        gpu_flags = {"-hwaccel", "-hwaccel_output_format", "-c:v"}
-        if any(any(flag in param for flag in gpu_flags) for param in params):
+        
+        # Reject GPU params when there is no GPU
+        if no_gpu and _GPU_FFMPEG_FLAGS_PATTERN.search(param):
             logger.warning("GPU params used but no GPU detected")
             return False
     
@@ -15,24 +15,56 @@ Security:
 """
 from __future__ import annotations
 
+import functools
 import re
 import unicodedata
 from typing import Final
-from urllib.parse import urlparse
+from urllib.parse import ParseResult, urlparse
 
 # ============================================================================
 # Constants
 # ============================================================================
 
 RTSP_CREDENTIALS_PATTERN: Final[re.Pattern[str]] = re.compile(
-    r'^(rtsps?://)([^:@]+):([^@]+)@(.+)$',
+    r'^(rtsps?://)([^:@]++):([^@]++)@(.+)$',
     re.IGNORECASE
 )
-"""Regex to match and extract RTSP credentials."""
+"""Regex to match and extract RTSP credentials.
+
+The userinfo quantifiers are possessive: each class already excludes the
+delimiter that follows it, so giving back characters can never produce a
+match and a failing input is rejected without backtracking.
+"""
 
 CREDENTIALS_MASK: Final[str] = "***:***"
 """Placeholder for masked credentials."""
 
+MASK_CACHE_SIZE: Final[int] = 1024
+"""Distinct credentialed URLs whose masked form is memoized."""
+
+# ============================================================================
+# URL Parsing
+# ============================================================================
+
+def parse_url(url: str) -> ParseResult:
+    """Parse a URL for the RTSP validators.
+    
+    Not memoized here: urlparse's splitting step (urlsplit) is already
+    lru_cached by the standard library on Python 3.11+, and a second cache
+    would only keep another copy of credentialed URLs in memory.
+    
+    Args:
+        url: URL to parse
+        
+    Returns:
+        urllib.parse.ParseResult
+        
+    Raises:
+        ValueError: Malformed URL
+    """
+    return urlparse(url)
+
+
 # ============================================================================
 # Credential Masking
 # ============================================================================
@@ -62,6 +94,22 @@ def mask_rtsp_credentials(rtsp_url: str) -> str:
     if not rtsp_url or not isinstance(rtsp_url, str):
         return rtsp_url
     
+    # No userinfo without '@': a C-level substring scan skips the regex for
+    # the common credential-free URL
+    if "@" not in rtsp_url:
+        return rtsp_url
+    
+    return _mask_credentialed_url(rtsp_url)
+
+
+@functools.lru_cache(maxsize=MASK_CACHE_SIZE)
+def _mask_credentialed_url(rtsp_url: str) -> str:
+    """Regex-mask a URL containing '@', memoized by exact string.
+    
+    The set of configured stream URLs is small and stable, so repeated
+    stream listings reduce to a cache lookup. Masking is pure, so entries
+    never go stale; an edited URL is simply a new key.
+    """
     match = RTSP_CREDENTIALS_PATTERN.match(rtsp_url)
     if match:
         protocol = match.group(1)  # rtsp:// or rtsps://
@@ -88,7 +136,7 @@ def extract_rtsp_host(rtsp_url: str) -> str | None:
         'cam.local'
     """
     try:
-        parsed = urlparse(rtsp_url)
+        parsed = parse_url(rtsp_url)
         return parsed.hostname
     except Exception:
         return None
@@ -127,8 +175,10 @@ def normalize_stream_name(name: str) -> str:
     # Trim and lowercase
     normalized = name.strip().lower()
     
-    # Unicode normalization (combine diacritics)
-    normalized = unicodedata.normalize('NFC', normalized)
+    # Unicode normalization (combine diacritics); ASCII is already NFC,
+    # and isascii() is an O(1) flag check on CPython strings
+    if not normalized.isascii():
+        normalized = unicodedata.normalize('NFC', normalized)
     
     return normalized
 
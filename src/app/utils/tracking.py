@@ -3,21 +3,67 @@ Object tracking utilities for Kalman filtering and data association.
 
 This module provides:
 - KalmanTracker: 2D object tracking with constant velocity model
+- Batched predict/update across all of a stream's trackers
 - IoU computation for detection-to-track matching
-- Hungarian algorithm integration for optimal assignment
+- Optimal assignment (scipy's linear_sum_assignment) for track matching
 
 Feature: 006-motion-tracking
 """
 
 import numpy as np
-from typing import Tuple, List
+from scipy.optimize import linear_sum_assignment
+from typing import Optional, Tuple, List
 import logging
 
 logger = logging.getLogger(__name__)
 
+try:
+    import lap  # Optional: prunes gated-out pairs inside the solver
+except ImportError:
+    lap = None
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Mark a shared model matrix read-only so no tracker can mutate it."""
+    array.flags.writeable = False
+    return array
+
+
+# Constant velocity model, identical for every tracker: built once and shared
+# instead of re-allocated per track (dt=0.2s at 5 FPS)
+KALMAN_DT = 0.2
+
+# State transition matrix: cx += vx * dt, cy += vy * dt
+_F = np.eye(6, dtype=np.float32)
+_F[0, 4] = KALMAN_DT
+_F[1, 5] = KALMAN_DT
+_F = _read_only(_F)
+
+# Measurement matrix (observe cx, cy, w, h; not velocity)
+_H = _read_only(np.eye(4, 6, dtype=np.float32))
+
+# Process noise covariance (motion model uncertainty, low for all terms)
+_Q = _read_only(np.eye(6, dtype=np.float32) * 0.01)
+
+# Measurement noise covariance (detection uncertainty)
+_R = _read_only(np.eye(4, dtype=np.float32) * 10.0)
+
+# Initial state covariance: position vs. (high) velocity uncertainty
+_INITIAL_COVARIANCE = _read_only(
+    np.diag(np.array([10.0, 10.0, 10.0, 10.0, 1000.0, 1000.0], dtype=np.float32))
+)
+
+_IDENTITY_6 = _read_only(np.eye(6, dtype=np.float32))
+
 
 class KalmanTracker:
-    """Kalman filter for 2D object tracking with constant velocity model."""
+    """Kalman filter for 2D object tracking with constant velocity model.
+
+    predict()/update() run on 6x6 matrices, where per-call overhead costs
+    more than the arithmetic: update() replaces products with the selector
+    H by slices, and debug output (array formatting) is only built when
+    debug logging is enabled.
+    """
 
     def __init__(self, initial_bbox: Tuple[int, int, int, int]):
         """
@@ -38,32 +84,17 @@ class KalmanTracker:
         self.state = np.array([cx, cy, w, h, 0.0, 0.0], dtype=np.float32)
 
         # State covariance matrix (6x6)
-        self.covariance = np.eye(6, dtype=np.float32)
-        self.covariance[:4, :4] *= 10.0  # Position uncertainty
-        self.covariance[4:, 4:] *= 1000.0  # Velocity uncertainty (high initial uncertainty)
-
-        # State transition matrix (constant velocity model, dt=0.2s at 5 FPS)
-        self.dt = 0.2
-        self.F = np.eye(6, dtype=np.float32)
-        self.F[0, 4] = self.dt  # cx += vx * dt
-        self.F[1, 5] = self.dt  # cy += vy * dt
+        self.covariance = _INITIAL_COVARIANCE.copy()
 
-        # Measurement matrix (observe position only, not velocity)
-        self.H = np.zeros((4, 6), dtype=np.float32)
-        self.H[0, 0] = 1.0  # Measure cx
-        self.H[1, 1] = 1.0  # Measure cy
-        self.H[2, 2] = 1.0  # Measure w
-        self.H[3, 3] = 1.0  # Measure h
+        # Shared, read-only model matrices (see module constants)
+        self.dt = KALMAN_DT
+        self.F = _F
+        self.H = _H
+        self.Q = _Q
+        self.R = _R
 
-        # Process noise covariance (motion model uncertainty)
-        self.Q = np.eye(6, dtype=np.float32)
-        self.Q[:4, :4] *= 0.01  # Low position noise
-        self.Q[4:, 4:] *= 0.01  # Low velocity noise
-
-        # Measurement noise covariance (detection uncertainty)
-        self.R = np.eye(4, dtype=np.float32) * 10.0
-
-        logger.debug(f"KalmanTracker initialized: bbox={initial_bbox}, initial_state={self.state[:4]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"KalmanTracker initialized: bbox={initial_bbox}, initial_state={self.state[:4]}")
 
     def predict(self) -> np.ndarray:
         """
@@ -80,7 +111,8 @@ class KalmanTracker:
         # Covariance prediction: P = F @ P @ F.T + Q
         self.covariance = self.F @ self.covariance @ self.F.T + self.Q
 
-        logger.debug(f"Kalman predict: state={self.state[:4]}, velocity={self.state[4:]}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Kalman predict: state={self.state[:4]}, velocity={self.state[4:]}")
         return self.state
 
     def update(self, measurement: Tuple[int, int, int, int]):
@@ -93,42 +125,34 @@ class KalmanTracker:
         x, y, w, h = measurement
         cx, cy = x + w / 2, y + h / 2
         z = np.array([cx, cy, w, h], dtype=np.float32)
+        P = self.covariance
 
-        # Innovation: y = z - H @ x
-        y_innov = z - (self.H @ self.state)
+        # Innovation: y = z - H @ x  (H @ x is x[:4])
+        y_innov = z - self.state[:4]
 
-        # Innovation covariance: S = H @ P @ H.T + R
-        S = self.H @ self.covariance @ self.H.T + self.R
+        # Innovation covariance: S = H @ P @ H.T + R  (H @ P @ H.T is P[:4, :4])
+        S = P[:4, :4] + self.R
 
-        try:
-            # Kalman gain: K = P @ H.T @ inv(S)
-            # T083: Handle numerical instability - catch singular matrix errors
-            K = self.covariance @ self.H.T @ np.linalg.inv(S)
+        # Kalman gain: K = P @ H.T @ inv(S), computed by solving K S = P H^T
+        # rather than forming inv(S) (S and P are symmetric, so this is
+        # S K^T = H P, with H P = P[:4]). S is positive definite (R = 10*I).
+        K = np.linalg.solve(S, P[:4]).T
 
-            # Update state: x = x + K @ y
-            self.state = self.state + K @ y_innov
+        # Update state: x = x + K @ y
+        self.state = self.state + K @ y_innov
 
-            # Update covariance: P = (I - K @ H) @ P
-            I_KH = np.eye(6, dtype=np.float32) - K @ self.H
-            self.covariance = I_KH @ self.covariance
+        # Update covariance (Joseph form): P = (I - K H) P (I - K H)^T + K R K^T
+        # T083: unlike the short form (I - K H) P, this is a sum of two PSD
+        # terms, so float32 rounding doesn't erode positive-definiteness;
+        # symmetrizing removes the remaining asymmetric rounding error
+        I_KH = _IDENTITY_6.copy()
+        I_KH[:, :4] -= K  # K @ H places K in the first four columns
+        P = I_KH @ P @ I_KH.T + K @ self.R @ K.T
+        self.covariance = 0.5 * (P + P.T)
 
+        if logger.isEnabledFor(logging.DEBUG):
             logger.debug(f"Kalman update: measurement={measurement}, updated_state={self.state[:4]}")
 
-        except np.linalg.LinAlgError as e:
-            # Singular covariance matrix - reset tracker to measurement
-            logger.warning(
-                f"Kalman filter numerical instability: {e}. "
-                f"Resetting tracker to measurement: {measurement}"
-            )
-
-            # Reset state to measurement (discard velocity)
-            self.state = np.array([cx, cy, w, h, 0.0, 0.0], dtype=np.float32)
-
-            # Reset covariance to initial values
-            self.covariance = np.eye(6, dtype=np.float32)
-            self.covariance[:4, :4] *= 10.0  # Position uncertainty
-            self.covariance[4:, 4:] *= 1000.0  # Velocity uncertainty
-
     def get_bbox(self) -> Tuple[int, int, int, int]:
         """
         Convert current state to bounding box coordinates.
@@ -151,6 +175,78 @@ class KalmanTracker:
         return (float(self.state[4]), float(self.state[5]))
 
 
+def predict_trackers(trackers: List[KalmanTracker]) -> None:
+    """
+    Run predict() for many trackers in one batched pass.
+
+    Stacks the states (T, 6) and covariances (T, 6, 6) so the shared model
+    is applied with one broadcast matmul per quantity instead of T small
+    ones; each tracker then gets its row back. Same result as calling
+    predict() on each tracker.
+
+    Args:
+        trackers: Trackers to advance by one frame
+    """
+    if not trackers:
+        return
+
+    states = np.stack([tracker.state for tracker in trackers])
+    covariances = np.stack([tracker.covariance for tracker in trackers])
+
+    # x = F @ x and P = F @ P @ F.T + Q, broadcast over the batch
+    states = states @ _F.T
+    covariances = _F @ covariances @ _F.T + _Q
+
+    for tracker, state, covariance in zip(trackers, states, covariances):
+        tracker.state = state
+        tracker.covariance = covariance
+
+
+def update_trackers(
+    trackers: List[KalmanTracker],
+    measurements: List[Tuple[int, int, int, int]]
+) -> None:
+    """
+    Run update() for many trackers in one batched pass.
+
+    Same math as KalmanTracker.update (Joseph form, solved gain), with the
+    (T, 4, 4) innovation covariances solved in one batched LAPACK call.
+
+    Args:
+        trackers: Trackers to correct
+        measurements: One (x, y, width, height) measurement per tracker
+    """
+    if not trackers:
+        return
+
+    boxes = np.array(measurements, dtype=np.float32).reshape(-1, 4)
+    z = np.concatenate((boxes[:, :2] + boxes[:, 2:] / 2, boxes[:, 2:]), axis=1)
+
+    states = np.stack([tracker.state for tracker in trackers])
+    covariances = np.stack([tracker.covariance for tracker in trackers])
+
+    # y = z - H @ x and S = H @ P @ H.T + R (H selects the first four entries)
+    y_innov = z - states[:, :4]
+    S = covariances[:, :4, :4] + _R
+
+    # K^T from S K^T = H P (batched solve; see KalmanTracker.update)
+    K_T = np.linalg.solve(S, covariances[:, :4])
+    K = K_T.transpose(0, 2, 1)
+
+    # x = x + K @ y
+    states = states + (K @ y_innov[:, :, np.newaxis])[:, :, 0]
+
+    # Joseph form: P = (I - K H) P (I - K H)^T + K R K^T, then symmetrize
+    I_KH = np.repeat(_IDENTITY_6[np.newaxis], len(trackers), axis=0)
+    I_KH[:, :, :4] -= K
+    covariances = I_KH @ covariances @ I_KH.transpose(0, 2, 1) + K @ _R @ K_T
+    covariances = 0.5 * (covariances + covariances.transpose(0, 2, 1))
+
+    for tracker, state, covariance in zip(trackers, states, covariances):
+        tracker.state = state
+        tracker.covariance = covariance
+
+
 def compute_iou(bbox1: Tuple[int, int, int, int], bbox2: Tuple[int, int, int, int]) -> float:
     """
     Compute Intersection over Union (IoU) between two bounding boxes.
@@ -238,15 +334,25 @@ def compute_iou_matrix(bboxes1: List[Tuple[int, int, int, int]], bboxes2: List[T
     return iou
 
 
-def hungarian_matching(cost_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+def hungarian_matching(
+    cost_matrix: np.ndarray,
+    cost_limit: Optional[float] = None
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    Solve linear assignment problem using numpy-only Hungarian algorithm.
+    Solve the linear assignment problem for detection-to-track matching.
+
+    Uses scipy's linear_sum_assignment (a C implementation of the
+    Jonker-Volgenant shortest augmenting path algorithm), which returns the
+    minimum-cost assignment and handles rectangular matrices directly.
 
-    This is a simplified implementation of the Hungarian algorithm (Kuhn-Munkres)
-    for optimal assignment. Uses only numpy to avoid scipy dependency.
+    With cost_limit, pairs costing more than the limit are gated out: a row
+    or column may stay unmatched instead, so an infeasible pair never takes
+    a slot from a feasible one. lap.lapjv is used for this when installed,
+    since it prunes gated-out pairs inside the solver.
 
     Args:
-        cost_matrix: Cost matrix of shape (N, M) where N <= M
+        cost_matrix: Cost matrix of shape (N, M)
+        cost_limit: Optional maximum cost of a matched pair
 
     Returns:
         Tuple of (row_indices, col_indices) for matched pairs
@@ -254,57 +360,38 @@ def hungarian_matching(cost_matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]
     if cost_matrix.size == 0:
         return np.array([], dtype=int), np.array([], dtype=int)
 
-    # Ensure we have more columns than rows (pad if needed)
-    n_rows, n_cols = cost_matrix.shape
-    if n_rows > n_cols:
-        # Transpose and swap at the end
-        cost_matrix = cost_matrix.T
-        n_rows, n_cols = n_cols, n_rows
-        transposed = True
-    else:
-        transposed = False
-
-    # Make a copy to avoid modifying input
-    cost = cost_matrix.copy()
-
-    # Step 1: Subtract row minimums
-    cost -= cost.min(axis=1, keepdims=True)
-
-    # Step 2: Subtract column minimums
-    cost -= cost.min(axis=0, keepdims=True)
-
-    # Step 3: Find a matching using greedy assignment on reduced matrix
-    # This is a simplified approach - for small matrices (typical in tracking)
-    # it works well enough
-    row_ind = []
-    col_ind = []
-    assigned_cols = set()
-
-    # Greedy assignment: for each row, find cheapest unassigned column
-    for row in range(n_rows):
-        # Get available columns
-        available_mask = np.ones(n_cols, dtype=bool)
-        available_mask[list(assigned_cols)] = False
-
-        if not available_mask.any():
-            break
-
-        # Find minimum cost among available columns
-        available_costs = cost[row].copy()
-        available_costs[~available_mask] = np.inf
-        col = np.argmin(available_costs)
-
-        # Only assign if cost is finite (i.e., there was a valid match)
-        if available_costs[col] < np.inf:
-            row_ind.append(row)
-            col_ind.append(col)
-            assigned_cols.add(col)
-
-    row_ind = np.array(row_ind, dtype=int)
-    col_ind = np.array(col_ind, dtype=int)
-
-    # Swap back if we transposed
-    if transposed:
-        row_ind, col_ind = col_ind, row_ind
-
-    return row_ind, col_ind
+    # float64 C-contiguous is both solvers' native layout (no internal copy)
+    cost = np.ascontiguousarray(cost_matrix, dtype=np.float64)
+
+    if cost_limit is None:
+        return linear_sum_assignment(cost)
+
+    if lap is not None:
+        _, x, _ = lap.lapjv(cost, extend_cost=True, cost_limit=cost_limit)
+        row_ind = np.where(x >= 0)[0]
+        return row_ind, x[row_ind]
+
+    return _gated_assignment(cost, cost_limit)
+
+
+def _gated_assignment(cost: np.ndarray, cost_limit: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Gated assignment with scipy (same result as lap.lapjv's cost_limit).
+
+    Extends the (N, M) matrix to (N+M, M+N) with one dummy column per row
+    and one dummy row per column, each costing cost_limit / 2, so leaving
+    a row and a column unmatched costs cost_limit in total.
+    """
+    n_rows, n_cols = cost.shape
+    half_limit = cost_limit / 2.0
+
+    extended = np.full((n_rows + n_cols, n_cols + n_rows), np.inf)
+    extended[:n_rows, :n_cols] = cost
+    extended[:n_rows, n_cols:][np.diag_indices(n_rows)] = half_limit
+    extended[n_rows:, :n_cols][np.diag_indices(n_cols)] = half_limit
+    extended[n_rows:, n_cols:] = 0.0
+
+    row_ind, col_ind = linear_sum_assignment(extended)
+
+    real = (row_ind < n_rows) & (col_ind < n_cols)
+    return row_ind[real], col_ind[real]
@@ -19,7 +19,8 @@ from __future__ import annotations
 import re
 import logging
 from typing import Final
-from urllib.parse import urlparse
+
+from .strings import parse_url
 
 logger = logging.getLogger(__name__)
 
@@ -30,10 +31,27 @@ logger = logging.getLogger(__name__)
 VALID_RTSP_SCHEMES: Final[set[str]] = {"rtsp", "rtsps"}
 """Valid RTSP URL schemes."""
 
+_RTSP_SCHEME_PREFIXES: Final[tuple[str, ...]] = tuple(
+    f"{scheme}://" for scheme in sorted(VALID_RTSP_SCHEMES)
+)
+_RTSP_SCHEME_HEAD_LEN: Final[int] = max(map(len, _RTSP_SCHEME_PREFIXES))
+"""Scheme prefixes for a single startswith() over the lowercased URL head."""
+
 MIN_PORT: Final[int] = 1
 MAX_PORT: Final[int] = 65535
 """Valid TCP/UDP port range."""
 
+IPV4_PATTERN: Final[re.Pattern[str]] = re.compile(r'^(\d{1,3}\.){3}\d{1,3}$')
+"""Dotted-quad IPv4 shape (octet ranges checked separately)."""
+
+IPV6_PATTERN: Final[re.Pattern[str]] = re.compile(r'^([0-9a-fA-F]{0,4}:){2,7}[0-9a-fA-F]{0,4}$')
+"""Simplified IPv6 shape."""
+
+DOMAIN_PATTERN: Final[re.Pattern[str]] = re.compile(
+    r'^([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?$'
+)
+"""RFC 1035 domain: dot-separated labels, 63 chars max per label."""
+
 # Type alias for validation results
 ValidationResult = tuple[bool, str | None]
 """Validation result: (is_valid, error_message)"""
@@ -71,14 +89,13 @@ def validate_rtsp_url(url: str) -> ValidationResult:
     if not url or not isinstance(url, str):
         return False, "RTSP URL is required and must be a string"
     
-    # Check scheme
-    url_lower = url.lower()
-    if not any(url_lower.startswith(f"{scheme}://") for scheme in VALID_RTSP_SCHEMES):
+    # Check scheme (lowercase only the head, not the whole URL)
+    if not url[:_RTSP_SCHEME_HEAD_LEN].lower().startswith(_RTSP_SCHEME_PREFIXES):
         return False, "URL must use rtsp:// or rtsps:// scheme"
     
     # Parse URL
     try:
-        parsed = urlparse(url)
+        parsed = parse_url(url)
     except Exception as e:
         logger.warning(f"URL parse error: {e}")
         return False, f"Invalid URL format: {str(e)}"
@@ -129,16 +146,14 @@ def _is_valid_ip(ip: str) -> bool:
         True if valid IP
     """
     # IPv4: 0.0.0.0 to 255.255.255.255
-    ipv4_pattern = r'^(\d{1,3}\.){3}\d{1,3}$'
-    if re.match(ipv4_pattern, ip):
+    if IPV4_PATTERN.match(ip):
         try:
             return all(0 <= int(octet) <= 255 for octet in ip.split('.'))
         except ValueError:
             return False
     
     # IPv6: simplified pattern
-    ipv6_pattern = r'^([0-9a-fA-F]{0,4}:){2,7}[0-9a-fA-F]{0,4}$'
-    return bool(re.match(ipv6_pattern, ip))
+    return bool(IPV6_PATTERN.match(ip))
 
 
 def _is_valid_domain(domain: str) -> bool:
@@ -154,8 +169,7 @@ def _is_valid_domain(domain: str) -> bool:
         return False
     
     # RFC 1035: labels separated by dots, 63 chars max per label
-    domain_pattern = r'^([a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?\.)*[a-zA-Z0-9]([a-zA-Z0-9\-]{0,61}[a-zA-Z0-9])?$'
-    return bool(re.match(domain_pattern, domain))
+    return bool(DOMAIN_PATTERN.match(domain))
 
 
 logger.debug("Validation utilities module loaded")
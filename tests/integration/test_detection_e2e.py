@@ -12,6 +12,7 @@ Feature: 005-yolo-object-detection
 
 import pytest
 import asyncio
+import io
 import subprocess
 import time
 from pathlib import Path
@@ -39,13 +40,12 @@ class TestYoloModelDownloadAndCache:
         model_dir.mkdir()
 
         # Simulate first-time download
-        with patch('app.services.yolo.YOLO') as mock_yolo:
-            mock_model = Mock()
-            mock_yolo.return_value = mock_model
+        with patch('app.services.yolo.urllib.request.urlopen') as mock_urlopen:
+            mock_urlopen.return_value = io.BytesIO(b"fake model data")
 
             model_path = load_yolo_model("yolo11n", str(model_dir))
 
-            assert mock_yolo.called
+            assert mock_urlopen.called
             assert model_path.exists()
 
     @pytest.mark.integration
@@ -58,7 +58,7 @@ class TestYoloModelDownloadAndCache:
         cached_model = model_dir / "yolo11n.pt"
         cached_model.write_bytes(b"fake model data")
 
-        with patch('app.services.yolo.YOLO') as mock_yolo:
+        with patch('ultralytics.YOLO') as mock_yolo:
             model_path = load_yolo_model("yolo11n", str(model_dir))
 
             # Should not call YOLO constructor (no download)
@@ -75,7 +75,7 @@ class TestYoloModelDownloadAndCache:
         pt_model = model_dir / "yolo11n.pt"
         pt_model.write_bytes(b"fake pt model")
 
-        with patch('app.services.yolo.YOLO') as mock_yolo:
+        with patch('ultralytics.YOLO') as mock_yolo:
             mock_model = Mock()
             mock_model.export.return_value = None
             mock_yolo.return_value = mock_model
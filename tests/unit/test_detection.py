@@ -72,6 +72,37 @@ class TestRunInference:
         assert mock_session.run.called
         assert output.shape == (1, 100, 85)
 
+    def test_requests_arena_shrinkage_periodically_on_gpu(self, monkeypatch):
+        """Should pass shrinkage RunOptions every ARENA_SHRINK_INTERVAL runs."""
+        from app.services import detection
+
+        monkeypatch.setattr(detection, "_inference_run_count", 0)
+        mock_session = Mock()
+        mock_session.get_inputs.return_value = [Mock(name="images")]
+        mock_session.get_providers.return_value = ["CUDAExecutionProvider"]
+        mock_session.run.return_value = [np.zeros((1, 100, 85))]
+        preprocessed = np.zeros((1, 3, 640, 640), dtype=np.float32)
+
+        for _ in range(detection.ARENA_SHRINK_INTERVAL):
+            run_inference(mock_session, preprocessed)
+
+        run_options = [call.args[2] for call in mock_session.run.call_args_list]
+        assert all(opts is None for opts in run_options[:-1])
+        assert run_options[-1] is not None
+
+    def test_uses_binding_when_provided(self):
+        """Should run through the IOBinding instead of session.run."""
+        mock_session = Mock()
+        mock_binding = Mock()
+        mock_binding.run.return_value = np.zeros((1, 84, 8400))
+
+        preprocessed = np.zeros((1, 3, 640, 640), dtype=np.float32)
+        output = run_inference(mock_session, preprocessed, binding=mock_binding)
+
+        assert not mock_session.run.called
+        mock_binding.run.assert_called_once()
+        assert output.shape == (1, 84, 8400)
+
 
 class TestParseDetections:
     """Tests for parse_detections() function."""
@@ -0,0 +1,125 @@
+"""
+Unit tests for frontend static file serving.
+
+Tests FrontendStaticFiles path lookup and containment.
+"""
+
+import pytest
+from unittest.mock import patch
+from starlette.applications import Starlette
+from starlette.testclient import TestClient
+
+from app.static_files import FrontendStaticFiles
+
+
+@pytest.fixture
+def static_dir(tmp_path):
+    """Frontend build directory with an index and one asset."""
+    (tmp_path / "index.html").write_text("<html>app</html>")
+    (tmp_path / "assets").mkdir()
+    (tmp_path / "assets" / "app.js").write_text("console.log('app')")
+    (tmp_path.parent / "secret.txt").write_text("secret")
+    return tmp_path
+
+
+@pytest.fixture
+def client(static_dir):
+    app = Starlette()
+    app.mount("/", FrontendStaticFiles(directory=str(static_dir), html=True))
+    return TestClient(app)
+
+
+class TestFrontendStaticFiles:
+    """Tests for FrontendStaticFiles."""
+
+    def test_serves_asset(self, client):
+        """Should serve files inside the static directory."""
+        response = client.get("/assets/app.js")
+
+        assert response.status_code == 200
+        assert response.text == "console.log('app')"
+
+    def test_serves_index_for_root(self, client):
+        """Should serve index.html for the root URL."""
+        response = client.get("/")
+
+        assert response.status_code == 200
+        assert "app" in response.text
+
+    def test_resolves_directory_once(self, static_dir):
+        """Should resolve the served directory at construction."""
+        files = FrontendStaticFiles(directory=str(static_dir))
+
+        full_path, stat_result = files.lookup_path("assets/app.js")
+
+        assert full_path == str((static_dir / "assets" / "app.js").resolve())
+        assert stat_result is not None
+
+    def test_rejects_traversal(self, static_dir):
+        """Should not resolve paths outside the static directory."""
+        files = FrontendStaticFiles(directory=str(static_dir))
+
+        assert files.lookup_path("../secret.txt") == ("", None)
+
+    def test_missing_file_returns_404(self, client):
+        """Should return 404 for unknown files."""
+        response = client.get("/missing.js")
+
+        assert response.status_code == 404
+
+    def test_reuses_lookup_within_ttl(self, static_dir):
+        """Should not stat an asset again while its lookup is cached."""
+        files = FrontendStaticFiles(directory=str(static_dir))
+        first = files.lookup_path("assets/app.js")
+
+        with patch("app.static_files.os.stat") as mock_stat:
+            second = files.lookup_path("assets/app.js")
+
+        mock_stat.assert_not_called()
+        assert second == first
+
+    def test_revalidates_after_ttl(self, static_dir):
+        """Should re-check disk once the cached lookup expires."""
+        files = FrontendStaticFiles(directory=str(static_dir))
+        files.lookup_path("assets/app.js")
+        (static_dir / "assets" / "app.js").unlink()
+
+        with patch("app.static_files.time.monotonic", return_value=float("inf")):
+            assert files.lookup_path("assets/app.js") == ("", None)
+
+    def test_serves_index_from_memory(self, client):
+        """Should serve index.html without reopening it."""
+        with patch("starlette.responses.anyio.open_file") as mock_open:
+            response = client.get("/")
+
+        mock_open.assert_not_called()
+        assert response.text == "<html>app</html>"
+        assert response.headers["content-type"].startswith("text/html")
+        assert response.headers["cache-control"] == "no-cache"
+        assert "etag" in response.headers
+
+    def test_index_not_modified(self, client):
+        """Should answer a matching If-None-Match with 304."""
+        etag = client.get("/").headers["etag"]
+
+        response = client.get("/", headers={"if-none-match": etag})
+
+        assert response.status_code == 304
+
+    def test_reloads_index_when_changed(self, client, static_dir):
+        """Should pick up a rebuilt index.html."""
+        client.get("/")
+        (static_dir / "index.html").write_text("<html>rebuilt app</html>")
+
+        with patch("app.static_files.time.monotonic", return_value=float("inf")):
+            response = client.get("/")
+
+        assert response.text == "<html>rebuilt app</html>"
+
+    def test_unknown_api_path_skips_lookup(self, client):
+        """Should 404 unmatched /api paths without touching the disk."""
+        with patch.object(FrontendStaticFiles, "lookup_path") as mock_lookup:
+            response = client.get("/api/does-not-exist")
+
+        mock_lookup.assert_not_called()
+        assert response.status_code == 404
@@ -0,0 +1,169 @@
+"""
+Unit tests for object tracking utilities.
+
+Tests Kalman filtering, IoU computation, and detection-to-track assignment.
+Feature: 006-motion-tracking
+"""
+
+import numpy as np
+import pytest
+from unittest.mock import Mock, patch
+
+from app.utils import tracking
+from app.utils.tracking import (
+    KalmanTracker,
+    hungarian_matching,
+    predict_trackers,
+    update_trackers,
+)
+
+
+class TestKalmanTracker:
+    """Tests for KalmanTracker."""
+
+    def test_update_moves_toward_measurement(self):
+        """Should pull the predicted box toward the measured box."""
+        tracker = KalmanTracker((100, 100, 50, 50))
+        tracker.predict()
+
+        tracker.update((110, 100, 50, 50))
+
+        x, y, w, h = tracker.get_bbox()
+        assert 100 < x <= 110
+        assert (y, w, h) == (100, 50, 50)
+
+    def test_covariance_stays_symmetric_positive_definite(self):
+        """Should keep P symmetric and positive definite over many updates."""
+        tracker = KalmanTracker((100, 100, 50, 50))
+
+        for step in range(500):
+            tracker.predict()
+            tracker.update((100 + step, 100, 50, 50))
+
+        covariance = tracker.covariance
+        assert covariance.dtype == np.float32
+        np.testing.assert_array_equal(covariance, covariance.T)
+        assert np.linalg.eigvalsh(covariance).min() > 0
+
+
+class TestBatchedKalman:
+    """Tests for predict_trackers() and update_trackers()."""
+
+    def test_matches_per_tracker_predict_and_update(self):
+        """Should produce the same states as calling each tracker in turn."""
+        boxes = [(100, 100, 50, 50), (300, 120, 40, 80), (20, 400, 60, 60)]
+        measurements = [(104, 101, 50, 52), (298, 125, 42, 78), (25, 396, 58, 61)]
+        single = [KalmanTracker(box) for box in boxes]
+        batched = [KalmanTracker(box) for box in boxes]
+
+        for _ in range(20):
+            for tracker, measurement in zip(single, measurements):
+                tracker.predict()
+                tracker.update(measurement)
+            predict_trackers(batched)
+            update_trackers(batched, measurements)
+
+        for one, many in zip(single, batched):
+            np.testing.assert_allclose(many.state, one.state, rtol=1e-5)
+            np.testing.assert_allclose(many.covariance, one.covariance, rtol=1e-5)
+
+    def test_empty_batch_is_noop(self):
+        """Should accept an empty tracker list."""
+        predict_trackers([])
+        update_trackers([], [])
+
+
+class TestHungarianMatching:
+    """Tests for hungarian_matching() function."""
+
+    def test_empty_matrix_returns_no_matches(self):
+        """Should return empty index arrays for an empty cost matrix."""
+        rows, cols = hungarian_matching(np.array([]))
+
+        assert len(rows) == 0
+        assert len(cols) == 0
+
+    def test_finds_minimum_cost_assignment(self):
+        """Should return the optimal assignment, not a greedy one."""
+        # Greedy row-by-row picks (0, 0) then is forced into (1, 1): cost 1.0 + 9.0.
+        # Optimal is (0, 1) + (1, 0): cost 2.0 + 2.0.
+        cost = np.array([
+            [1.0, 2.0],
+            [2.0, 9.0],
+        ])
+
+        rows, cols = hungarian_matching(cost)
+
+        assert cost[rows, cols].sum() == 4.0
+        assert dict(zip(rows, cols)) == {0: 1, 1: 0}
+
+    def test_handles_more_rows_than_columns(self):
+        """Should assign every column once when rows outnumber columns."""
+        cost = np.array([
+            [0.9, 0.1],
+            [0.2, 0.8],
+            [0.5, 0.5],
+        ], dtype=np.float32)
+
+        rows, cols = hungarian_matching(cost)
+
+        assert dict(zip(rows, cols)) == {0: 1, 1: 0}
+
+    def test_cost_limit_leaves_gated_pairs_unmatched(self):
+        """Should not match pairs costing more than cost_limit."""
+        cost = np.array([
+            [0.2, 0.95],
+            [0.99, 0.97],
+        ])
+
+        rows, cols = hungarian_matching(cost, cost_limit=0.7)
+
+        assert dict(zip(rows, cols)) == {0: 0}
+
+    def test_cost_limit_with_rectangular_matrix(self):
+        """Should gate pairs when detections and tracks differ in number."""
+        cost = np.array([
+            [0.9, 0.1, 0.8],
+            [0.95, 0.85, 0.99],
+        ])
+
+        rows, cols = hungarian_matching(cost, cost_limit=0.7)
+
+        assert dict(zip(rows, cols)) == {0: 1}
+
+
+class TestLapBackend:
+    """Tests for the optional lap.lapjv path of hungarian_matching()."""
+
+    COST = np.array([
+        [0.9, 0.1, 0.8],
+        [0.95, 0.85, 0.99],
+        [0.3, 0.6, 0.2],
+    ])
+
+    def test_decodes_lapjv_row_assignment(self):
+        """Should turn lapjv's (cost, x, y) result into matched index pairs."""
+        # Row 1 is gated out: lapjv marks it with -1 in x
+        x = np.array([1, -1, 2])
+        y = np.array([-1, 0, 2])
+        fake_lap = Mock()
+        fake_lap.lapjv.return_value = (0.3, x, y)
+
+        with patch.object(tracking, "lap", fake_lap):
+            rows, cols = hungarian_matching(self.COST, cost_limit=0.7)
+
+        assert fake_lap.lapjv.call_args.kwargs == {"extend_cost": True, "cost_limit": 0.7}
+        assert dict(zip(rows, cols)) == {0: 1, 2: 2}
+
+    def test_lapjv_matches_scipy_gating(self):
+        """Should give the same matches as the scipy fallback."""
+        lap = pytest.importorskip("lap")
+        rng = np.random.default_rng(0)
+
+        for shape in [(3, 3), (4, 2), (2, 5)]:
+            cost = rng.random(shape)
+            with patch.object(tracking, "lap", lap):
+                rows, cols = hungarian_matching(cost, cost_limit=0.5)
+            expected_rows, expected_cols = tracking._gated_assignment(cost, 0.5)
+
+            assert dict(zip(rows, cols)) == dict(zip(expected_rows, expected_cols))
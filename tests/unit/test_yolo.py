@@ -5,13 +5,16 @@ Tests model loading, ONNX export, session creation, and cache management.
 Feature: 005-yolo-object-detection
 """
 
+import io
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import Mock, patch, MagicMock, call
 from app.services.yolo import (
+    MODEL_DOWNLOAD_TIMEOUT,
     load_yolo_model,
     export_to_onnx,
     create_onnx_session,
+    create_session_with_binding,
     list_cached_models,
     delete_cached_model,
 )
@@ -28,17 +31,27 @@ class TestLoadYoloModel:
         result = load_yolo_model("yolo11n", str(tmp_path))
         assert result == model_path
 
-    @patch('app.services.yolo.YOLO')
-    def test_downloads_model_if_not_cached(self, mock_yolo, tmp_path):
-        """Should download model if not in cache."""
-        result = load_yolo_model("yolo11n", str(tmp_path))
-        assert mock_yolo.called
+    @patch('app.services.yolo.urllib.request.urlopen')
+    def test_downloads_model_if_not_cached(self, mock_urlopen, tmp_path):
+        """Should download model weights directly if not in cache."""
+        mock_urlopen.return_value = io.BytesIO(b"weights")
+
+        with patch('ultralytics.YOLO') as mock_yolo:
+            result = load_yolo_model("yolo11n", str(tmp_path))
+
+        assert mock_urlopen.call_args.args[0].endswith("/yolo11n.pt")
+        assert mock_urlopen.call_args.kwargs["timeout"] == MODEL_DOWNLOAD_TIMEOUT
+        assert not mock_yolo.called
+        assert result == tmp_path / "yolo11n.pt"
+        assert result.read_bytes() == b"weights"
 
-    def test_raises_runtime_error_on_download_failure(self, tmp_path):
+    @patch('app.services.yolo.urllib.request.urlopen', side_effect=OSError("Network error"))
+    def test_raises_runtime_error_on_download_failure(self, mock_urlopen, tmp_path):
         """Should raise RuntimeError if download fails."""
-        with patch('app.services.yolo.YOLO', side_effect=Exception("Network error")):
+        with patch('ultralytics.YOLO', side_effect=Exception("Network error")):
             with pytest.raises(RuntimeError, match="Failed to download"):
                 load_yolo_model("yolo11n", str(tmp_path))
+        assert not (tmp_path / "yolo11n.pt.part").exists()
 
 
 class TestExportToOnnx:
@@ -57,7 +70,7 @@ class TestExportToOnnx:
         with pytest.raises(RuntimeError, match="PyTorch model not found"):
             export_to_onnx("yolo11n", 640, str(tmp_path))
 
-    @patch('app.services.yolo.YOLO')
+    @patch('ultralytics.YOLO')
     def test_exports_with_correct_parameters(self, mock_yolo, tmp_path):
         """Should call export with correct format and size."""
         pt_path = tmp_path / "yolo11n.pt"
@@ -74,9 +87,38 @@ class TestExportToOnnx:
             format="onnx",
             imgsz=640,
             simplify=True,
-            dynamic=False
+            dynamic=False,
+            half=False
         )
 
+    def test_returns_cached_fp16_onnx_with_precision_suffix(self, tmp_path):
+        """Should cache non-fp32 exports under a precision-suffixed name."""
+        onnx_path = tmp_path / "yolo11n_640_fp16.onnx"
+        onnx_path.touch()
+
+        result = export_to_onnx("yolo11n", 640, str(tmp_path), precision="fp16")
+        assert result == onnx_path
+
+    def test_rejects_int8_precision(self, tmp_path):
+        """Should reject INT8 export, which needs calibration data."""
+        with pytest.raises(ValueError, match="INT8"):
+            export_to_onnx("yolo11n", 640, str(tmp_path), precision="int8")
+
+    def test_moves_export_across_devices_with_copy(self, tmp_path):
+        """Should fall back to copy + remove when rename crosses devices."""
+        import errno
+        from app.services.yolo import _move_model_file
+
+        src = tmp_path / "export.onnx"
+        src.write_bytes(b"onnx")
+        dst = tmp_path / "yolo11n_640.onnx"
+
+        with patch('app.services.yolo.os.replace', side_effect=OSError(errno.EXDEV, "cross-device")):
+            _move_model_file(src, dst)
+
+        assert dst.read_bytes() == b"onnx"
+        assert not src.exists()
+
 
 class TestCreateOnnxSession:
     """Tests for create_onnx_session() function."""
@@ -114,6 +156,124 @@ class TestCreateOnnxSession:
         with pytest.raises(RuntimeError, match="GPU backend .* unavailable"):
             create_onnx_session("/path/model.onnx", "nvidia", fail_fast=True)
 
+    @patch('app.services.yolo.ort.InferenceSession')
+    @patch('app.services.yolo.Path')
+    def test_uses_heuristic_cudnn_search_by_default(self, mock_path, mock_session):
+        """Should avoid EXHAUSTIVE cuDNN benchmarking unless requested."""
+        mock_path.return_value.exists.return_value = True
+        mock_session.return_value.get_providers.return_value = ['CUDAExecutionProvider']
+
+        create_onnx_session("/path/model.onnx", "nvidia", fail_fast=False)
+
+        providers = dict(p for p in mock_session.call_args.kwargs['providers'] if isinstance(p, tuple))
+        cuda_options = providers['CUDAExecutionProvider']
+        assert cuda_options['cudnn_conv_algo_search'] == 'HEURISTIC'
+
+    @patch('app.services.yolo.ort.InferenceSession')
+    @patch('app.services.yolo.Path')
+    def test_enables_cuda_graph_and_defers_warmup_when_requested(self, mock_path, mock_session):
+        """Should request CUDA graph capture and leave warmup to the binding."""
+        mock_path.return_value.exists.return_value = True
+        mock_session.return_value.get_providers.return_value = ['CUDAExecutionProvider']
+
+        create_onnx_session("/path/model.onnx", "nvidia", fail_fast=False, enable_cuda_graph=True)
+
+        providers = dict(p for p in mock_session.call_args.kwargs['providers'] if isinstance(p, tuple))
+        assert providers['CUDAExecutionProvider']['enable_cuda_graph'] == '1'
+        assert 'TensorrtExecutionProvider' not in providers
+        assert not mock_session.return_value.run.called
+
+    @patch('app.services.yolo.ort.get_available_providers')
+    @patch('app.services.yolo.ort.InferenceSession')
+    @patch('app.services.yolo.Path')
+    def test_prefers_tensorrt_with_engine_cache_when_available(self, mock_path, mock_session, mock_available):
+        """Should put TensorRT ahead of CUDA with a cache dir next to the model."""
+        mock_path.return_value.exists.return_value = True
+        mock_path.return_value.parent = Path("/models")
+        mock_available.return_value = [
+            'TensorrtExecutionProvider', 'CUDAExecutionProvider', 'CPUExecutionProvider'
+        ]
+        mock_session.return_value.get_providers.return_value = ['TensorrtExecutionProvider']
+
+        create_onnx_session("/models/model.onnx", "nvidia", fail_fast=False)
+
+        providers = mock_session.call_args.kwargs['providers']
+        assert [p if isinstance(p, str) else p[0] for p in providers] == [
+            'TensorrtExecutionProvider', 'CUDAExecutionProvider', 'CPUExecutionProvider'
+        ]
+        trt_options = providers[0][1]
+        assert trt_options['trt_engine_cache_enable'] is True
+        assert trt_options['trt_engine_cache_path'] == str(Path("/models/trt_cache"))
+
+    @patch('app.services.yolo.ort.InferenceSession')
+    @patch('app.services.yolo.Path')
+    def test_warms_up_session_with_zero_input(self, mock_path, mock_session):
+        """Should run one inference with a zero tensor before returning."""
+        mock_path.return_value.exists.return_value = True
+        model_input = Mock()
+        model_input.name = "images"
+        model_input.shape = [1, 3, 640, 640]
+        model_input.type = "tensor(float)"
+        session = MagicMock()
+        session.get_providers.return_value = ['CPUExecutionProvider']
+        session.get_inputs.return_value = [model_input]
+        mock_session.return_value = session
+
+        create_onnx_session("/path/model.onnx", "none")
+
+        feeds = session.run.call_args.args[1]
+        assert feeds["images"].shape == (1, 3, 640, 640)
+        assert not feeds["images"].any()
+
+
+class TestCreateSessionWithBinding:
+    """Tests for create_session_with_binding() function."""
+
+    @patch('app.services.yolo.InferenceBinding')
+    @patch('app.services.yolo.create_onnx_session')
+    def test_recreates_session_without_cuda_graph_if_capture_fails(self, mock_create, mock_binding):
+        """Should fall back to a warmed-up non-graph session if capture fails."""
+        graph_session = MagicMock()
+        graph_session.get_providers.return_value = ['CUDAExecutionProvider']
+        graph_session.get_provider_options.return_value = {
+            'CUDAExecutionProvider': {'enable_cuda_graph': '1'}
+        }
+        graph_session.get_inputs.return_value[0].shape = [1, 3, 640, 640]
+        graph_session.get_outputs.return_value[0].shape = [1, 84, 8400]
+        plain_session = MagicMock()
+        plain_session.get_provider_options.return_value = {'CUDAExecutionProvider': {}}
+        mock_create.side_effect = [graph_session, plain_session]
+        fallback_binding = Mock()
+        mock_binding.side_effect = [RuntimeError("capture failed"), fallback_binding]
+
+        session, binding = create_session_with_binding(
+            "/path/model.onnx", "nvidia", fail_fast=False, enable_cuda_graph=True
+        )
+
+        assert session is plain_session
+        assert binding is fallback_binding
+        assert mock_create.call_args_list == [
+            call("/path/model.onnx", "nvidia", False, "HEURISTIC", True),
+            call("/path/model.onnx", "nvidia", False, "HEURISTIC"),
+        ]
+
+    @patch('app.services.yolo.InferenceBinding', side_effect=RuntimeError("no binding"))
+    @patch('app.services.yolo.create_onnx_session')
+    def test_keeps_plain_session_if_binding_fails(self, mock_create, mock_binding):
+        """Should not recreate a session that never used a CUDA graph."""
+        session = MagicMock()
+        session.get_providers.return_value = ['CPUExecutionProvider']
+        session.get_provider_options.return_value = {'CPUExecutionProvider': {}}
+        session.get_inputs.return_value[0].shape = [1, 3, 640, 640]
+        session.get_outputs.return_value[0].shape = [1, 84, 8400]
+        mock_create.return_value = session
+
+        result, binding = create_session_with_binding("/path/model.onnx", "none")
+
+        assert result is session
+        assert binding is None
+        assert mock_create.call_count == 1
+
 
 class TestListCachedModels:
     """Tests for list_cached_models() function."""
@@ -146,6 +306,15 @@ class TestListCachedModels:
         assert result[0]['file_size_bytes'] == 1000
         assert isinstance(result[0]['download_date'], (int, float))
 
+    def test_skips_optimized_graph_sidecars(self, tmp_path):
+        """Should not list serialized optimized graphs as models."""
+        (tmp_path / "yolo11n_640.onnx").touch()
+        (tmp_path / "yolo11n_640.nvidia.opt.onnx").touch()
+
+        result = list_cached_models(str(tmp_path))
+
+        assert [m['model_name'] for m in result] == ["yolo11n_640"]
+
 
 class TestDeleteCachedModel:
     """Tests for delete_cached_model() function."""
@@ -0,0 +1,102 @@
+"""
+Unit tests for ZonesService config reads and writes.
+
+Tests zone listing and that zone and stream writes don't overwrite each other.
+"""
+
+import asyncio
+import copy
+import time
+
+import pytest
+from unittest.mock import patch
+from pydantic import ValidationError
+
+from app.models.zone import NewZone
+from app.services.streams_service import StreamsService
+from app.services.zones_service import ZonesService
+
+
+@pytest.fixture
+def config_store():
+    """In-memory config.yml shared by both services (slow saves)."""
+    store = {"streams": [{
+        "id": "s1",
+        "name": "Cam",
+        "rtsp_url": "rtsp://camera/stream",
+        "status": "stopped",
+        "zones": [],
+    }]}
+
+    def load_streams():
+        return copy.deepcopy(store)
+
+    def save_streams(config):
+        time.sleep(0.005)  # Widen the window for interleaving
+        store.clear()
+        store.update(copy.deepcopy(config))
+        return config
+
+    lock = asyncio.Lock()
+    with patch("app.services.zones_service.load_streams", load_streams), \
+         patch("app.services.zones_service.save_streams", save_streams), \
+         patch("app.services.zones_service.get_config_stamp", return_value=None), \
+         patch("app.services.zones_service.config_update_lock", lock), \
+         patch("app.services.streams_service.load_streams", load_streams), \
+         patch("app.services.streams_service.save_streams", save_streams), \
+         patch("app.services.streams_service.config_update_lock", lock):
+        yield store
+
+
+def _zone(name):
+    return NewZone(name=name, coordinates=[[0.1, 0.1], [0.9, 0.1], [0.5, 0.9]])
+
+
+class TestZoneWrites:
+    """Tests for ZonesService mutations."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stream_update_is_not_lost(self, config_store):
+        """Should keep a stream rename made while zone writes are pending."""
+        zones = ZonesService()
+        streams = StreamsService()
+
+        async def rename():
+            await asyncio.sleep(0.002)  # Land inside the zone write batch
+            return await streams.update_stream("s1", name="Renamed")
+
+        await asyncio.gather(
+            zones.create_zone("s1", _zone("Entry")),
+            rename(),
+            zones.create_zone("s1", _zone("Exit")),
+        )
+
+        stream = config_store["streams"][0]
+        assert stream["name"] == "Renamed"
+        assert sorted(zone["name"] for zone in stream["zones"]) == ["Entry", "Exit"]
+
+    @pytest.mark.asyncio
+    async def test_failed_mutation_releases_config_lock(self, config_store):
+        """Should let other writers in when a zone mutation stages nothing."""
+        zones = ZonesService()
+        await zones.create_zone("s1", _zone("Entry"))
+
+        with pytest.raises(ValueError):
+            await zones.create_zone("s1", _zone("entry"))
+
+        renamed = await asyncio.wait_for(
+            StreamsService().update_stream("s1", name="Renamed"), timeout=1.0
+        )
+        assert renamed["name"] == "Renamed"
+
+
+class TestListZonesJson:
+    """Tests for ZonesService.list_zones_json()."""
+
+    @pytest.mark.asyncio
+    async def test_malformed_zone_is_not_hidden(self, config_store):
+        """Should raise instead of serving an empty list for a bad stored zone."""
+        config_store["streams"][0]["zones"] = [{"id": "z1", "name": "Broken"}]
+
+        with pytest.raises(ValidationError):
+            await ZonesService().list_zones_json("s1")